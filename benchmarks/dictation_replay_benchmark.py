@@ -0,0 +1,397 @@
+"""
+End-to-end dictation latency benchmark: replays WAV recordings through the real websocket protocol
+and the real typist diff logic.
+
+Starts a local TranscriptionServer (or uses a running one with --host/--port), then for each WAV file
+resumes a kept-alive ServerSession, streams the file at real-time (or accelerated) pace and feeds the
+segment callbacks into GNOMELiveTypist.on_transcription. The virtual keyboard and the clipboard are
+replaced by a recording text field, so nothing is typed on the desktop.
+
+Per file it reports time-to-first-segment and time-to-first-text, time-to-finalization per segment
+(from the moment the segment's audio ended to the moment it was sent as completed), backspaces
+versus characters pasted or typed (rewrite churn) and server CPU time per second of audio.
+
+Run it from the WhisperLive virtual environment:
+
+    python benchmarks/dictation_replay_benchmark.py recordings/ --speed 2 --output run.json
+    python benchmarks/dictation_replay_benchmark.py recordings/ --speed 2 --compare run.json
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import wave
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+import gnome_dictation_client as dictation  # noqa: E402
+
+RATE = 16000
+
+
+class VirtualTextField:
+    """
+    Stands in for both the evdev ``UInput`` device and ``pyperclip``, and applies what the typist
+    does (backspaces, Ctrl+V of the clipboard, directly typed keys) to an in-memory text field.
+    """
+    CHARS = {key: char for char, key in dictation.ASCII_KEYS.items()}
+
+    def __init__(self):
+        self.clipboard = ""
+        self.reset()
+
+    def reset(self):
+        self.text = ""
+        self.held = set()
+        self.backspaces = 0
+        self.pastes = 0
+        self.chars_pasted = 0
+        self.chars_typed = 0
+        self.first_input_at = None
+
+    # UInput(cap, name=...) returns the device itself.
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def copy(self, text):
+        self.clipboard = text
+
+    def paste(self):
+        return self.clipboard
+
+    def write(self, event_type, code, value):
+        if value == 0:
+            self.held.discard(code)
+            return
+        self.held.add(code)
+        if code == dictation.e.KEY_BACKSPACE:
+            self.text = self.text[:-1]
+            self.backspaces += 1
+        elif code == dictation.e.KEY_V and dictation.e.KEY_LEFTCTRL in self.held:
+            self.text += self.clipboard
+            self.pastes += 1
+            self.chars_pasted += len(self.clipboard)
+        elif (code, dictation.e.KEY_LEFTSHIFT in self.held) in self.CHARS:
+            self.text += self.CHARS[(code, dictation.e.KEY_LEFTSHIFT in self.held)]
+            self.chars_typed += 1
+        else:
+            return
+        if self.first_input_at is None:
+            self.first_input_at = time.monotonic()
+
+    def syn(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class ReplaySession(dictation.ServerSession):
+    """ServerSession that streams a WAV file at a given pace instead of the microphone."""
+
+    def __init__(self, host, port, lang, model, transcription_callback, speed):
+        super().__init__(host, port, lang, model, transcription_callback)
+        self.speed = speed
+        self.pcm = None
+        self.stream_started = None
+        self.stream_finished = threading.Event()
+
+    def _stream_microphone(self):
+        self.stream_started = time.monotonic()
+        try:
+            for start in range(0, len(self.pcm), self.CHUNK):
+                if not self.streaming:
+                    break
+                chunk = self.pcm[start:start + self.CHUNK]
+                if self.speed > 0:
+                    # A microphone delivers a chunk once its last sample has been captured.
+                    delay = self.stream_started + (start + len(chunk)) / self.RATE / self.speed - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                if self.audio_encoding == "int16":
+                    data = chunk.tobytes()
+                else:
+                    data = (chunk.astype(np.float32) / 32768.0).tobytes()
+                self._send(data, binary=True)
+        finally:
+            self.stream_finished.set()
+
+
+class CallbackRecorder:
+    """Wraps the typist callback and timestamps every transcript update."""
+
+    def __init__(self, typist):
+        self.typist = typist
+        self.reset()
+
+    def reset(self):
+        self.updates = 0
+        self.last_update_at = None
+        self.first_segment_at = None
+        self.completed_at = {}
+        self.segments = []
+
+    def __call__(self, segments):
+        now = time.monotonic()
+        self.updates += 1
+        self.last_update_at = now
+        if self.first_segment_at is None and any(seg["text"].strip() for seg in segments):
+            self.first_segment_at = now
+        for i, seg in enumerate(segments):
+            if seg.get("completed", False) and seg.get("id", i) not in self.completed_at:
+                self.completed_at[seg.get("id", i)] = (now, float(seg["end"]))
+        self.segments = [dict(seg) for seg in segments]
+        self.typist.on_transcription(segments)
+
+
+def read_wav(path):
+    """Reads a WAV file as mono 16 kHz int16 samples."""
+    with wave.open(path, "rb") as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM WAV files are supported")
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+    if channels > 1:
+        pcm = pcm.reshape(-1, channels).mean(axis=1)
+    if rate != RATE:
+        positions = np.arange(0, len(pcm), rate / RATE)
+        pcm = np.interp(positions, np.arange(len(pcm)), pcm)
+    return np.ascontiguousarray(pcm, dtype=np.int16)
+
+
+def process_cpu_seconds(pid):
+    """User + system CPU time of a process, from /proc (Linux)."""
+    if pid is None:
+        return None
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def serve(port, backend, model, server_options):
+    from whisper_live.server import TranscriptionServer
+
+    TranscriptionServer().run(
+        "127.0.0.1",
+        port=port,
+        backend=backend,
+        faster_whisper_custom_model_path=model,
+        single_model=True,
+        **server_options,
+    )
+
+
+def wait_until_ready(host, port, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            ws = dictation.websocket.create_connection(f"ws://{host}:{port}", timeout=5)
+            try:
+                ws.send(json.dumps({"query": "status"}))
+                if json.loads(ws.recv()).get("ready"):
+                    return
+            finally:
+                ws.close()
+        except Exception:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server on {host}:{port} did not become ready within {timeout:.0f}s")
+
+
+def percentiles(values):
+    if not values:
+        return {"count": 0, "mean": None, "p50": None, "p95": None, "max": None}
+    values = np.array(values)
+    return {
+        "count": int(len(values)),
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "max": float(values.max()),
+    }
+
+
+def replay(path, session, recorder, field, typist, server_pid, settle, timeout):
+    pcm = read_wav(path)
+    audio_seconds = len(pcm) / RATE
+
+    # Same per-utterance reset as DictationManager.start_recording
+    typist.reset()
+    field.reset()
+    recorder.reset()
+    session.pcm = pcm
+    session.stream_finished.clear()
+
+    cpu_before = process_cpu_seconds(server_pid)
+    session.resume()
+    session.stream_finished.wait()
+    # Let the server catch up until the transcript has been quiet for `settle` seconds.
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        quiet_since = max(session.stream_started, recorder.last_update_at or 0)
+        if time.monotonic() - quiet_since >= settle:
+            break
+        time.sleep(0.05)
+    cpu_after = process_cpu_seconds(server_pid)
+    session.pause()
+    # Corrections are typed by the typist's output thread; let it catch up before reading the field.
+    typist.wait_idle(timeout)
+
+    started = session.stream_started
+    finalization = [
+        at - (started + end / session.speed if session.speed > 0 else started)
+        for at, end in recorder.completed_at.values()
+    ]
+    server_cpu = None if cpu_before is None else cpu_after - cpu_before
+    return {
+        "file": os.path.basename(path),
+        "audio_seconds": audio_seconds,
+        "time_to_first_segment_s": None if recorder.first_segment_at is None else recorder.first_segment_at - started,
+        "time_to_first_text_s": None if field.first_input_at is None else field.first_input_at - started,
+        "finalization_latency_s": percentiles(finalization),
+        "segments": len(recorder.segments),
+        "unfinalized_segments": sum(1 for seg in recorder.segments if not seg.get("completed", False)),
+        "transcript_updates": recorder.updates,
+        "backspaces": field.backspaces,
+        "pastes": field.pastes,
+        "chars_pasted": field.chars_pasted,
+        "chars_typed": field.chars_typed,
+        "churn_ratio": (field.backspaces / (field.chars_pasted + field.chars_typed)
+                        if field.chars_pasted + field.chars_typed else 0.0),
+        "server_cpu_seconds": server_cpu,
+        "server_cpu_per_audio_second": None if server_cpu is None else server_cpu / audio_seconds,
+        "final_text": field.text,
+    }
+
+
+def summarize(files):
+    def mean(key):
+        values = [f[key] for f in files if f[key] is not None]
+        return float(np.mean(values)) if values else None
+
+    finalized = [f["finalization_latency_s"] for f in files if f["finalization_latency_s"]["count"]]
+    backspaces = sum(f["backspaces"] for f in files)
+    chars_pasted = sum(f["chars_pasted"] for f in files)
+    chars_typed = sum(f.get("chars_typed", 0) for f in files)
+    audio_seconds = sum(f["audio_seconds"] for f in files)
+    cpu = [f["server_cpu_seconds"] for f in files if f["server_cpu_seconds"] is not None]
+    return {
+        "files": len(files),
+        "audio_seconds": audio_seconds,
+        "mean_time_to_first_segment_s": mean("time_to_first_segment_s"),
+        "mean_time_to_first_text_s": mean("time_to_first_text_s"),
+        "mean_finalization_latency_s": (
+            sum(f["mean"] * f["count"] for f in finalized) / sum(f["count"] for f in finalized) if finalized else None
+        ),
+        "max_finalization_latency_s": max((f["max"] for f in finalized), default=None),
+        "unfinalized_segments": sum(f["unfinalized_segments"] for f in files),
+        "backspaces": backspaces,
+        "chars_pasted": chars_pasted,
+        "chars_typed": chars_typed,
+        "churn_ratio": backspaces / (chars_pasted + chars_typed) if chars_pasted + chars_typed else 0.0,
+        "server_cpu_per_audio_second": sum(cpu) / audio_seconds if cpu and audio_seconds else None,
+    }
+
+
+def compare(baseline, current):
+    print(f"{'metric':32} {'baseline':>12} {'current':>12} {'change':>9}")
+    for key, value in current.items():
+        before = baseline.get(key)
+        if not isinstance(value, (int, float)) or not isinstance(before, (int, float)):
+            continue
+        change = f"{(value - before) / before * 100:+8.1f}%" if before else f"{'n/a':>9}"
+        print(f"{key:32} {before:12.3f} {value:12.3f} {change}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('wav_dir', help='Directory of WAV recordings (16-bit PCM; resampled to 16 kHz mono).')
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help='Replay pace relative to real time; 0 streams as fast as possible.')
+    parser.add_argument('--host', default=None, help='Use a running server instead of starting one.')
+    parser.add_argument('--port', type=int, default=9199, help='Server port.')
+    parser.add_argument('--backend', default='faster_whisper', help='Backend of the local server.')
+    parser.add_argument('--model', default='turbo', help='Model of the local server.')
+    parser.add_argument('--server_options', default='{}',
+                        help='JSON of extra TranscriptionServer.run() arguments, e.g. \'{"batch_inference": true}\'.')
+    parser.add_argument('--lang', default='ru', help='Transcription language.')
+    parser.add_argument('--settle', type=float, default=3.0,
+                        help='Seconds without transcript updates after the audio ended before a file is done.')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Maximum seconds to wait after the audio ended.')
+    parser.add_argument('--ready_timeout', type=float, default=600.0, help='Maximum seconds to wait for the server.')
+    parser.add_argument('--output', default=None, help='Write the results as JSON to this file.')
+    parser.add_argument('--json', action='store_true', help='Print machine-readable results.')
+    parser.add_argument('--compare', default=None, help='JSON results of an earlier run to compare against.')
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.wav_dir, "*.wav")))
+    if not paths:
+        parser.error(f"No .wav files in {args.wav_dir}")
+
+    # Keep stdout for the results; the typist's and session's logging goes to stderr.
+    out = sys.stdout
+    sys.stdout = sys.stderr
+
+    server = None
+    host = args.host or "127.0.0.1"
+    if args.host is None:
+        server = multiprocessing.get_context("spawn").Process(
+            target=serve, args=(args.port, args.backend, args.model, json.loads(args.server_options)), daemon=True
+        )
+        server.start()
+    field = VirtualTextField()
+    dictation.UInput = field
+    dictation.pyperclip = field
+    # Never touch the desktop clipboard: the fallback clipboard goes through the patched pyperclip.
+    typist = dictation.GNOMELiveTypist(clipboard=dictation.PyperclipClipboard())
+    recorder = CallbackRecorder(typist)
+    session = ReplaySession(host, args.port, args.lang, args.model, recorder, args.speed)
+    try:
+        wait_until_ready(host, args.port, args.ready_timeout)
+        session.start()
+        files = []
+        for path in paths:
+            print(f"[INFO]: Replaying {path}")
+            files.append(replay(path, session, recorder, field, typist, server.pid if server else None,
+                                args.settle, args.timeout))
+    finally:
+        session.close()
+        if server is not None:
+            server.terminate()
+            server.join(timeout=5)
+
+    results = {
+        "config": {
+            "speed": args.speed,
+            "backend": args.backend,
+            "model": args.model,
+            "lang": args.lang,
+            "server_options": json.loads(args.server_options),
+            "external_server": args.host is not None,
+        },
+        "summary": summarize(files),
+        "files": files,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    sys.stdout = out
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f)["summary"], results["summary"])
+    elif args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        for name, value in results["summary"].items():
+            print(f"{name:32} {value}")
+
+
+if __name__ == "__main__":
+    main()
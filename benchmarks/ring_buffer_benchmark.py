@@ -0,0 +1,131 @@
+"""
+Micro-benchmark of per-session audio ingestion: the upstream concatenate-and-trim buffer of
+ServeClientBase.add_frames against the preallocated ring buffer (whisper_live/audio_buffer.py).
+
+Simulates one session receiving fixed-size frames for the given duration and reports the per-frame
+cost, how often the buffer was reallocated, how many bytes were copied and the peak traced memory.
+
+    python benchmarks/ring_buffer_benchmark.py --minutes 60 --frame 4096
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "patches", "whisper_live"))
+from audio_buffer import RingBufferMixin  # noqa: E402
+
+RATE = 16000
+
+
+class ConcatBuffer:
+    """Copy of the buffering logic in ServeClientBase.add_frames."""
+    RATE = RATE
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.frames_np = None
+        self.frames_offset = 0.0
+        self.timestamp_offset = 0.0
+        self.copied_bytes = 0
+
+    def add_frames(self, frame_np):
+        self.lock.acquire()
+        if self.frames_np is not None and self.frames_np.shape[0] > 45*self.RATE:
+            self.frames_offset += 30.0
+            self.frames_np = self.frames_np[int(30*self.RATE):]
+            if self.timestamp_offset < self.frames_offset:
+                self.timestamp_offset = self.frames_offset
+        if self.frames_np is None:
+            self.frames_np = frame_np.copy()
+        else:
+            self.frames_np = np.concatenate((self.frames_np, frame_np), axis=0)
+        self.copied_bytes += self.frames_np.nbytes
+        self.lock.release()
+
+
+class RingBuffer(RingBufferMixin):
+    RATE = RATE
+
+    def __init__(self):
+        self.frames_np = None
+        self.frames_offset = 0.0
+        self.timestamp_offset = 0.0
+        self.lock = threading.Lock()
+        self.copied_bytes = 0
+
+    def add_frames(self, frame_np):
+        super().add_frames(frame_np)
+        # Each sample is written to both halves of the ring.
+        self.copied_bytes += 2 * frame_np.nbytes
+
+
+def run(buffer, frames, frame_size):
+    frame = np.random.default_rng(0).standard_normal(frame_size).astype(np.float32)
+    timings = np.empty(frames, dtype=np.float64)
+    reallocations = 0
+    owner = None
+
+    tracemalloc.start()
+    for i in range(frames):
+        started = time.perf_counter()
+        buffer.add_frames(frame)
+        timings[i] = time.perf_counter() - started
+
+        # Count a reallocation whenever the buffer no longer lives in the same memory block.
+        base = buffer.frames_np
+        while base.base is not None:
+            base = base.base
+        if base is not owner:
+            reallocations += 1
+            owner = base
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    preallocated = buffer.ring_buffer.storage.nbytes if isinstance(buffer, RingBuffer) else 0
+    return {
+        "frames": frames,
+        "mean_us_per_frame": float(timings.mean() * 1e6),
+        "p99_us_per_frame": float(np.percentile(timings, 99) * 1e6),
+        "total_seconds": float(timings.sum()),
+        "buffer_reallocations": reallocations,
+        "copied_megabytes": buffer.copied_bytes / 2**20,
+        "peak_traced_megabytes": peak / 2**20,
+        "preallocated_megabytes": preallocated / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--minutes', type=float, default=60.0, help='Simulated session length.')
+    parser.add_argument('--frame', type=int, default=4096, help='Samples per received frame.')
+    parser.add_argument('--json', action='store_true', help='Print machine-readable results.')
+    args = parser.parse_args()
+
+    frames = int(args.minutes * 60 * RATE / args.frame)
+    results = {
+        "session_minutes": args.minutes,
+        "frame_samples": args.frame,
+        "concat": run(ConcatBuffer(), frames, args.frame),
+        "ring": run(RingBuffer(), frames, args.frame),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{frames} frames of {args.frame} samples ({args.minutes:g} min session)")
+    print(f"{'':8} {'us/frame':>10} {'p99 us':>10} {'reallocs':>10} {'copied MB':>10} {'peak MB':>10} {'prealloc MB':>12}")
+    for name in ("concat", "ring"):
+        r = results[name]
+        print(f"{name:8} {r['mean_us_per_frame']:10.1f} {r['p99_us_per_frame']:10.1f} "
+              f"{r['buffer_reallocations']:10d} {r['copied_megabytes']:10.0f} {r['peak_traced_megabytes']:10.1f} "
+              f"{r['preallocated_megabytes']:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,11 @@ fi
 echo "🛠 Applying custom patches..."
 cp patches/run_server.py WhisperLive/
 cp patches/setup.py WhisperLive/
-cp patches/whisper_live/server.py WhisperLive/whisper_live/server.py
+cp patches/whisper_live/*.py WhisperLive/whisper_live/
+cp -r patches/whisper_live/hallucinations WhisperLive/whisper_live/
 cp scripts/gnome_dictation_client.py WhisperLive/
 cp scripts/toggle_dictation.sh WhisperLive/
+cp scripts/dictation_ctl.py WhisperLive/
 
 # 3. Create virtual environment and install dependencies
 cd WhisperLive
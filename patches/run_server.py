@@ -47,6 +47,89 @@ if __name__ == "__main__":
                         type=str,
                         default="~/.cache/whisper-live/",
                         help='Path to cache the converted ctranslate2 models.')
+    parser.add_argument('--asyncio',
+                        action='store_true',
+                        help='Serve all connections from one asyncio event loop and run inference on an executor '
+                             'instead of using one thread per connection.')
+    parser.add_argument('--batch_inference',
+                        action='store_true',
+                        help='Decode the pending audio of all active sessions together in micro-batches '
+                             '(faster_whisper only).')
+    parser.add_argument('--batch_max_size',
+                        type=int,
+                        default=8,
+                        help='Maximum number of audio windows decoded in one batch.')
+    parser.add_argument('--batch_window_ms',
+                        type=int,
+                        default=50,
+                        help='Maximum time in milliseconds to wait for a batch to fill.')
+    parser.add_argument('--no_ring_buffer',
+                        action='store_true',
+                        help='Grow each session\'s audio buffer by concatenation instead of using a preallocated ring buffer.')
+    parser.add_argument('--server_vad',
+                        action='store_true',
+                        help='Drop silent frames on the server for every backend (not only TensorRT).')
+    parser.add_argument('--batch_vad',
+                        action='store_true',
+                        help='Evaluate VAD for all sessions with one batched model call per tick.')
+    parser.add_argument('--metrics_port',
+                        type=int,
+                        default=None,
+                        help='Serve Prometheus metrics over HTTP on this port (disabled by default).')
+    parser.add_argument('--max_queue',
+                        type=int,
+                        default=16,
+                        help='Maximum number of clients waiting for a free slot before new ones get a WAIT rejection.')
+    parser.add_argument('--adaptive_capacity',
+                        action='store_true',
+                        help='Admit clients based on the measured model load, with --max_clients as upper bound.')
+    parser.add_argument('--target_utilization',
+                        type=float,
+                        default=0.8,
+                        help='Share of time the model may be busy before clients are queued (--adaptive_capacity).')
+    parser.add_argument('--workers',
+                        type=int,
+                        default=0,
+                        help='Run faster_whisper inference in N worker processes, each with its own model replica '
+                             'using --omp_num_threads threads (for CPU servers). Disabled by default.')
+    parser.add_argument('--no_hallucination_filter',
+                        action='store_true',
+                        help='Send segments matching known hallucination phrases instead of dropping them.')
+    parser.add_argument('--hallucination_dir',
+                        type=str,
+                        default=None,
+                        help='Directory of <language>.txt hallucination phrase files (defaults to the bundled ones).')
+    parser.add_argument('--draft_model',
+                        type=str,
+                        default=None,
+                        help='Small faster_whisper model (e.g. "tiny" or "base") for partial hypotheses; '
+                             'the main model only decodes segments about to be completed. Disabled by default.')
+    parser.add_argument('--no_feature_cache',
+                        action='store_true',
+                        help='Recompute the mel spectrogram and encoder output of the whole window on every re-decode.')
+    parser.add_argument('--translation_batch_size',
+                        type=int,
+                        default=16,
+                        help='Maximum number of segments the shared translation model translates together.')
+    parser.add_argument('--translation_window_ms',
+                        type=int,
+                        default=100,
+                        help='Maximum time in milliseconds to wait for a translation batch to fill.')
+    parser.add_argument('--model_memory_mb',
+                        type=float,
+                        default=None,
+                        help='Load the model each client asks for on demand and share it between sessions, '
+                             'unloading idle models to stay within this many MB. Disabled by default.')
+    parser.add_argument('--admin_token',
+                        type=str,
+                        default=os.environ.get("WHISPER_ADMIN_TOKEN"),
+                        help='Accept {"query": "reload"} messages carrying this token (defaults to '
+                             '$WHISPER_ADMIN_TOKEN). SIGHUP reloads the current model without one.')
+    parser.add_argument('--resume_grace',
+                        type=float,
+                        default=30,
+                        help='Seconds the session of a client whose connection dropped is kept for it to '
+                             'reconnect and resume. 0 disables session resume.')
     args = parser.parse_args()
 
     if args.backend == "tensorrt":
@@ -69,5 +152,26 @@ if __name__ == "__main__":
         single_model=not args.no_single_model,
         max_clients=args.max_clients,
         max_connection_time=args.max_connection_time,
-        cache_path=args.cache_path
+        cache_path=args.cache_path,
+        use_asyncio=args.asyncio,
+        batch_inference=args.batch_inference,
+        batch_max_size=args.batch_max_size,
+        batch_window_ms=args.batch_window_ms,
+        ring_buffer=not args.no_ring_buffer,
+        server_vad=args.server_vad,
+        batch_vad=args.batch_vad,
+        metrics_port=args.metrics_port,
+        max_queue=args.max_queue,
+        adaptive_capacity=args.adaptive_capacity,
+        target_utilization=args.target_utilization,
+        workers=args.workers,
+        hallucination_filter=not args.no_hallucination_filter,
+        hallucination_dir=args.hallucination_dir,
+        draft_model=args.draft_model,
+        feature_cache=not args.no_feature_cache,
+        translation_batch_size=args.translation_batch_size,
+        translation_window_ms=args.translation_window_ms,
+        model_memory_mb=args.model_memory_mb,
+        admin_token=args.admin_token,
+        resume_grace=args.resume_grace
     )
@@ -46,7 +46,7 @@ setup(
         "faster-whisper>=1.1.0",
         "torch",
         "torchaudio",
-        "websockets",
+        "websockets>=13.0",
         "onnxruntime>=1.17.0",
         "scipy",
         "websocket-client",
@@ -63,5 +63,8 @@ setup(
         "optimum", 
         "optimum-intel",
     ],
+    extras_require={
+        "opus": ["opuslib"],
+    },
     python_requires=">=3.9"
 )
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import deque
+
+
+class InferenceLoadMonitor:
+    """
+    Measures how busy the shared model is and derives how many clients it can serve.
+
+    Busy time is the time the shared model lock is held, which covers both per-session inference and
+    scheduler batches. Utilization is busy time over a sliding window; dividing it by the number of
+    connected clients gives the measured load per client, and the capacity is the number of such
+    clients that fit under ``target_utilization``.
+    """
+
+    def __init__(self, target_utilization=0.8, window_seconds=60.0):
+        """
+        Args:
+            target_utilization (float, optional): Share of wall time the model may be busy before new
+                clients are queued. Defaults to 0.8.
+            window_seconds (float, optional): Length of the measurement window. Defaults to 60.
+        """
+        self.target_utilization = target_utilization
+        self.window = window_seconds
+        self.started = time.monotonic()
+        self.busy = deque()
+        self.lock = threading.Lock()
+
+    def record_busy(self, seconds):
+        with self.lock:
+            self.busy.append((time.monotonic(), seconds))
+
+    def utilization(self):
+        """
+        Returns:
+            float: Share of the recent wall time the model was busy.
+        """
+        now = time.monotonic()
+        with self.lock:
+            while self.busy and self.busy[0][0] < now - self.window:
+                self.busy.popleft()
+            busy = sum(seconds for _, seconds in self.busy)
+        elapsed = min(self.window, now - self.started)
+        return busy / elapsed if elapsed > 0 else 0.0
+
+    def capacity(self, active_clients, max_clients):
+        """
+        Args:
+            active_clients (int): Clients currently holding a slot.
+            max_clients (int): Upper bound configured with ``--max_clients``.
+
+        Returns:
+            int: How many clients may hold a slot at the current load, between 1 and ``max_clients``.
+        """
+        utilization = self.utilization()
+        if active_clients == 0 or utilization <= 0:
+            return max_clients
+        per_client = utilization / active_clients
+        return max(1, min(max_clients, int(self.target_utilization / per_client)))
+
+    def estimate_wait(self, active_clients, max_clients, position):
+        """
+        Estimates when the measured load leaves room for ``position`` more clients.
+
+        Each new client is assumed to add the current load per client. If that doesn't fit under
+        ``target_utilization`` yet, the estimate is the time until enough of the busy time recorded in
+        the window has aged out of it, i.e. until the capacity grows once the connected clients pause,
+        as dictation sessions mostly do.
+
+        Args:
+            active_clients (int): Clients currently holding or having reserved a slot.
+            max_clients (int): Upper bound configured with ``--max_clients``.
+            position (int): The client's 1-based position in the queue.
+
+        Returns:
+            float or None: Estimated seconds, or None if there is no load measurement yet or the client
+            waits for ``max_clients`` rather than for the load.
+        """
+        utilization = self.utilization()
+        if active_clients == 0 or utilization <= 0 or active_clients + position > max_clients:
+            return None
+        per_client = utilization / active_clients
+        excess = utilization + position * per_client - self.target_utilization
+        if excess <= 0:
+            return 0.0
+        now = time.monotonic()
+        excess *= min(self.window, now - self.started)
+        with self.lock:
+            for recorded_at, seconds in self.busy:
+                excess -= seconds
+                if excess <= 0:
+                    return max(0.0, recorded_at + self.window - now)
+        return None
+
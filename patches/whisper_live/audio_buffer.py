@@ -0,0 +1,176 @@
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity, preallocated float32 ring buffer for a session's audio stream.
+
+    Every sample is written twice, at ``i`` and ``i + capacity`` of a ``2 * capacity`` array, so any
+    span of up to ``capacity`` samples is one contiguous slice. Reads are therefore zero-copy views,
+    and written data is never moved: a sample is only overwritten once ``capacity`` newer samples
+    have arrived, which keeps views handed to an in-flight inference valid.
+
+    Positions are absolute sample indices in the stream. Two watermarks split the retained audio:
+
+    - ``committed``: everything before it has been transcribed and finalized.
+    - ``end``: everything between ``committed`` and ``end`` is pending transcription.
+    """
+
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity (int): Number of samples retained, e.g. ``60 * 16000`` for one minute.
+        """
+        self.capacity = capacity
+        self.storage = np.zeros(2 * capacity, dtype=np.float32)
+        self.reset()
+
+    def reset(self):
+        self.end = 0
+        self.committed = 0
+
+    @property
+    def start(self):
+        """Absolute index of the oldest retained sample."""
+        return max(0, self.end - self.capacity)
+
+    @property
+    def pending(self):
+        """Number of samples between the committed and the write watermark."""
+        return self.end - self.committed
+
+    def __len__(self):
+        return self.end - self.start
+
+    def write(self, frame):
+        """
+        Appends samples, overwriting the oldest ones once the buffer is full.
+
+        Args:
+            frame (numpy.ndarray): float32 samples to append.
+        """
+        n = frame.shape[0]
+        if n >= self.capacity:
+            frame = frame[-self.capacity:]
+            self.end += n - self.capacity
+            n = self.capacity
+        pos = self.end % self.capacity
+        first = min(n, self.capacity - pos)
+        for offset in (0, self.capacity):
+            self.storage[offset + pos:offset + pos + first] = frame[:first]
+        if first < n:
+            # Wrapped: the remainder goes to the start of both copies.
+            self.storage[:n - first] = frame[first:]
+            self.storage[self.capacity:self.capacity + n - first] = frame[first:]
+        self.end += n
+        if self.committed < self.start:
+            self.committed = self.start
+
+    def view(self, start=None, end=None):
+        """
+        Returns a contiguous, zero-copy view of retained samples ``[start, end)``.
+
+        Args:
+            start (int, optional): Absolute start index, clamped to the retained range. Defaults to the
+                oldest retained sample.
+            end (int, optional): Absolute end index. Defaults to the write watermark.
+
+        Returns:
+            numpy.ndarray: A read-only view into the buffer.
+        """
+        start = self.start if start is None else min(max(start, self.start), self.end)
+        end = self.end if end is None else min(max(end, start), self.end)
+        pos = start % self.capacity
+        view = self.storage[pos:pos + end - start]
+        view.flags.writeable = False
+        return view
+
+    def commit(self, index):
+        """Moves the committed watermark to ``index``, clamped to the retained range."""
+        self.committed = min(max(index, self.start), self.end)
+
+
+class RingBufferMixin:
+    """
+    Replaces the backends' concatenate-and-trim audio buffer with an `AudioRingBuffer`.
+
+    ``frames_np`` and ``frames_offset`` keep their meaning for the rest of ``ServeClientBase``
+    (``frames_np`` is a view of the retained audio, ``frames_offset`` the time of its first sample),
+    but adding a frame only copies that frame. Processing windows are limited to ``MAX_WINDOW_SECONDS``
+    so the ring has ``BUFFER_SECONDS - MAX_WINDOW_SECONDS`` of slack before it overwrites audio that
+    an in-flight inference may still be reading.
+    """
+    BUFFER_SECONDS = 60
+    MAX_WINDOW_SECONDS = 45
+
+    @property
+    def ring_buffer(self):
+        buffer = self.__dict__.get("_ring_buffer")
+        if buffer is None:
+            buffer = self.__dict__["_ring_buffer"] = AudioRingBuffer(self.BUFFER_SECONDS * self.RATE)
+            self.__dict__["_stream_offset"] = 0.0
+        return buffer
+
+    @property
+    def frames_np(self):
+        return self.ring_buffer.view()
+
+    @frames_np.setter
+    def frames_np(self, frames):
+        # Assigning the buffer (None or an array) restarts the stream, as in ServeClientBase.__init__.
+        self.ring_buffer.reset()
+        if frames is not None and frames.shape[0]:
+            self.ring_buffer.write(frames)
+
+    @property
+    def frames_offset(self):
+        return self.__dict__.get("_stream_offset", 0.0) + self.ring_buffer.start / self.RATE
+
+    @frames_offset.setter
+    def frames_offset(self, offset):
+        self.__dict__["_stream_offset"] = offset - self.ring_buffer.start / self.RATE
+
+    def add_frames(self, frame_np):
+        """
+        Add audio frames to the session's ring buffer.
+
+        Args:
+            frame_np (numpy.ndarray): The audio frame data as a NumPy array.
+        """
+        with self.lock:
+            self.ring_buffer.write(frame_np)
+            # No valid segment for longer than the window: skip ahead like the base buffer trimming does.
+            min_offset = self.frames_offset + max(0.0, len(self.ring_buffer) / self.RATE - self.MAX_WINDOW_SECONDS)
+            if self.timestamp_offset < min_offset:
+                self.timestamp_offset = min_offset
+
+    def get_audio_chunk_for_processing(self):
+        """
+        Returns the pending audio after the committed watermark as a zero-copy view, with its duration.
+        """
+        with self.lock:
+            stream_offset = self.__dict__.get("_stream_offset", 0.0)
+            self.ring_buffer.commit(int(round((self.timestamp_offset - stream_offset) * self.RATE)))
+            input_bytes = self.ring_buffer.view(self.ring_buffer.committed)
+        duration = input_bytes.shape[0] / self.RATE
+        return input_bytes, duration
+
+
+_RING_BUFFERED_CLASSES = {}
+
+
+def ring_buffered(client_class):
+    """
+    Returns a subclass of the given backend client class that stores its audio in an `AudioRingBuffer`.
+
+    Args:
+        client_class (type): A ``ServeClientBase`` subclass.
+
+    Returns:
+        type: The (cached) ring-buffered subclass.
+    """
+    if client_class not in _RING_BUFFERED_CLASSES:
+        _RING_BUFFERED_CLASSES[client_class] = type(
+            f"RingBuffered{client_class.__name__}", (RingBufferMixin, client_class), {}
+        )
+    return _RING_BUFFERED_CLASSES[client_class]
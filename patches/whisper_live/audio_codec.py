@@ -0,0 +1,53 @@
+import numpy as np
+
+
+class AudioDecoder:
+    """
+    Decodes the audio frames a client sends into the float32 samples the backends expect.
+
+    The encoding is declared by the client with the ``audio_encoding`` connection option:
+
+    - ``float32``: raw little-endian float32 samples (the default, 64 KB/s at 16 kHz).
+    - ``int16``: raw little-endian 16-bit PCM (32 KB/s), converted with a single allocation.
+    - ``opus``: one raw Opus packet per websocket message, mono at 16 kHz. Requires ``opuslib``.
+    """
+    ENCODINGS = ("float32", "int16", "opus")
+    INT16_SCALE = np.float32(1.0 / 32768.0)
+    # Largest Opus frame (120 ms) at 16 kHz.
+    OPUS_MAX_FRAME_SAMPLES = 1920
+
+    def __init__(self, encoding="float32", sample_rate=16000):
+        """
+        Args:
+            encoding (str): One of `ENCODINGS`. Defaults to "float32".
+            sample_rate (int): Sample rate of the decoded audio. Defaults to 16000.
+
+        Raises:
+            ValueError: If the encoding is unknown or its decoder is not available on the server.
+        """
+        if encoding not in self.ENCODINGS:
+            raise ValueError(f"Unsupported audio encoding '{encoding}'. Choose from {list(self.ENCODINGS)}")
+        self.encoding = encoding
+        self.opus_decoder = None
+        if encoding == "opus":
+            try:
+                import opuslib
+            except ImportError:
+                raise ValueError("Opus audio is not supported on this server: install 'opuslib'")
+            self.opus_decoder = opuslib.Decoder(sample_rate, 1)
+
+    def decode(self, frame_data):
+        """
+        Args:
+            frame_data (bytes): The audio message received from the client.
+
+        Returns:
+            numpy.ndarray: The decoded float32 samples. For float32 input this is a read-only
+            view of the message, no copy is made.
+        """
+        if self.encoding == "float32":
+            return np.frombuffer(frame_data, dtype=np.float32)
+        if self.encoding == "opus":
+            frame_data = self.opus_decoder.decode(frame_data, self.OPUS_MAX_FRAME_SAMPLES)
+        pcm = np.frombuffer(frame_data, dtype="<i2")
+        return np.multiply(pcm, self.INT16_SCALE, dtype=np.float32)
@@ -0,0 +1,359 @@
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from math import ceil
+
+import numpy as np
+
+from whisper_live.backend.faster_whisper_backend import ServeClientFasterWhisper
+
+
+class InferenceRequest:
+    """
+    A single transcription request submitted by a session's transcription thread.
+
+    The submitting thread blocks on `wait` while the scheduler fills in `result`/`info` or `error`.
+    """
+
+    def __init__(self, transcriber, audio, language=None, task="transcribe", initial_prompt=None,
+                 use_vad=False, vad_parameters=None):
+        self.transcriber = transcriber
+        self.audio = audio
+        self.language = language
+        self.task = task
+        self.initial_prompt = initial_prompt
+        self.use_vad = use_vad
+        self.vad_parameters = vad_parameters
+        self.submitted_at = time.monotonic()
+        self.result = None
+        self.info = None
+        self.error = None
+        self._done = threading.Event()
+
+    def set_result(self, result, info):
+        self.result = result
+        self.info = info
+        self._done.set()
+
+    def set_error(self, error):
+        self.error = error
+        self._done.set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Blocks until the scheduler has processed the request.
+
+        Returns:
+            tuple: The ``(segments, info)`` pair, like ``WhisperModel.transcribe``.
+
+        Raises:
+            Exception: Whatever the model raised while processing the request.
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError("Inference request was not processed in time")
+        if self.error is not None:
+            raise self.error
+        return self.result, self.info
+
+
+class InferenceScheduler:
+    """
+    Central micro-batching scheduler for the faster_whisper backend.
+
+    Sessions submit their pending audio windows instead of calling the model directly. A single
+    scheduler thread waits for the first request, keeps collecting requests for at most
+    ``batch_window_ms`` (or until ``max_batch_size`` is reached), groups them by model and runs
+    each group through one batched encode/generate call. Requests that can't share a batch
+    (unknown language, audio longer than one Whisper window) fall back to ``transcribe``.
+    """
+    MAX_BATCH_AUDIO_SECONDS = 30.0
+    STATS_LOG_INTERVAL = 60.0
+
+    def __init__(self, max_batch_size=8, batch_window_ms=50):
+        """
+        Args:
+            max_batch_size (int): Maximum number of requests decoded together. Defaults to 8.
+            batch_window_ms (int): Maximum time to wait for a batch to fill after the first request
+                arrived. This is the latency budget paid for batching. Defaults to 50 ms.
+        """
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window_ms / 1000.0
+        self.requests = queue.Queue()
+        self.exit = False
+        self.thread = None
+
+        self.stats_lock = threading.Lock()
+        self.batch_sizes = Counter()
+        self.total_batches = 0
+        self.total_requests = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.last_stats_log = time.monotonic()
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="inference-scheduler", daemon=True)
+        self.thread.start()
+        logging.info(f"Inference scheduler started (max_batch_size={self.max_batch_size}, "
+                     f"batch_window={self.batch_window * 1000:.0f}ms)")
+
+    def stop(self):
+        self.exit = True
+        if self.thread is not None:
+            self.thread.join(timeout=5.0)
+
+    def submit(self, request):
+        """
+        Queues a request for the next batch.
+
+        Args:
+            request (InferenceRequest): The request to process.
+
+        Returns:
+            InferenceRequest: The same request, so callers can ``submit(...).wait()``.
+        """
+        self.requests.put(request)
+        return request
+
+    def collect_batch(self):
+        """
+        Waits for the first request and gathers more until the batch is full or the window expires.
+
+        Returns:
+            list: The collected requests, empty if nothing arrived.
+        """
+        try:
+            batch = [self.requests.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.requests.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def run(self):
+        while not self.exit:
+            batch = self.collect_batch()
+            if not batch:
+                continue
+            self.record_batch(batch)
+
+            groups = {}
+            for request in batch:
+                groups.setdefault(id(request.transcriber), []).append(request)
+            for requests in groups.values():
+                try:
+                    self.process_group(requests)
+                except Exception as e:
+                    logging.error(f"[ERROR]: Batched inference failed: {e}")
+                    for request in requests:
+                        if not request.done():
+                            request.set_error(e)
+
+    def record_batch(self, batch):
+        started = time.monotonic()
+        waits = [started - request.submitted_at for request in batch]
+        with self.stats_lock:
+            self.batch_sizes[len(batch)] += 1
+            self.total_batches += 1
+            self.total_requests += len(batch)
+            self.total_wait_time += sum(waits)
+            self.max_wait_time = max(self.max_wait_time, max(waits))
+        logging.debug(f"Inference batch: size={len(batch)}, max_wait={max(waits) * 1000:.1f}ms")
+
+        if started - self.last_stats_log >= self.STATS_LOG_INTERVAL:
+            self.last_stats_log = started
+            stats = self.get_stats()
+            logging.info(
+                f"Inference scheduler: {stats['batches']} batches, mean size {stats['mean_batch_size']:.2f}, "
+                f"mean wait {stats['mean_wait_ms']:.1f}ms, max wait {stats['max_wait_ms']:.1f}ms"
+            )
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Batch count, request count, batch size distribution and queueing wait times.
+        """
+        with self.stats_lock:
+            batches = self.total_batches
+            requests = self.total_requests
+            return {
+                "batches": batches,
+                "requests": requests,
+                "batch_sizes": dict(self.batch_sizes),
+                "mean_batch_size": requests / batches if batches else 0.0,
+                "mean_wait_ms": 1000 * self.total_wait_time / requests if requests else 0.0,
+                "max_wait_ms": 1000 * self.max_wait_time,
+            }
+
+    def model_lock(self, transcriber):
+        # Clients that are not routed through the scheduler still serialize on the shared model lock.
+        if transcriber is ServeClientFasterWhisper.SINGLE_MODEL:
+            return ServeClientFasterWhisper.SINGLE_MODEL_LOCK
+        return nullcontext()
+
+    def process_group(self, requests):
+        """
+        Runs requests that share one model, batching all that can be batched.
+
+        Args:
+            requests (list): Requests that all reference the same transcriber.
+        """
+        transcriber = requests[0].transcriber
+        batchable = []
+        with self.model_lock(transcriber):
+            for request in requests:
+                duration = request.audio.shape[0] / ServeClientFasterWhisper.RATE
+                if len(requests) == 1 or request.language is None or duration > self.MAX_BATCH_AUDIO_SECONDS:
+                    self.process_single(request)
+                elif request.use_vad and not self.has_speech(request):
+                    # No voice activity: like ``transcribe``, return None so the window is skipped
+                    request.set_result(None, None)
+                else:
+                    batchable.append(request)
+            if len(batchable) == 1:
+                self.process_single(batchable[0])
+            elif batchable:
+                self.process_batch(transcriber, batchable)
+
+    def process_single(self, request):
+        try:
+            result, info = request.transcriber.transcribe(
+                request.audio,
+                initial_prompt=request.initial_prompt,
+                language=request.language,
+                task=request.task,
+                vad_filter=request.use_vad,
+                vad_parameters=request.vad_parameters if request.use_vad else None)
+            request.set_result(list(result) if result is not None else None, info)
+        except Exception as e:
+            request.set_error(e)
+
+    def has_speech(self, request):
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        vad_options = VadOptions(**(request.vad_parameters or {}))
+        return bool(get_speech_timestamps(request.audio, vad_options))
+
+    def process_batch(self, transcriber, requests):
+        """
+        Encodes and decodes several audio windows with one call each into CTranslate2.
+
+        VAD is only used to skip silent windows; windows with speech are decoded whole so segment
+        timestamps stay relative to the start of the window, as with ``transcribe``.
+        """
+        from faster_whisper.audio import pad_or_trim
+        from faster_whisper.tokenizer import Tokenizer
+        from whisper_live.transcriber.transcriber_faster_whisper import (
+            Segment, get_compression_ratio, get_suppressed_tokens
+        )
+
+        features = np.stack([pad_or_trim(transcriber.feature_extractor(r.audio)) for r in requests])
+        encoder_output = transcriber.encode(features)
+
+        tokenizers = []
+        prompts = []
+        for request in requests:
+            tokenizer = Tokenizer(
+                transcriber.hf_tokenizer,
+                transcriber.model.is_multilingual,
+                task=request.task,
+                language=request.language,
+            )
+            previous_tokens = []
+            if request.initial_prompt:
+                previous_tokens = tokenizer.encode(" " + request.initial_prompt.strip())
+            tokenizers.append(tokenizer)
+            prompts.append(transcriber.get_prompt(tokenizer, previous_tokens, without_timestamps=False))
+
+        results = transcriber.model.generate(
+            encoder_output,
+            prompts,
+            beam_size=5,
+            patience=1,
+            length_penalty=1,
+            max_length=transcriber.max_length,
+            suppress_blank=True,
+            suppress_tokens=get_suppressed_tokens(tokenizers[0], [-1]),
+            return_scores=True,
+            return_no_speech_prob=True,
+        )
+
+        for request, tokenizer, generated in zip(requests, tokenizers, results):
+            try:
+                tokens = generated.sequences_ids[0]
+                avg_logprob = generated.scores[0] * len(tokens) / (len(tokens) + 1)
+                duration = request.audio.shape[0] / ServeClientFasterWhisper.RATE
+                subsegments, _, _ = transcriber._split_segments_by_timestamps(
+                    tokenizer=tokenizer,
+                    tokens=tokens,
+                    time_offset=0.0,
+                    segment_size=int(ceil(duration) * transcriber.frames_per_second),
+                    segment_duration=duration,
+                    seek=0,
+                )
+                segments = []
+                for subsegment in subsegments:
+                    text = tokenizer.decode(subsegment["tokens"])
+                    if not text.strip():
+                        continue
+                    segments.append(Segment(
+                        id=len(segments),
+                        seek=subsegment["seek"],
+                        start=subsegment["start"],
+                        end=subsegment["end"],
+                        text=text,
+                        tokens=subsegment["tokens"],
+                        avg_logprob=avg_logprob,
+                        compression_ratio=get_compression_ratio(text),
+                        no_speech_prob=generated.no_speech_prob,
+                        words=None,
+                        temperature=0.0,
+                    ))
+                request.set_result(segments, None)
+            except Exception as e:
+                request.set_error(e)
+
+
+class ScheduledServeClientFasterWhisper(ServeClientFasterWhisper):
+    """
+    faster_whisper client that hands its audio windows to the server's `InferenceScheduler`
+    instead of calling the model under ``SINGLE_MODEL_LOCK`` itself.
+    """
+    SCHEDULER = None
+    REQUEST_TIMEOUT = 30.0
+
+    def transcribe_audio(self, input_sample):
+        """
+        Transcribes the provided audio sample through the shared inference scheduler.
+
+        Args:
+            input_sample (np.array): The audio chunk to be transcribed.
+
+        Returns:
+            The list of segments produced for the chunk.
+        """
+        request = ScheduledServeClientFasterWhisper.SCHEDULER.submit(InferenceRequest(
+            self.transcriber,
+            input_sample,
+            language=self.language,
+            task=self.task,
+            initial_prompt=self.initial_prompt,
+            use_vad=self.use_vad,
+            vad_parameters=self.vad_parameters,
+        ))
+        result, info = request.wait(timeout=self.REQUEST_TIMEOUT)
+        if self.language is None and info is not None:
+            self.set_language(info)
+        return result
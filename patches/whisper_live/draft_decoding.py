@@ -0,0 +1,170 @@
+import threading
+import time
+
+DRAFT = "draft"
+FINAL = "final"
+
+
+class DraftModel:
+    """
+    A small faster_whisper model (e.g. ``tiny`` or ``base``) shared by all sessions for their partial
+    hypotheses. It has its own lock, so drafts never wait behind a main-model decode.
+    """
+
+    def __init__(self, name, transcriber):
+        """
+        Args:
+            name (str): The model size or path, for status reports.
+            transcriber (WhisperModel): The loaded draft model.
+        """
+        self.name = name
+        self.transcriber = transcriber
+        self.lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.runs = {DRAFT: 0, FINAL: 0}
+        self.seconds = {DRAFT: 0.0, FINAL: 0.0}
+
+    @classmethod
+    def load(cls, name, cache_path):
+        """
+        Loads and warms up a draft model the same way the main model is preloaded.
+
+        Args:
+            name (str): Model size, local CTranslate2 directory or Hugging Face model id.
+            cache_path (str): Where the backend caches converted CTranslate2 models.
+
+        Returns:
+            DraftModel: The loaded draft model.
+        """
+        from whisper_live.preload import ModelPreloader
+
+        preloader = ModelPreloader(name, cache_path, single_model=False)
+        loader = preloader.load()
+        preloader.warm_up(loader)
+        return cls(name, loader.transcriber)
+
+    def transcribe(self, audio, **options):
+        """
+        Args:
+            audio (np.ndarray): The audio window.
+            **options: Keyword arguments of ``WhisperModel.transcribe``.
+
+        Returns:
+            tuple: The list of segments and the transcription info.
+        """
+        with self.lock:
+            result, info = self.transcriber.transcribe(audio, **options)
+            return (list(result) if result is not None else None), info
+
+    def record(self, tier, seconds):
+        with self.stats_lock:
+            self.runs[tier] += 1
+            self.seconds[tier] += seconds
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: The draft model and the number and total time of draft and main-model decodes.
+        """
+        with self.stats_lock:
+            return {
+                "model": self.name,
+                "draft_decodes": self.runs[DRAFT],
+                "final_decodes": self.runs[FINAL],
+                "draft_seconds": round(self.seconds[DRAFT], 2),
+                "final_seconds": round(self.seconds[FINAL], 2),
+            }
+
+
+class DraftDecodingMixin:
+    """
+    Decodes each audio window with the shared `DRAFT` model first and only runs the session's main
+    model when the draft shows that a segment is about to be completed: the window splits into more
+    than one segment, or its only segment has repeated often enough to be committed. Partial
+    hypotheses, which are overwritten moments later, then cost a small-model decode, while every
+    completed segment still comes from the main model.
+
+    Segments carry ``"tier": "draft"`` or ``"tier": "final"`` for the model that produced them.
+    Language detection always uses the main model.
+    """
+    DRAFT = None
+    decoding_tier = FINAL
+    commit_repeated = False
+
+    def transcribe_audio(self, input_sample):
+        if self.DRAFT is None or self.language is None:
+            return self.transcribe_final(input_sample)
+        start = time.monotonic()
+        result, _ = self.DRAFT.transcribe(
+            input_sample,
+            initial_prompt=self.initial_prompt,
+            language=self.language,
+            task=self.task,
+            vad_filter=self.use_vad,
+            vad_parameters=self.vad_parameters if self.use_vad else None)
+        self.DRAFT.record(DRAFT, time.monotonic() - start)
+        if not result or not self.completes_segment(result):
+            self.decoding_tier = DRAFT
+            return result
+        return self.transcribe_final(input_sample)
+
+    def transcribe_final(self, input_sample):
+        start = time.monotonic()
+        result = super().transcribe_audio(input_sample)
+        self.decoding_tier = FINAL
+        if self.DRAFT is not None:
+            self.DRAFT.record(FINAL, time.monotonic() - start)
+        return result
+
+    def completes_segment(self, segments):
+        """
+        Tells whether ``update_segments`` would complete a segment for these (draft) segments.
+
+        Args:
+            segments (list): The segments decoded for the current window.
+
+        Returns:
+            bool: True if the window has to be decoded by the main model.
+        """
+        last = segments[-1]
+        if self.get_segment_no_speech_prob(last) > self.no_speech_thresh:
+            return False
+        if len(segments) > 1:
+            return True
+        # The repeated-output rule commits the partial on its next repetition
+        self.commit_repeated = (last.text != "" and last.text.strip() == self.prev_out.strip()
+                                and self.same_output_count + 1 > self.same_output_threshold)
+        return self.commit_repeated
+
+    def update_segments(self, segments, duration):
+        if self.commit_repeated and self.decoding_tier == FINAL and len(segments) == 1:
+            # Commit the main model's text for the hypothesis the draft kept repeating
+            self.prev_out = segments[-1].text
+        self.commit_repeated = False
+        return super().update_segments(segments, duration)
+
+    def format_segment(self, start, end, text, completed=False):
+        segment = super().format_segment(start, end, text, completed=completed)
+        segment["tier"] = self.decoding_tier
+        return segment
+
+
+_DRAFT_CLASSES = {}
+
+
+def draft_decoded(client_class):
+    """
+    Returns a subclass of the given faster_whisper client class that decodes partial hypotheses
+    with `DraftDecodingMixin.DRAFT`.
+
+    Args:
+        client_class (type): A ``ServeClientFasterWhisper`` subclass.
+
+    Returns:
+        type: The (cached) two-tier subclass.
+    """
+    if client_class not in _DRAFT_CLASSES:
+        _DRAFT_CLASSES[client_class] = type(
+            f"DraftDecoded{client_class.__name__}", (DraftDecodingMixin, client_class), {}
+        )
+    return _DRAFT_CLASSES[client_class]
@@ -0,0 +1,214 @@
+import threading
+
+import numpy as np
+
+_active = threading.local()
+_install_lock = threading.Lock()
+
+
+def common_prefix_length(a, b):
+    """
+    Args:
+        a (np.ndarray): First 1-D array.
+        b (np.ndarray): Second 1-D array.
+
+    Returns:
+        int: Number of leading samples the arrays have in common.
+    """
+    n = min(len(a), len(b))
+    mismatches = np.flatnonzero(a[:n] != b[:n])
+    return int(mismatches[0]) if len(mismatches) else n
+
+
+class IncrementalMel:
+    """
+    Log-mel frames of the audio one model last transcribed for a session.
+
+    The next window usually starts with the same samples plus some new audio. STFT frames that lie
+    entirely inside that common prefix are reused, and only the frames touching new audio (or the
+    end padding) are computed. The result matches ``FeatureExtractor.__call__`` up to float
+    rounding, because the clamp and normalization that depend on the whole window are reapplied
+    on every call.
+    """
+
+    def __init__(self, extractor):
+        """
+        Args:
+            extractor (FeatureExtractor): The model's faster_whisper feature extractor.
+        """
+        self.extractor = extractor
+        self.window = np.hanning(extractor.n_fft + 1)[:-1].astype("float32")
+        self.audio = np.zeros(0, dtype=np.float32)
+        self.log_mel = None
+        self.features = None
+        self.frames_reused = 0
+        self.frames_computed = 0
+
+    def __call__(self, waveform, padding=160):
+        n_fft = self.extractor.n_fft
+        hop = self.extractor.hop_length
+        waveform = waveform.astype(np.float32, copy=False)
+
+        # Frame t covers samples [t*hop - n_fft/2, t*hop + n_fft/2); the first frames also reflect
+        # samples 1..n_fft/2. Frames that stay inside the common prefix are unchanged.
+        prefix = common_prefix_length(self.audio, waveform)
+        if self.features is not None and prefix == len(self.audio) == len(waveform):
+            # Unchanged window: identical features, so the encoder output can be reused as well
+            self.frames_reused += self.log_mel.shape[1]
+            return self.features
+        stable = 0
+        if self.log_mel is not None and prefix > n_fft // 2:
+            stable = min((prefix - n_fft // 2) // hop + 1, self.log_mel.shape[1])
+
+        padded = np.pad(np.pad(waveform, (0, padding)), n_fft // 2, mode="reflect")
+        stft = self.extractor.stft(
+            padded[stable * hop:],
+            n_fft,
+            hop,
+            window=self.window,
+            center=False,
+            return_complex=True,
+        ).astype("complex64")
+        magnitudes = np.abs(stft[..., :-1]) ** 2
+        new_frames = np.log10(np.clip(self.extractor.mel_filters @ magnitudes, a_min=1e-10, a_max=None))
+        if stable:
+            new_frames = np.concatenate([self.log_mel[:, :stable], new_frames], axis=1)
+
+        self.audio = waveform.copy()
+        self.log_mel = new_frames
+        self.frames_reused += stable
+        self.frames_computed += new_frames.shape[1] - stable
+
+        log_spec = np.maximum(new_frames, new_frames.max() - 8.0)
+        self.features = (log_spec + 4.0) / 4.0
+        return self.features
+
+
+class SessionFeatureCache:
+    """
+    A session's mel frames and its last encoder output, kept per model (a session may decode with a
+    draft and a main model that use different mel sizes).
+    """
+
+    def __init__(self):
+        self.mels = {}
+        self.encoded = {}
+        self.encoder_hits = 0
+        self.encoder_runs = 0
+
+    def clear(self):
+        self.mels.clear()
+        self.encoded.clear()
+
+    def features(self, extractor, waveform, padding=160, chunk_length=None):
+        if chunk_length is not None or waveform.ndim != 1:
+            return extractor(waveform, padding=padding, chunk_length=chunk_length)
+        mel = self.mels.get(id(extractor))
+        if mel is None or mel.extractor is not extractor:
+            mel = self.mels[id(extractor)] = IncrementalMel(extractor)
+        return mel(waveform, padding=padding)
+
+    def encode(self, encode, features):
+        key = id(encode.__self__)
+        cached = self.encoded.get(key)
+        if cached is not None and cached[0].shape == features.shape and np.array_equal(cached[0], features):
+            self.encoder_hits += 1
+            return cached[1]
+        output = encode(features)
+        self.encoder_runs += 1
+        self.encoded[key] = (features.copy(), output)
+        return output
+
+
+class _CachingFeatureExtractor:
+    """Stands in for a model's feature extractor and uses the cache of the session calling it, if any."""
+
+    def __init__(self, extractor):
+        self.extractor = extractor
+
+    def __call__(self, waveform, padding=160, chunk_length=None):
+        cache = getattr(_active, "cache", None)
+        if cache is None:
+            return self.extractor(waveform, padding=padding, chunk_length=chunk_length)
+        return cache.features(self.extractor, waveform, padding=padding, chunk_length=chunk_length)
+
+    def __getattr__(self, name):
+        return getattr(self.extractor, name)
+
+
+class _CachingEncoder:
+    """Stands in for ``WhisperModel.encode`` and reuses the calling session's output for unchanged features."""
+
+    def __init__(self, encode):
+        self.encode = encode
+
+    def __call__(self, features):
+        cache = getattr(_active, "cache", None)
+        if cache is None:
+            return self.encode(features)
+        return cache.encode(self.encode, features)
+
+
+def install_feature_cache(transcriber):
+    """
+    Routes a model's feature extraction and encoder calls through the calling session's cache.
+
+    Calls made outside `FeatureCacheMixin.transcribe_audio` (other sessions without a cache, preloading,
+    the batch scheduler's thread) are passed through unchanged.
+
+    Args:
+        transcriber (WhisperModel): The model, shared or per session.
+    """
+    with _install_lock:
+        extractor = getattr(transcriber, "feature_extractor", None)
+        if extractor is None or isinstance(extractor, _CachingFeatureExtractor):
+            return
+        transcriber.encode = _CachingEncoder(transcriber.encode)
+        transcriber.feature_extractor = _CachingFeatureExtractor(transcriber.feature_extractor)
+
+
+class FeatureCacheMixin:
+    """
+    Keeps the log-mel frames and the encoder output of a session's previous pass, so a re-decode of a
+    window that only grew at the end computes mel frames for the new audio only, and a re-decode of an
+    unchanged window skips the encoder. The cache is dropped whenever the window start advances.
+    """
+    feature_cache = None
+    feature_cache_offset = None
+
+    def transcribe_audio(self, input_sample):
+        if self.feature_cache is None:
+            self.feature_cache = SessionFeatureCache()
+            if getattr(self, "transcriber", None) is not None:
+                install_feature_cache(self.transcriber)
+        with self.lock:
+            offset = self.timestamp_offset
+        if offset != self.feature_cache_offset:
+            self.feature_cache.clear()
+            self.feature_cache_offset = offset
+        _active.cache = self.feature_cache
+        try:
+            return super().transcribe_audio(input_sample)
+        finally:
+            _active.cache = None
+
+
+_CACHED_CLASSES = {}
+
+
+def feature_cached(client_class):
+    """
+    Returns a subclass of the given faster_whisper client class that reuses mel frames and encoder
+    output across passes.
+
+    Args:
+        client_class (type): A ``ServeClientFasterWhisper`` subclass.
+
+    Returns:
+        type: The (cached) subclass.
+    """
+    if client_class not in _CACHED_CLASSES:
+        _CACHED_CLASSES[client_class] = type(
+            f"FeatureCached{client_class.__name__}", (FeatureCacheMixin, client_class), {}
+        )
+    return _CACHED_CLASSES[client_class]
@@ -0,0 +1,229 @@
+import glob
+import logging
+import os
+import threading
+import unicodedata
+
+DEFAULT_PHRASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hallucinations")
+
+
+def normalize(text):
+    """
+    Normalizes text for phrase matching: case, punctuation, symbols and spacing are ignored.
+
+    Args:
+        text (str): Segment text or phrase.
+
+    Returns:
+        str: Lowercase words separated by single spaces.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold().replace("ё", "е")
+    kept = (" " if unicodedata.category(char)[0] in "PSZC" else char for char in text)
+    return " ".join("".join(kept).split())
+
+
+class _TrieNode:
+    __slots__ = ("children", "phrase", "prefix")
+
+    def __init__(self):
+        self.children = {}
+        self.phrase = None
+        self.prefix = None
+
+
+class PhraseFilter:
+    """
+    Word trie of normalized phrases.
+
+    A segment matches if its normalized words are exactly the words of a phrase. Phrases ending in
+    ``*`` match any segment whose words start with them, e.g. ``subtitles by *``. Only case,
+    punctuation, symbols and spacing are ignored: a segment with a different word, even one letter
+    off ("спасибо за просмотры"), is real speech and is kept. The search walks the segment's words
+    down the trie once, so its cost depends on the segment, not on the number of phrases.
+    """
+
+    def __init__(self, phrases=()):
+        """
+        Args:
+            phrases (iterable): Phrases to drop; a trailing ``*`` makes a prefix phrase.
+        """
+        self.root = _TrieNode()
+        self.size = 0
+        for phrase in phrases:
+            self.add(phrase)
+
+    def add(self, phrase):
+        prefix = phrase.rstrip().endswith("*")
+        words = normalize(phrase.rstrip().rstrip("*")).split()
+        if not words:
+            return
+        node = self.root
+        for word in words:
+            node = node.children.setdefault(word, _TrieNode())
+        if prefix:
+            node.prefix = phrase
+        else:
+            node.phrase = phrase
+        self.size += 1
+
+    @classmethod
+    def from_files(cls, paths):
+        """
+        Compiles the phrases of one or more phrase files (one phrase per line, ``#`` comments).
+
+        Args:
+            paths (list): Paths of UTF-8 phrase files.
+
+        Returns:
+            PhraseFilter: The compiled filter.
+        """
+        phrase_filter = cls()
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        phrase_filter.add(line)
+        return phrase_filter
+
+    def match(self, text):
+        """
+        Args:
+            text (str): Segment text.
+
+        Returns:
+            str or None: The phrase the text matched, or None.
+        """
+        node = self.root
+        for word in normalize(text).split():
+            node = node.children.get(word)
+            if node is None:
+                return None
+            if node.prefix is not None:
+                return node.prefix
+        return node.phrase
+
+
+class PhraseLibrary:
+    """
+    Loads the per-language phrase files of a directory (``ru.txt``, ``en.txt``, ...) and compiles
+    one `PhraseFilter` per language on first use.
+
+    Sessions with a language that has no phrase file, or whose language is not known yet, use
+    the phrases of all languages.
+    """
+
+    def __init__(self, directory=None):
+        """
+        Args:
+            directory (str, optional): Directory of ``<language>.txt`` phrase files.
+                Defaults to the phrase files shipped next to this module.
+        """
+        self.directory = directory or DEFAULT_PHRASE_DIR
+        self.paths = {
+            os.path.splitext(os.path.basename(path))[0]: path
+            for path in sorted(glob.glob(os.path.join(self.directory, "*.txt")))
+        }
+        self.filters = {}
+        self.lock = threading.Lock()
+        self.dropped = 0
+        if not self.paths:
+            logging.warning(f"No hallucination phrase files found in {self.directory}")
+
+    def for_language(self, language):
+        """
+        Args:
+            language (str or None): The session's language code.
+
+        Returns:
+            PhraseFilter: The compiled filter for the language.
+        """
+        key = language if language in self.paths else None
+        with self.lock:
+            if key not in self.filters:
+                paths = [self.paths[key]] if key else list(self.paths.values())
+                self.filters[key] = PhraseFilter.from_files(paths)
+                logging.info(f"Compiled {self.filters[key].size} hallucination phrases for {key or 'all languages'}")
+            return self.filters[key]
+
+    def record_dropped(self):
+        with self.lock:
+            self.dropped += 1
+
+
+class FilteredTranslationQueue:
+    """
+    Stands in for a session's ``translation_queue`` while the backend processes new segments, so
+    completed segments matching a hallucination phrase are not queued for translation either.
+    """
+
+    def __init__(self, translation_queue, phrase_filter):
+        self.translation_queue = translation_queue
+        self.phrase_filter = phrase_filter
+
+    def put(self, segment, block=True, timeout=None):
+        # Logged and counted once, when the segment is dropped from the transcript
+        if self.phrase_filter.match(segment.get("text", "")) is None:
+            self.translation_queue.put(segment, block=block, timeout=timeout)
+
+
+class HallucinationFilterMixin:
+    """
+    Drops segments matching a known hallucination phrase (e.g. "Thanks for watching!") from the
+    transcript before they are sent or queued for translation, using the phrases of the session's
+    language in `PHRASES`.
+
+    Timing is untouched: the dropped segment's audio still counts as transcribed, so it is not
+    transcribed again.
+    """
+    PHRASES = None
+
+    def update_segments(self, segments, duration):
+        transcribed = len(self.transcript)
+        phrase_filter = self.PHRASES.for_language(getattr(self, "language", None))
+        # The base class queues completed segments for translation as it goes
+        translation_queue = getattr(self, "translation_queue", None)
+        if translation_queue:
+            self.translation_queue = FilteredTranslationQueue(translation_queue, phrase_filter)
+        try:
+            last_segment = super().update_segments(segments, duration)
+        finally:
+            if translation_queue:
+                self.translation_queue = translation_queue
+        if len(self.transcript) > transcribed:
+            self.transcript[transcribed:] = [
+                segment for segment in self.transcript[transcribed:]
+                if not self.is_hallucination(phrase_filter, segment)
+            ]
+        if last_segment is not None and self.is_hallucination(phrase_filter, last_segment):
+            return None
+        return last_segment
+
+    def is_hallucination(self, phrase_filter, segment):
+        phrase = phrase_filter.match(segment["text"])
+        if phrase is None:
+            return False
+        logging.info(f"Dropped hallucinated segment {segment['text']!r} (matches {phrase!r})")
+        self.PHRASES.record_dropped()
+        return True
+
+
+_FILTERED_CLASSES = {}
+
+
+def hallucination_filtered(client_class):
+    """
+    Returns a subclass of the given backend client class that filters its segments through
+    `HallucinationFilterMixin.PHRASES`.
+
+    Args:
+        client_class (type): A ``ServeClientBase`` subclass.
+
+    Returns:
+        type: The (cached) filtering subclass.
+    """
+    if client_class not in _FILTERED_CLASSES:
+        _FILTERED_CLASSES[client_class] = type(
+            f"HallucinationFiltered{client_class.__name__}", (HallucinationFilterMixin, client_class), {}
+        )
+    return _FILTERED_CLASSES[client_class]
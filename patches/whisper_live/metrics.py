@@ -0,0 +1,280 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket upper bounds, rendered in Prometheus text format."""
+
+    def __init__(self, buckets):
+        """
+        Args:
+            buckets (tuple): Sorted bucket upper bounds; ``+Inf`` is implied.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(float(bound))
+            lines.append(f'{name}_bucket{{le="{le}"}} {cumulative}')
+        lines.append(f"{name}_sum {self.sum}")
+        lines.append(f"{name}_count {self.count}")
+        return lines
+
+
+class ServerMetrics:
+    """
+    Counters and histograms describing the server's load, exported in Prometheus text format.
+
+    Counters are cumulative since startup; use ``rate()`` in Prometheus for per-second values.
+    Point-in-time values (e.g. connected clients) are read through gauge callbacks registered
+    with `add_gauge` when the metrics are rendered.
+    """
+    LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    LOCK_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+    RTF_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.frames_received = 0
+        self.bytes_received = 0
+        self.audio_seconds_received = 0.0
+        self.vad_frames = Counter()
+        self.inferences = 0
+        self.inference_seconds = 0.0
+        self.inference_audio_seconds = 0.0
+        self.inference_latency = Histogram(self.LATENCY_BUCKETS)
+        self.real_time_factor = Histogram(self.RTF_BUCKETS)
+        self.lock_wait = Histogram(self.LOCK_WAIT_BUCKETS)
+        self.segments_sent = 0
+        self.clients_rejected = 0
+        self.gauges = []
+
+    def add_gauge(self, name, help_text, value, kind="gauge"):
+        """
+        Registers a value that is read when the metrics are rendered.
+
+        Args:
+            name (str): Metric name.
+            help_text (str): Metric description.
+            value (callable): Returns the current value.
+            kind (str, optional): Prometheus metric type, "gauge" or "counter". Defaults to "gauge".
+        """
+        self.gauges.append((name, help_text, value, kind))
+
+    def record_frame(self, num_bytes, num_samples, sample_rate):
+        with self.lock:
+            self.frames_received += 1
+            self.bytes_received += num_bytes
+            self.audio_seconds_received += num_samples / sample_rate
+
+    def record_vad(self, voice_active, dropped):
+        with self.lock:
+            if voice_active:
+                self.vad_frames["speech"] += 1
+            else:
+                self.vad_frames["dropped" if dropped else "silence"] += 1
+
+    def record_inference(self, seconds, audio_seconds):
+        with self.lock:
+            self.inferences += 1
+            self.inference_seconds += seconds
+            self.inference_audio_seconds += audio_seconds
+            self.inference_latency.observe(seconds)
+            if audio_seconds > 0:
+                self.real_time_factor.observe(seconds / audio_seconds)
+
+    def record_lock_wait(self, seconds):
+        with self.lock:
+            self.lock_wait.observe(seconds)
+
+    def record_segments(self, count):
+        with self.lock:
+            self.segments_sent += count
+
+    def record_rejected(self):
+        with self.lock:
+            self.clients_rejected += 1
+
+    def render(self):
+        """
+        Returns:
+            str: All metrics in the Prometheus text exposition format.
+        """
+        lines = []
+
+        def metric(name, help_text, kind, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+
+        for name, help_text, value, kind in self.gauges:
+            try:
+                current = value()
+            except Exception as e:
+                logging.error(f"[ERROR]: Reading metric {name}: {e}")
+                continue
+            metric(name, help_text, kind, [f"{name} {current}"])
+
+        with self.lock:
+            metric("whisper_audio_frames_received_total", "Audio frames received from clients.", "counter",
+                   [f"whisper_audio_frames_received_total {self.frames_received}"])
+            metric("whisper_audio_bytes_received_total", "Audio bytes received from clients.", "counter",
+                   [f"whisper_audio_bytes_received_total {self.bytes_received}"])
+            metric("whisper_audio_seconds_received_total", "Seconds of audio received from clients.", "counter",
+                   [f"whisper_audio_seconds_received_total {self.audio_seconds_received}"])
+            metric("whisper_vad_frames_total",
+                   "Frames evaluated by server-side VAD, by verdict (dropped = silent frame not passed on).",
+                   "counter",
+                   [f'whisper_vad_frames_total{{result="{result}"}} {self.vad_frames[result]}'
+                    for result in ("speech", "silence", "dropped")])
+            evaluated = sum(self.vad_frames.values())
+            metric("whisper_vad_dropped_ratio", "Share of VAD-evaluated frames dropped as silence.", "gauge",
+                   [f"whisper_vad_dropped_ratio {self.vad_frames['dropped'] / evaluated if evaluated else 0.0}"])
+            metric("whisper_inference_seconds", "Latency of one transcription call, including queueing.",
+                   "histogram", self.inference_latency.render("whisper_inference_seconds"))
+            metric("whisper_inference_real_time_factor",
+                   "Transcription time divided by the duration of the transcribed audio.",
+                   "histogram", self.real_time_factor.render("whisper_inference_real_time_factor"))
+            overall_rtf = self.inference_seconds / self.inference_audio_seconds if self.inference_audio_seconds else 0.0
+            metric("whisper_real_time_factor", "Overall real-time factor since startup.", "gauge",
+                   [f"whisper_real_time_factor {overall_rtf}"])
+            metric("whisper_model_lock_wait_seconds", "Time spent waiting for the shared model lock.",
+                   "histogram", self.lock_wait.render("whisper_model_lock_wait_seconds"))
+            metric("whisper_segments_sent_total", "Transcript segments sent to clients.", "counter",
+                   [f"whisper_segments_sent_total {self.segments_sent}"])
+            metric("whisper_clients_rejected_total", "Clients turned away because the server was full.", "counter",
+                   [f"whisper_clients_rejected_total {self.clients_rejected}"])
+        return "\n".join(lines) + "\n"
+
+
+class TimedLock:
+    """Wraps a model lock and reports how long each acquisition waited and how long the lock was held."""
+
+    def __init__(self, lock=None, on_wait=None, on_hold=None):
+        """
+        Args:
+            lock (threading.Lock, optional): The lock to wrap. Defaults to a new lock.
+            on_wait (callable, optional): Called with the seconds spent waiting for each acquisition.
+            on_hold (callable, optional): Called with the seconds the lock was held, on each release.
+        """
+        self.lock = lock or threading.Lock()
+        self.on_wait = on_wait
+        self.on_hold = on_hold
+        self.acquired_at = None
+
+    def acquire(self, blocking=True, timeout=-1):
+        start = time.monotonic()
+        acquired = self.lock.acquire(blocking, timeout)
+        if acquired:
+            self.acquired_at = time.monotonic()
+            if self.on_wait is not None:
+                self.on_wait(self.acquired_at - start)
+        return acquired
+
+    def release(self):
+        held = time.monotonic() - self.acquired_at if self.acquired_at is not None else None
+        self.acquired_at = None
+        self.lock.release()
+        if held is not None and self.on_hold is not None:
+            self.on_hold(held)
+
+    def locked(self):
+        return self.lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class InstrumentedMixin:
+    """
+    Records per-inference latency, real-time factor and sent segments of a backend client
+    in the server's `ServerMetrics`.
+    """
+    METRICS = None
+
+    def transcribe_audio(self, input_sample):
+        start = time.monotonic()
+        result = super().transcribe_audio(input_sample)
+        self.METRICS.record_inference(time.monotonic() - start, input_sample.shape[0] / self.RATE)
+        return result
+
+    def send_transcription_to_client(self, segments):
+        self.METRICS.record_segments(len(segments))
+        return super().send_transcription_to_client(segments)
+
+
+_INSTRUMENTED_CLASSES = {}
+
+
+def instrumented(client_class):
+    """
+    Returns a subclass of the given backend client class that reports to `InstrumentedMixin.METRICS`.
+
+    Args:
+        client_class (type): A ``ServeClientBase`` subclass.
+
+    Returns:
+        type: The (cached) instrumented subclass.
+    """
+    if client_class not in _INSTRUMENTED_CLASSES:
+        _INSTRUMENTED_CLASSES[client_class] = type(
+            f"Instrumented{client_class.__name__}", (InstrumentedMixin, client_class), {}
+        )
+    return _INSTRUMENTED_CLASSES[client_class]
+
+
+class MetricsServer:
+    """Serves ``ServerMetrics`` over HTTP at ``/metrics`` from a background thread."""
+
+    def __init__(self, metrics, host, port):
+        """
+        Args:
+            metrics (ServerMetrics): The metrics to expose.
+            host (str): The host address to bind.
+            port (int): The port to bind.
+        """
+        self.metrics = metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.split("?")[0] not in ("/", "/metrics"):
+                    handler.send_error(404)
+                    return
+                body = metrics.render().encode()
+                handler.send_response(200)
+                handler.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, name="metrics", daemon=True).start()
+        logging.info(f"Serving metrics on http://{self.httpd.server_address[0]}:{self.httpd.server_address[1]}/metrics")
+
+    def stop(self):
+        self.httpd.shutdown()
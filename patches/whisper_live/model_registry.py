@@ -0,0 +1,363 @@
+import gc
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Approximate parameter counts (millions) of the faster_whisper model sizes
+MODEL_PARAMETERS = {
+    "tiny": 39, "tiny.en": 39, "base": 74, "base.en": 74, "small": 244, "small.en": 244,
+    "medium": 769, "medium.en": 769, "large-v1": 1550, "large-v2": 1550, "large-v3": 1550,
+    "large-v3-turbo": 809, "turbo": 809, "distil-small.en": 166, "distil-medium.en": 394,
+    "distil-large-v2": 756, "distil-large-v3": 756,
+}
+BYTES_PER_PARAMETER = {"int8": 1, "int8_float16": 1, "int8_float32": 1, "float16": 2, "bfloat16": 2, "float32": 4}
+
+
+def resident_mb():
+    """
+    Returns:
+        float or None: The resident memory of this process in MB, None where /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def estimate_mb(model, compute_type):
+    """
+    Estimates the memory a model takes before it is loaded, from its size and compute type.
+    Unknown models (paths, Hugging Face ids) are assumed to be as large as ``large-v3``.
+
+    Args:
+        model (str): Model size, local CTranslate2 directory or Hugging Face model id.
+        compute_type (str): The CTranslate2 compute type the model is loaded with.
+
+    Returns:
+        float: The estimated size in MB, including some runtime overhead.
+    """
+    parameters = MODEL_PARAMETERS.get(model, MODEL_PARAMETERS["large-v3"])
+    return 1.2 * parameters * 1e6 * BYTES_PER_PARAMETER.get(compute_type, 4) / 2**20
+
+
+class RegisteredModel:
+    """A loaded model, the sessions using it and the lock they take turns on."""
+
+    def __init__(self, key, transcriber, size_mb, pinned=False):
+        self.key = key
+        self.transcriber = transcriber
+        self.size_mb = size_mb
+        self.pinned = pinned
+        self.refs = 0
+        self.retired = False
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    Loads faster_whisper models on demand and shares them between sessions, within a memory budget.
+
+    Models are keyed by name or path, device and compute type. Sessions `acquire` a model, which loads
+    it if needed (concurrent requests for a model that is still loading wait for that load instead of
+    starting their own), and `release` it when they end. Before a model is loaded, idle models are
+    evicted least recently used first until the estimated size fits into ``budget_mb``; if the models
+    in use leave no room, the load is refused instead of risking running out of memory. Pinned models
+    (the preloaded ``--model``) count against the budget but are never evicted.
+    """
+
+    def __init__(self, budget_mb):
+        """
+        Args:
+            budget_mb (float): Memory the loaded models may take together, in MB.
+        """
+        self.budget_mb = budget_mb
+        self.models = OrderedDict()
+        self.loading = {}
+        self.sizes = {}
+        self.condition = threading.Condition()
+        # Loads run one at a time, so the resident memory they add can be attributed to the model
+        self.load_lock = threading.Lock()
+        self.loads = 0
+        self.hits = 0
+        self.evictions = 0
+
+    @staticmethod
+    def model_key(model, device, compute_type):
+        return (model, device or "cpu", compute_type)
+
+    @staticmethod
+    def measured_mb(device, before, after):
+        """
+        Returns:
+            float or None: The resident memory a CPU model added while loading, None if unknown.
+        """
+        if device != "cpu" or before is None or after is None or after <= before:
+            return None
+        return after - before
+
+    def used_mb(self):
+        return sum(entry.size_mb for entry in self.models.values()) + sum(self.loading.values())
+
+    def add(self, model, device, compute_type, transcriber, size_mb=None, pinned=True):
+        """
+        Registers a model that was loaded elsewhere, e.g. by the preloader.
+
+        Args:
+            model (str): Model size, local CTranslate2 directory or Hugging Face model id.
+            device (str): "cuda" or "cpu".
+            compute_type (str): The CTranslate2 compute type.
+            transcriber (WhisperModel): The loaded model.
+            size_mb (float, optional): Its measured size, used if larger than the estimate.
+            pinned (bool, optional): Never evict the model. Defaults to True.
+        """
+        key = self.model_key(model, device, compute_type)
+        size_mb = max(size_mb or 0, estimate_mb(model, compute_type))
+        with self.condition:
+            self.sizes[key] = size_mb
+            self.models[key] = RegisteredModel(key, transcriber, size_mb, pinned=pinned)
+            used_mb = self.used_mb()
+        logging.info(f"Model {model} registered ({size_mb:.0f} MB, {used_mb:.0f} of {self.budget_mb:.0f} MB in use)")
+        if used_mb > self.budget_mb:
+            logging.warning(f"Registered models exceed the {self.budget_mb:.0f} MB model budget")
+
+    def acquire(self, model, device, compute_type, load):
+        """
+        Returns the registered model for the key, loading it with ``load`` if it isn't loaded yet.
+
+        Args:
+            model (str): Model size, local CTranslate2 directory or Hugging Face model id.
+            device (str): "cuda" or "cpu".
+            compute_type (str): The CTranslate2 compute type.
+            load (callable): Loads the model and returns it.
+
+        Returns:
+            RegisteredModel: The model, with this session counted as a user until `release`.
+
+        Raises:
+            RuntimeError: If the model doesn't fit into the budget next to the models in use.
+        """
+        key = self.model_key(model, device, compute_type)
+        with self.condition:
+            while key in self.loading:
+                self.condition.wait()
+            entry = self.models.get(key)
+            if entry is not None:
+                entry.refs += 1
+                entry.last_used = time.monotonic()
+                self.models.move_to_end(key)
+                self.hits += 1
+                return entry
+            size_mb = self.sizes.get(key) or estimate_mb(model, compute_type)
+            evicted = self.make_room(size_mb)
+            self.loading[key] = size_mb
+        if evicted:
+            gc.collect()
+
+        try:
+            with self.load_lock:
+                before = resident_mb()
+                transcriber = load()
+                after = resident_mb()
+        except BaseException:
+            with self.condition:
+                del self.loading[key]
+                self.condition.notify_all()
+            raise
+        # Memory-mapped weights or GPU memory don't show up in the resident size, so keep the estimate as floor
+        size_mb = max(size_mb, self.measured_mb(key[1], before, after) or 0)
+
+        with self.condition:
+            del self.loading[key]
+            self.sizes[key] = size_mb
+            entry = self.models[key] = RegisteredModel(key, transcriber, size_mb)
+            entry.refs = 1
+            self.loads += 1
+            self.condition.notify_all()
+        logging.info(f"Model {model} loaded ({size_mb:.0f} MB, {self.used_mb():.0f} of {self.budget_mb:.0f} MB in use)")
+        return entry
+
+    def make_room(self, size_mb):
+        """
+        Evicts idle models, least recently used first, until ``size_mb`` fits. Called with the lock held.
+
+        Returns:
+            int: The number of evicted models.
+
+        Raises:
+            RuntimeError: If the models in use leave too little room.
+        """
+        idle = [(key, entry) for key, entry in self.models.items() if not entry.refs and not entry.pinned]
+        free_mb = self.budget_mb - self.used_mb() + sum(entry.size_mb for _, entry in idle)
+        if size_mb > free_mb:
+            # Don't evict anything for a model that won't fit anyway
+            raise RuntimeError(f"Model needs ~{size_mb:.0f} MB but only {max(free_mb, 0):.0f} MB of the "
+                               f"{self.budget_mb:.0f} MB model budget can be freed")
+        evicted = 0
+        for key, entry in idle:
+            if self.used_mb() + size_mb <= self.budget_mb:
+                break
+            del self.models[key]
+            entry.transcriber = None
+            evicted += 1
+            self.evictions += 1
+            logging.info(f"Evicted idle model {key[0]} ({entry.size_mb:.0f} MB)")
+        return evicted
+
+    def pinned_transcriber(self, model):
+        """
+        Returns:
+            WhisperModel or None: The loaded pinned model of that name or path, if any.
+        """
+        with self.condition:
+            for key, entry in self.models.items():
+                if key[0] == model and entry.pinned:
+                    return entry.transcriber
+        return None
+
+    def unpin(self, model, keep=None):
+        """
+        Lets a pinned model be unloaded, e.g. after it was replaced by a reload. It is dropped right away
+        if no session uses it, else once its last session releases it.
+
+        Args:
+            model (str): The model name or path.
+            keep (WhisperModel, optional): A model of that name that stays pinned, e.g. its reloaded copy.
+        """
+        with self.condition:
+            for key, entry in list(self.models.items()):
+                if key[0] == model and entry.pinned and entry.transcriber is not keep:
+                    entry.pinned = False
+                    entry.retired = True
+                    if not entry.refs:
+                        self.drop(key)
+
+    def drop(self, key):
+        entry = self.models.pop(key)
+        entry.transcriber = None
+        logging.info(f"Unloaded model {key[0]} ({entry.size_mb:.0f} MB)")
+
+    def release(self, entry):
+        """
+        Marks one session as done with a model. The model stays loaded until it has to be evicted.
+
+        Args:
+            entry (RegisteredModel): The model returned by `acquire`.
+        """
+        with self.condition:
+            entry.refs = max(0, entry.refs - 1)
+            entry.last_used = time.monotonic()
+            if self.models.get(entry.key) is entry:
+                self.models.move_to_end(entry.key)
+                if entry.retired and not entry.refs:
+                    self.drop(entry.key)
+
+    def switch(self, entry, transcriber):
+        """
+        Moves one session from a model to another registered model, e.g. the one that replaced it in a
+        reload. The previous model is released as with `release`.
+
+        Args:
+            entry (RegisteredModel): The model the session acquired.
+            transcriber (WhisperModel): The loaded model to move to.
+
+        Returns:
+            RegisteredModel or None: The new model of the session, None if ``transcriber`` isn't registered.
+        """
+        with self.condition:
+            replacement = next((e for e in self.models.values() if e.transcriber is transcriber), None)
+            if replacement is None:
+                return None
+            replacement.refs += 1
+            replacement.last_used = time.monotonic()
+            self.models.move_to_end(replacement.key)
+        self.release(entry)
+        return replacement
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: The budget, the memory in use and every loaded model with its size and users.
+        """
+        now = time.monotonic()
+        with self.condition:
+            return {
+                "budget_mb": round(self.budget_mb),
+                "used_mb": round(self.used_mb()),
+                "loads": self.loads,
+                "hits": self.hits,
+                "evictions": self.evictions,
+                "loading": [key[0] for key in self.loading],
+                "models": [
+                    {
+                        "model": entry.key[0],
+                        "device": entry.key[1],
+                        "compute_type": entry.key[2],
+                        "size_mb": round(entry.size_mb),
+                        "sessions": entry.refs,
+                        "pinned": entry.pinned,
+                        "idle_seconds": round(now - entry.last_used, 1) if not entry.refs else 0.0,
+                    }
+                    for entry in self.models.values()
+                ],
+            }
+
+
+class RegistryModelMixin:
+    """
+    Gets the session's model from `REGISTRY` instead of creating a model of its own, and gives it back
+    on cleanup. Sessions sharing a registered model take turns on its lock.
+    """
+    REGISTRY = None
+    registered_model = None
+
+    def create_model(self, device):
+        if self.REGISTRY is None:
+            return super().create_model(device)
+
+        def load():
+            super(RegistryModelMixin, self).create_model(device)
+            return self.transcriber
+
+        self.registered_model = self.REGISTRY.acquire(
+            self.model_size_or_path, device, getattr(self, "compute_type", None), load
+        )
+        self.transcriber = self.registered_model.transcriber
+
+    def transcribe_audio(self, input_sample):
+        # Scheduled sessions hand their audio to the scheduler thread, the only caller of the model
+        if self.registered_model is None or getattr(self, "SCHEDULER", None) is not None:
+            return super().transcribe_audio(input_sample)
+        with self.registered_model.lock:
+            return super().transcribe_audio(input_sample)
+
+    def cleanup(self):
+        super().cleanup()
+        entry, self.registered_model = self.registered_model, None
+        if entry is not None and self.REGISTRY is not None:
+            self.REGISTRY.release(entry)
+
+
+_REGISTRY_CLASSES = {}
+
+
+def registry_backed(client_class):
+    """
+    Returns a subclass of the given faster_whisper client class that shares its model through
+    `RegistryModelMixin.REGISTRY`.
+
+    Args:
+        client_class (type): A ``ServeClientFasterWhisper`` subclass.
+
+    Returns:
+        type: The (cached) subclass.
+    """
+    if client_class not in _REGISTRY_CLASSES:
+        _REGISTRY_CLASSES[client_class] = type(
+            f"Registry{client_class.__name__}", (RegistryModelMixin, client_class), {}
+        )
+    return _REGISTRY_CLASSES[client_class]
@@ -0,0 +1,198 @@
+import logging
+import threading
+import time
+import weakref
+
+LOADING = "LOADING"
+SWAPPED = "SWAPPED"
+FAILED = "FAILED"
+
+
+class ModelSwap:
+    """
+    Replaces the shared faster_whisper model while the server keeps running.
+
+    The new model is loaded and warmed up on a background thread while sessions keep using the current
+    one. It is then installed in a single step (`install`, supplied by the server) that new sessions
+    pick up right away, and which reports the replaced model with `installed`. Sessions already running
+    on the previous model are moved over by `SwappableModelMixin`: idle ones right away, the others at
+    the start of their next utterance, so a partial hypothesis is never re-decoded by a different model.
+    The previous model is freed once the last of them has switched.
+    """
+
+    def __init__(self, cache_path, scheduler=None):
+        """
+        Args:
+            cache_path (str): Where the backend caches converted CTranslate2 models.
+            scheduler (InferenceScheduler, optional): Also warm up the scheduler's batched decode.
+        """
+        self.cache_path = cache_path
+        self.scheduler = scheduler
+        # Reentrant: a replaced model may be freed, and its finalizer run, while the lock is held
+        self.lock = threading.RLock()
+        self.retired = weakref.WeakSet()
+        self.current = None
+        self.current_name = None
+        self.model = None
+        self.state = None
+        self.error = None
+        self.started_at = None
+        self.load_seconds = None
+        self.sessions_switched = 0
+        self.previous_freed = False
+
+    def start(self, model, install):
+        """
+        Loads ``model`` in the background and hands it to ``install`` once it is warm.
+
+        Args:
+            model (str): Model size, local CTranslate2 directory or Hugging Face model id.
+            install (callable): Called with the `ModelPreloader` holding the loaded model; installs it for
+                new sessions and calls `installed`.
+
+        Returns:
+            bool: False if a reload is already in progress.
+        """
+        with self.lock:
+            if self.state == LOADING:
+                return False
+            self.state = LOADING
+            self.model = model
+            self.error = None
+            self.started_at = time.monotonic()
+        threading.Thread(target=self.run, args=(model, install), name="model-swap", daemon=True).start()
+        return True
+
+    def run(self, model, install):
+        from whisper_live.preload import ModelPreloader
+
+        logging.info(f"Reloading model: {model}")
+        preloader = ModelPreloader(model, self.cache_path, single_model=False, scheduler=self.scheduler)
+        try:
+            preloader.warm_up(preloader.load())
+            install(preloader)
+        except Exception as e:
+            logging.error(f"Failed to reload model {model}, keeping the current one: {e}")
+            with self.lock:
+                self.state = FAILED
+                self.error = str(e)
+            return
+        logging.info(f"Model {model} is now used for new sessions (loaded in {self.load_seconds:.1f}s)")
+
+    def installed(self, model, transcriber, previous):
+        """
+        Records the model `install` made current. Sessions on ``previous`` may switch from now on.
+
+        Args:
+            model (str): The name or path of the installed model.
+            transcriber (WhisperModel): The installed model.
+            previous (WhisperModel or None): The model it replaced, None if there was no shared model.
+        """
+        with self.lock:
+            # Without a replaced shared model, sessions load (or get from the registry) the model themselves
+            self.current = transcriber if previous is not None else None
+            self.current_name = model
+            self.load_seconds = time.monotonic() - self.started_at
+            self.sessions_switched = 0
+            self.previous_freed = previous is None
+            self.state = SWAPPED
+            if previous is not None:
+                self.retired.add(previous)
+                weakref.finalize(previous, self.freed, model)
+
+    def freed(self, model):
+        with self.lock:
+            if self.current_name == model:
+                self.previous_freed = True
+        logging.info(f"Previous model freed, all sessions use {model}")
+
+    def replacement(self, transcriber):
+        """
+        Args:
+            transcriber (WhisperModel): The model a session decodes with.
+
+        Returns:
+            WhisperModel or None: The current shared model if ``transcriber`` was replaced, else None.
+        """
+        if self.current is None or transcriber is self.current or transcriber not in self.retired:
+            return None
+        return self.current
+
+    def switched(self):
+        with self.lock:
+            self.sessions_switched += 1
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: The state of the last reload, its model and how far sessions have moved over to it.
+        """
+        with self.lock:
+            return {
+                "state": self.state,
+                "model": self.model,
+                "load_seconds": round(self.load_seconds, 2) if self.load_seconds is not None else None,
+                "sessions_switched": self.sessions_switched,
+                "previous_freed": self.previous_freed,
+                "error": self.error,
+            }
+
+
+class SwappableModelMixin:
+    """
+    Moves a session from a replaced shared model to `SWAP`'s current one between utterances: only when
+    the previous pass left no partial hypothesis, so an utterance in flight finishes on the model that
+    started it. Registry-backed sessions hand their registered model back to the registry and take the
+    replacement's.
+    """
+    SWAP = None
+
+    def switch_model(self):
+        """
+        Switches to the replacement of the session's model, if it was replaced and the session is idle.
+        Called before each decode, and by the server for all sessions once a reload is installed.
+
+        Returns:
+            bool: True if the session switched.
+        """
+        swap = self.SWAP
+        if swap is None or self.current_out.strip():
+            return False
+        with self.lock:
+            replacement = swap.replacement(getattr(self, "transcriber", None))
+            if replacement is None:
+                return False
+            registered_model = getattr(self, "registered_model", None)
+            if registered_model is not None:
+                registered_model = self.REGISTRY.switch(registered_model, replacement)
+                if registered_model is None:
+                    return False
+                self.registered_model = registered_model
+            self.transcriber = replacement
+        swap.switched()
+        logging.info(f"Client {self.client_uid} switched to model {swap.current_name}")
+        return True
+
+    def transcribe_audio(self, input_sample):
+        self.switch_model()
+        return super().transcribe_audio(input_sample)
+
+
+_SWAPPABLE_CLASSES = {}
+
+
+def swappable(client_class):
+    """
+    Returns a subclass of the given faster_whisper client class that follows model reloads.
+
+    Args:
+        client_class (type): A ``ServeClientFasterWhisper`` subclass.
+
+    Returns:
+        type: The (cached) subclass.
+    """
+    if client_class not in _SWAPPABLE_CLASSES:
+        _SWAPPABLE_CLASSES[client_class] = type(
+            f"Swappable{client_class.__name__}", (SwappableModelMixin, client_class), {}
+        )
+    return _SWAPPABLE_CLASSES[client_class]
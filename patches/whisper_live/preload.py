@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+import socket
+import time
+
+import numpy as np
+
+
+def sd_notify(state):
+    """
+    Sends a state update (e.g. ``"READY=1"``) to systemd when running as a ``Type=notify`` service.
+
+    Args:
+        state (str): Newline-separated ``KEY=VALUE`` assignments, see ``sd_notify(3)``.
+
+    Returns:
+        bool: True if the update was delivered, False if not running under systemd or it failed.
+    """
+    address = os.environ.get("NOTIFY_SOCKET")
+    if not address:
+        return False
+    if address.startswith("@"):
+        address = "\0" + address[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM | socket.SOCK_CLOEXEC) as sock:
+            sock.connect(address)
+            sock.sendall(state.encode())
+        return True
+    except OSError as e:
+        logging.warning(f"Failed to notify systemd: {e}")
+        return False
+
+
+class _PreloadWebSocket:
+    """Stands in for a client connection while the backend loads its model, keeping what it sends."""
+
+    def __init__(self):
+        self.messages = []
+
+    def send(self, message):
+        self.messages.append(json.loads(message))
+
+    def close(self):
+        pass
+
+    def error(self):
+        for message in self.messages:
+            if message.get("status") == "ERROR":
+                return message.get("message")
+        return None
+
+
+class ModelPreloader:
+    """
+    Loads and warms up the faster_whisper model before the first client connects.
+
+    The model is loaded by constructing a regular ``ServeClientFasterWhisper`` on a stand-in
+    websocket, so it goes through the backend's own ``create_model``: the same device and
+    ``compute_type`` selection, ``snapshot_download`` and CTranslate2 conversion into
+    ``cache_path``, and with ``single_model`` the result becomes the shared ``SINGLE_MODEL``
+    that every session reuses. A few transcriptions of silence then run through the same
+    ``transcribe_audio`` path (and the scheduler's batched path, if enabled) so CUDA kernels,
+    cuDNN/cuBLAS handles and allocator pools are initialized before real audio arrives.
+    """
+    WARMUP_SECONDS = 2.0
+    WARMUP_RUNS = 2
+
+    def __init__(self, model, cache_path, single_model=True, scheduler=None):
+        """
+        Args:
+            model (str): Model size, local CTranslate2 directory or Hugging Face model id.
+            cache_path (str): Where the backend caches converted CTranslate2 models.
+            single_model (bool, optional): Keep the model as the backend's shared ``SINGLE_MODEL``.
+                Defaults to True.
+            scheduler (InferenceScheduler, optional): Also warm up the scheduler's batched decode.
+        """
+        self.model = model
+        self.cache_path = cache_path
+        self.single_model = single_model
+        self.scheduler = scheduler
+        self.load_seconds = None
+        self.warmup_seconds = None
+        self.transcriber = None
+        self.device = None
+        self.compute_type = None
+
+    def load(self):
+        """
+        Loads the model through the backend.
+
+        Returns:
+            ServeClientFasterWhisper: The stopped loader client holding the ``transcriber``.
+
+        Raises:
+            RuntimeError: If the backend failed to load the model.
+        """
+        from whisper_live.backend.faster_whisper_backend import ServeClientFasterWhisper
+
+        start = time.monotonic()
+        websocket = _PreloadWebSocket()
+        loader = ServeClientFasterWhisper(
+            websocket,
+            client_uid="preload",
+            model=self.model,
+            use_vad=False,
+            single_model=self.single_model,
+            cache_path=self.cache_path,
+        )
+        # The loader only exists to run create_model; stop its transcription thread right away.
+        loader.exit = True
+        if websocket.error() or getattr(loader, "transcriber", None) is None:
+            raise RuntimeError(websocket.error() or f"Failed to load model: {self.model}")
+        self.load_seconds = time.monotonic() - start
+        self.transcriber = loader.transcriber
+        self.device = getattr(getattr(loader.transcriber, "model", None), "device", None)
+        self.compute_type = getattr(loader, "compute_type", None)
+        logging.info(f"Model {self.model} loaded in {self.load_seconds:.1f}s")
+        return loader
+
+    def warm_up(self, loader):
+        """
+        Transcribes silence a few times so the first real utterance doesn't pay one-time costs.
+
+        Args:
+            loader (ServeClientFasterWhisper): The client returned by `load`.
+        """
+        start = time.monotonic()
+        silence = np.zeros(int(self.WARMUP_SECONDS * loader.RATE), dtype=np.float32)
+        for _ in range(self.WARMUP_RUNS):
+            loader.transcribe_audio(silence)
+        if self.scheduler is not None and self.scheduler.max_batch_size > 1:
+            from whisper_live.batch_scheduler import InferenceRequest
+
+            requests = [
+                self.scheduler.submit(InferenceRequest(loader.transcriber, silence, language="en"))
+                for _ in range(min(2, self.scheduler.max_batch_size))
+            ]
+            for request in requests:
+                request.wait(timeout=60.0)
+        self.warmup_seconds = time.monotonic() - start
+        logging.info(f"Model warm-up finished in {self.warmup_seconds:.1f}s")
+
+    def run(self):
+        """
+        Loads and warms up the model.
+
+        Returns:
+            dict: Load and warm-up timings for status reports.
+        """
+        self.warm_up(self.load())
+        return {
+            "load_seconds": round(self.load_seconds, 2),
+            "warmup_seconds": round(self.warmup_seconds, 2),
+        }
@@ -0,0 +1,138 @@
+import json
+import threading
+
+
+class SegmentDeltaWebSocket:
+    """
+    Websocket wrapper that turns the backends' "last N segments" updates into incremental deltas.
+
+    The backends keep sending their usual ``{"uid": ..., "segments": [...]}`` messages, limited to a
+    small window of recent segments. This wrapper tracks what the client already has and forwards
+    only what changed:
+
+        {"uid": ..., "delta": {"version": 1, "seq": 7, "segments": [
+            {"id": 12, "start": "...", "end": "...", "text": "...", "completed": true},
+            {"id": 13, "start": "...", "end": "...", "text": "...", "completed": false},
+        ]}}
+
+    Segment ``id`` is the position of the segment in the transcript, so the in-progress segment
+    ``k`` keeps its id when it is finalized and later updates never touch finalized ids.
+    ``{"id": k, "removed": true}`` drops an in-progress segment that disappeared without being
+    finalized. ``seq`` increases by one per delta so clients can detect gaps.
+
+    All other messages are passed through unchanged; ``SERVER_READY`` additionally carries the
+    negotiated ``delta_segments`` version. The finalized segments are kept, so a client that resumes
+    its session on a new connection can be sent everything it missed (see `catch_up`).
+    """
+    VERSION = 1
+    WINDOW = 10
+
+    def __init__(self, websocket):
+        """
+        Args:
+            websocket: The websocket (or websocket bridge) of the client.
+        """
+        self.websocket = websocket
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forgets the transcript state, e.g. after the session's transcript was reset."""
+        with self.lock:
+            self._reset()
+
+    def _reset(self):
+        self.seq = 0
+        self.finalized = []
+        self.finalized_count = 0
+        self.last_finalized = None
+        self.pending = None
+
+    def send(self, message):
+        if isinstance(message, str) and '"segments"' in message:
+            data = json.loads(message)
+            if "segments" in data:
+                # Sent with the lock held, so deltas reach the client in ``seq`` order
+                with self.lock:
+                    delta = self.encode(data["segments"])
+                    if delta is None:
+                        return None
+                    return self.websocket.send(json.dumps({"uid": data.get("uid"), "delta": delta}))
+        if isinstance(message, str) and '"SERVER_READY"' in message:
+            data = json.loads(message)
+            data["delta_segments"] = self.VERSION
+            message = json.dumps(data)
+        return self.websocket.send(message)
+
+    def close(self):
+        return self.websocket.close()
+
+    def new_finalized(self, completed):
+        """Returns the completed segments of the window that the client has not seen finalized yet."""
+        if self.last_finalized is None:
+            return completed
+        key = (self.last_finalized["start"], self.last_finalized["end"])
+        for i, segment in enumerate(completed):
+            if (segment["start"], segment["end"]) == key:
+                return completed[i + 1:]
+        # The last finalized segment scrolled out of the window, fall back to timestamps.
+        last_start = float(self.last_finalized["start"])
+        return [segment for segment in completed if float(segment["start"]) > last_start]
+
+    def encode(self, segments):
+        """
+        Computes the delta between the client's view and the current window of segments.
+
+        Args:
+            segments (list): The segments the backend wanted to send.
+
+        Returns:
+            dict or None: The delta payload, or None if nothing changed.
+        """
+        completed = [segment for segment in segments if segment.get("completed", False)]
+        partial = segments[-1] if segments and not segments[-1].get("completed", False) else None
+
+        changes = []
+        for segment in self.new_finalized(completed):
+            changes.append(dict(segment, id=self.finalized_count))
+            self.finalized.append(segment)
+            self.finalized_count += 1
+            self.last_finalized = segment
+            self.pending = None
+
+        if partial is not None:
+            if partial != self.pending:
+                changes.append(dict(partial, id=self.finalized_count))
+                self.pending = partial
+        elif self.pending is not None:
+            changes.append({"id": self.finalized_count, "removed": True})
+            self.pending = None
+
+        if not changes:
+            return None
+        self.seq += 1
+        return {"version": self.VERSION, "seq": self.seq, "segments": changes}
+
+    def catch_up(self, acknowledged):
+        """
+        Builds the delta for a client that resumes its session: the finalized segments after the ones it
+        acknowledged, and the in-progress segment (or its removal, the client may hold a stale one).
+        Called with the lock held.
+
+        Args:
+            acknowledged (int): Number of finalized segments the client has.
+
+        Returns:
+            dict: The delta payload.
+        """
+        acknowledged = max(0, min(acknowledged, self.finalized_count))
+        changes = [dict(segment, id=i) for i, segment in enumerate(self.finalized[acknowledged:], acknowledged)]
+        if self.pending is not None:
+            changes.append(dict(self.pending, id=self.finalized_count))
+        else:
+            changes.append({"id": self.finalized_count, "removed": True})
+        self.seq += 1
+        return {"version": self.VERSION, "seq": self.seq, "segments": changes}
+
+    def __getattr__(self, name):
+        return getattr(self.websocket, name)
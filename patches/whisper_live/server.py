@@ -1,35 +1,71 @@
 import os
+import hmac
 import time
+import signal
 import threading
-import queue
 import json
+import asyncio
 import functools
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import List, Optional
 
 import numpy as np
 from websockets.sync.server import serve
-from websockets.exceptions import ConnectionClosed
+from websockets.exceptions import ConnectionClosed, ConnectionClosedError
 from whisper_live.vad import VoiceActivityDetector
+from whisper_live.segment_delta import SegmentDeltaWebSocket
+from whisper_live.audio_codec import AudioDecoder
+from whisper_live.audio_buffer import ring_buffered
+from whisper_live.preload import ModelPreloader, sd_notify
+from whisper_live.metrics import ServerMetrics, MetricsServer, TimedLock, InstrumentedMixin, instrumented
+from whisper_live.hallucination_filter import PhraseLibrary, HallucinationFilterMixin, hallucination_filtered
+from whisper_live.draft_decoding import DraftModel, DraftDecodingMixin, draft_decoded
+from whisper_live.feature_cache import feature_cached, install_feature_cache
+from whisper_live.translation_service import TranslationService
+from whisper_live.model_registry import ModelRegistry, RegistryModelMixin, registry_backed, resident_mb
+from whisper_live.model_swap import ModelSwap, SwappableModelMixin, swappable
+from whisper_live.session_resume import ResumableSessions, ResumableWebSocket
+from whisper_live.transcription_passes import ExecutorPassesMixin, executor_passes
 from whisper_live.backend.base import ServeClientBase
 
 logging.basicConfig(level=logging.INFO)
 
 class ClientManager:
-    def __init__(self, max_clients=4, max_connection_time=600):
+    QUEUED = "QUEUED"
+    QUEUE_UPDATE_INTERVAL = 5.0
+    TURNOVER_SAMPLES = 20
+
+    def __init__(self, max_clients=4, max_connection_time=600, max_queue=16, load_monitor=None):
         """
         Initializes the ClientManager with specified limits on client connections and connection durations.
 
+        Clients that connect while all slots are taken wait in a FIFO admission queue, with their connection
+        open, and are admitted as soon as a slot frees. Only when the queue is full too are they turned away
+        with a ``WAIT`` status.
+
         Args:
             max_clients (int, optional): The maximum number of simultaneous client connections allowed. Defaults to 4.
             max_connection_time (int, optional): The maximum duration (in seconds) a client can stay connected. Defaults
                                                  to 600 seconds (10 minutes).
+            max_queue (int, optional): The maximum number of clients waiting for a slot. Defaults to 16.
+            load_monitor (InferenceLoadMonitor, optional): Adapts the number of slots to the measured model load,
+                                                           up to ``max_clients``. Defaults to a fixed ``max_clients``.
         """
         self.clients = {}
         self.start_times = {}
         self.max_clients = max_clients
         self.max_connection_time = max_connection_time
+        self.max_queue = max_queue
+        self.load_monitor = load_monitor
+        self.queue = deque()
+        self.reserved = 0
+        self.departures = deque(maxlen=self.TURNOVER_SAMPLES)
+        self.condition = threading.Condition()
+        self.waiting = 0
+        self.waiting_lock = threading.Lock()
 
     def add_client(self, websocket, client):
         """
@@ -39,8 +75,32 @@ class ClientManager:
             websocket: The websocket associated with the client to add.
             client: The client object to be added and tracked.
         """
-        self.clients[websocket] = client
-        self.start_times[websocket] = time.time()
+        with self.condition:
+            self.clients[websocket] = client
+            self.start_times[websocket] = time.time()
+            # The slot was reserved when the client left the admission queue.
+            self.reserved = max(0, self.reserved - 1)
+
+    def update_waiting(self, delta):
+        """
+        Adjusts the number of connected clients that wait to be admitted, e.g. while the model loads.
+
+        Args:
+            delta (int): +1 when a client starts waiting, -1 when it stops.
+        """
+        with self.waiting_lock:
+            self.waiting += delta
+
+    def renew_client(self, websocket):
+        """
+        Restarts the connection time of a kept-alive client when it resumes after being idle, so that
+        time spent paused does not count towards `max_connection_time`.
+
+        Args:
+            websocket: The websocket associated with the client to renew.
+        """
+        if websocket in self.start_times:
+            self.start_times[websocket] = time.time()
 
     def get_client(self, websocket):
         """
@@ -64,10 +124,14 @@ class ClientManager:
         Args:
             websocket: The websocket associated with the client to be removed.
         """
-        client = self.clients.pop(websocket, None)
+        with self.condition:
+            client = self.clients.pop(websocket, None)
+            self.start_times.pop(websocket, None)
+            if client:
+                self.departures.append(time.time())
+                self.condition.notify_all()
         if client:
             client.cleanup()
-        self.start_times.pop(websocket, None)
 
     def get_wait_time(self):
         """
@@ -83,9 +147,39 @@ class ClientManager:
                 wait_time = current_client_time_remaining
         return wait_time / 60 if wait_time is not None else 0
 
+    def capacity(self):
+        """
+        Returns:
+            int: The number of clients that may currently hold a slot.
+        """
+        if self.load_monitor is None:
+            return self.max_clients
+        return self.load_monitor.capacity(len(self.clients), self.max_clients)
+
+    def has_free_slot(self):
+        return len(self.clients) + self.reserved < self.capacity()
+
+    def is_queue_full(self):
+        """
+        Returns:
+            bool: True if there is neither a free slot nor room in the admission queue.
+        """
+        with self.condition:
+            if not self.queue and self.has_free_slot():
+                return False
+            return len(self.queue) >= self.max_queue
+
+    def wait_status(self, options):
+        """
+        Returns:
+            str: The ``WAIT`` message for a client that is turned away, with the legacy wait estimate in minutes.
+        """
+        return json.dumps({"uid": options["uid"], "status": "WAIT", "message": self.get_wait_time()})
+
     def is_server_full(self, websocket, options):
         """
-        Checks if the server is at its maximum client capacity and sends a wait message to the client if necessary.
+        Checks if the server has neither a free slot nor room in the admission queue and sends a wait message
+        to the client if so.
 
         Args:
             websocket: The websocket of the client attempting to connect.
@@ -94,13 +188,120 @@ class ClientManager:
         Returns:
             True if the server is full, False otherwise.
         """
-        if len(self.clients) >= self.max_clients:
-            wait_time = self.get_wait_time()
-            response = {"uid": options["uid"], "status": "WAIT", "message": wait_time}
-            websocket.send(json.dumps(response))
+        if self.is_queue_full():
+            websocket.send(self.wait_status(options))
             return True
         return False
 
+    def enqueue(self, websocket):
+        with self.condition:
+            self.queue.append(websocket)
+
+    def leave_queue(self, websocket):
+        with self.condition:
+            if websocket in self.queue:
+                self.queue.remove(websocket)
+                self.condition.notify_all()
+
+    def try_admit(self, websocket):
+        """
+        Reserves a slot for the queued client if it is first in line and a slot is free.
+
+        Returns:
+            bool: True if the client left the queue with a reserved slot.
+        """
+        with self.condition:
+            if self.queue and self.queue[0] is websocket and self.has_free_slot():
+                self.queue.popleft()
+                self.reserved += 1
+                self.condition.notify_all()
+                return True
+            return False
+
+    def release_reservation(self):
+        """Gives back a reserved slot whose client could not be initialized."""
+        with self.condition:
+            self.reserved = max(0, self.reserved - 1)
+            self.condition.notify_all()
+
+    def queue_position(self, websocket):
+        with self.condition:
+            return self.queue.index(websocket) + 1 if websocket in self.queue else 0
+
+    def estimate_queue_wait(self, position):
+        """
+        Estimates when a queued client will be admitted.
+
+        With a load monitor, the estimate comes from the measured model load (see
+        `InferenceLoadMonitor.estimate_wait`). Otherwise, or while the load gives none, it comes from the
+        measured rate at which slots were freed.
+
+        Args:
+            position (int): The client's 1-based position in the queue.
+
+        Returns:
+            float or None: Estimated seconds until admission, None while neither has been measured.
+        """
+        if self.load_monitor is not None:
+            with self.condition:
+                active_clients = len(self.clients) + self.reserved
+            estimated_wait = self.load_monitor.estimate_wait(active_clients, self.max_clients, position)
+            if estimated_wait is not None:
+                return estimated_wait
+        with self.condition:
+            if len(self.departures) < 2:
+                return None
+            span = self.departures[-1] - self.departures[0]
+            if span <= 0:
+                return None
+            slots_per_second = (len(self.departures) - 1) / span
+        return position / slots_per_second
+
+    def queue_status(self, options, position):
+        """
+        Returns:
+            str: The ``QUEUED`` message telling a waiting client its position and estimated wait.
+        """
+        estimated_wait = self.estimate_queue_wait(position)
+        return json.dumps({
+            "uid": options["uid"],
+            "message": self.QUEUED,
+            "position": position,
+            "estimated_wait": round(estimated_wait, 1) if estimated_wait is not None else None,
+            "capacity": self.capacity(),
+        })
+
+    def wait_for_slot(self, websocket, options):
+        """
+        Queues the client until a slot is free, keeping it informed about its position.
+
+        The client is sent a ``QUEUED`` message whenever its position changes and at least every
+        ``QUEUE_UPDATE_INTERVAL`` seconds, which also notices clients that gave up waiting.
+
+        Args:
+            websocket: The websocket of the client attempting to connect.
+            options: A dictionary of options that may include the client's unique identifier.
+
+        Returns:
+            bool: True once a slot is reserved for the client, False if it was turned away.
+        """
+        if self.is_server_full(websocket, options):
+            return False
+        self.enqueue(websocket)
+        last_position, last_update = None, 0.0
+        try:
+            while not self.try_admit(websocket):
+                position = self.queue_position(websocket)
+                if position != last_position or time.time() - last_update >= self.QUEUE_UPDATE_INTERVAL:
+                    websocket.send(self.queue_status(options, position))
+                    last_position, last_update = position, time.time()
+                with self.condition:
+                    self.condition.wait(timeout=1.0)
+        except Exception:
+            self.leave_queue(websocket)
+            raise
+        return True
+
     def is_client_timeout(self, websocket):
         """
         Checks if a client has exceeded the maximum allowed connection time and disconnects them if so, issuing a warning.
@@ -142,54 +343,121 @@ class BackendType(Enum):
         return self == BackendType.OPENVINO
 
 
+class ClientSession:
+    """
+    Per-connection state of the transcription server.
+
+    Everything that depends on a single client's options (the backend actually in use after a
+    fallback, whether VAD is enabled, the VAD detector and its silence counter) lives here instead of
+    on the shared ``TranscriptionServer``, so concurrent connections can't overwrite each other's state.
+    """
+
+    def __init__(self, websocket, backend: BackendType):
+        """
+        Args:
+            websocket: The websocket (or websocket bridge) of the client.
+            backend (BackendType): The backend requested for this connection.
+        """
+        self.websocket = websocket
+        self.backend = backend
+        self.use_vad = True
+        self.vad_detector = None
+        self.vad_batcher = None
+        self.no_voice_activity_chunks = 0
+        self.keep_alive = False
+        self.paused = False
+        self.segment_encoder = None
+        self.audio_decoder = AudioDecoder()
+        self.uid = None
+        self.resume_token = None
+        self.samples_received = 0
+
+
 class TranscriptionServer:
     RATE = 16000
+    PAUSED = "PAUSED"
+    RESUMED = "RESUMED"
+    SESSION_CONFIG = "SESSION_CONFIG"
+    SERVER_STATUS = "SERVER_STATUS"
+    RELOAD = "RELOAD"
+    LOADING = "LOADING"
+    RESUMABLE = "RESUMABLE"
+    SESSION_RESUMED = "SESSION_RESUMED"
 
     def __init__(self):
         self.client_manager = None
-        self.no_voice_activity_chunks = 0
-        self.use_vad = True
         self.single_model = False
+        self.executor = None
+        self.inference_scheduler = None
+        self.ring_buffer = True
+        self.server_vad = False
+        self.vad_batcher = None
+        self.ready = threading.Event()
+        self.ready_async = None
+        self.loop = None
+        self.started_at = time.time()
+        self.backend = None
+        self.model = None
+        self.preload_info = None
+        self.preload_error = None
+        self.metrics = None
+        self.worker_pool = None
+        self.hallucination_phrases = None
+        self.draft_model_name = None
+        self.draft_model = None
+        self.feature_cache = True
+        self.translation_service = TranslationService()
+        self.model_registry = None
+        self.model_swap = None
+        self.admin_token = None
+        self.resumable_sessions = None
+
+    def client_class(self, backend_class):
+        """
+        Returns the class to instantiate for a backend client, with the server-wide buffering applied.
+
+        Args:
+            backend_class (type): The backend's ``ServeClientBase`` subclass.
+        """
+        if self.hallucination_phrases is not None:
+            backend_class = hallucination_filtered(backend_class)
+        if self.metrics is not None:
+            backend_class = instrumented(backend_class)
+        if self.ring_buffer:
+            backend_class = ring_buffered(backend_class)
+        if self.executor is not None:
+            backend_class = executor_passes(backend_class)
+        return backend_class
 
     def initialize_client(
-        self, websocket, options, faster_whisper_custom_model_path,
+        self, session, options, faster_whisper_custom_model_path,
         whisper_tensorrt_path, trt_multilingual, trt_py_session=False,
     ):
         client: Optional[ServeClientBase] = None
+        websocket = session.websocket
 
-        # Check if client wants translation
-        enable_translation = options.get("enable_translation", False)
-        
-        # Create translation queue if translation is enabled
-        translation_queue = None
-        translation_client = None
-        translation_thread = None
-        
-        if enable_translation:
+        # Clients opting into the delta protocol get only new/changed segments. The backend then
+        # only needs to produce a small window of recent segments for the encoder to diff.
+        if options.get("delta_segments", 0) >= SegmentDeltaWebSocket.VERSION:
+            websocket = session.segment_encoder = SegmentDeltaWebSocket(session.websocket)
+            options["send_last_n_segments"] = SegmentDeltaWebSocket.WINDOW
+
+        # Translation runs on the server's shared translation service
+        translation_session = None
+        if options.get("enable_translation", False):
             target_language = options.get("target_language", "fr")
-            translation_queue = queue.Queue()
-            from whisper_live.backend.translation_backend import ServeClientTranslation
-            translation_client = ServeClientTranslation(
-                client_uid=options["uid"],
-                websocket=websocket,
-                translation_queue=translation_queue,
+            translation_session = self.translation_service.open_session(
+                options["uid"],
+                websocket,
                 target_language=target_language,
                 send_last_n_segments=options.get("send_last_n_segments", 10)
             )
-            
-            # Start translation thread
-            translation_thread = threading.Thread(
-                target=translation_client.speech_to_text,
-                daemon=True
-            )
-            translation_thread.start()
-            
             logging.info(f"Translation enabled for client {options['uid']} with target language: {target_language}")
 
-        if self.backend.is_tensorrt():
+        if session.backend.is_tensorrt():
             try:
                 from whisper_live.backend.trt_backend import ServeClientTensorRT
-                client = ServeClientTensorRT(
+                client = self.client_class(ServeClientTensorRT)(
                     websocket,
                     multilingual=trt_multilingual,
                     language=options["language"],
@@ -206,19 +474,18 @@ class TranscriptionServer:
                 logging.info("Running TensorRT backend.")
             except Exception as e:
                 logging.error(f"TensorRT-LLM not supported: {e}")
-                self.client_uid = options["uid"]
                 websocket.send(json.dumps({
-                    "uid": self.client_uid,
+                    "uid": options["uid"],
                     "status": "WARNING",
                     "message": "TensorRT-LLM not supported on Server yet. "
                                "Reverting to available backend: 'faster_whisper'"
                 }))
-                self.backend = BackendType.FASTER_WHISPER
+                session.backend = BackendType.FASTER_WHISPER
         
-        if self.backend.is_openvino():
+        if session.backend.is_openvino():
             try:
                 from whisper_live.backend.openvino_backend import ServeClientOpenVINO
-                client = ServeClientOpenVINO(
+                client = self.client_class(ServeClientOpenVINO)(
                     websocket,
                     language=options["language"],
                     task=options["task"],
@@ -233,23 +500,39 @@ class TranscriptionServer:
                 logging.info("Running OpenVINO backend.")
             except Exception as e:
                 logging.error(f"OpenVINO not supported: {e}")
-                self.backend = BackendType.FASTER_WHISPER
-                self.client_uid = options["uid"]
+                session.backend = BackendType.FASTER_WHISPER
                 websocket.send(json.dumps({
-                    "uid": self.client_uid,
+                    "uid": options["uid"],
                     "status": "WARNING",
                     "message": "OpenVINO not supported on Server yet. "
                                 "Reverting to available backend: 'faster_whisper'"
                 }))
 
         try:
-            if self.backend.is_faster_whisper():
+            if session.backend.is_faster_whisper():
                 from whisper_live.backend.faster_whisper_backend import ServeClientFasterWhisper
+                if self.worker_pool is not None:
+                    from whisper_live.worker_pool import PooledServeClientFasterWhisper as ServeClientFasterWhisper
+                elif self.inference_scheduler is not None:
+                    from whisper_live.batch_scheduler import ScheduledServeClientFasterWhisper as ServeClientFasterWhisper
+                if self.model_registry is not None:
+                    ServeClientFasterWhisper = registry_backed(ServeClientFasterWhisper)
+                if self.model_swap is not None:
+                    ServeClientFasterWhisper = swappable(ServeClientFasterWhisper)
+                    # New sessions get the model of the last reload
+                    faster_whisper_custom_model_path = self.model_swap.current_name or faster_whisper_custom_model_path
+                if self.draft_model is not None:
+                    ServeClientFasterWhisper = draft_decoded(ServeClientFasterWhisper)
+                if self.feature_cache and self.worker_pool is None and self.inference_scheduler is None:
+                    ServeClientFasterWhisper = feature_cached(ServeClientFasterWhisper)
                 # model is of the form namespace/repo_name and not a filesystem path
-                if faster_whisper_custom_model_path is not None:
+                # With the model registry, clients may pick any model; it is loaded on demand
+                if self.model_registry is not None and options.get("model"):
+                    logging.info(f"Using requested model {options['model']}")
+                elif faster_whisper_custom_model_path is not None:
                     logging.info(f"Using custom model {faster_whisper_custom_model_path}")
                     options["model"] = faster_whisper_custom_model_path
-                client = ServeClientFasterWhisper(
+                client = self.client_class(ServeClientFasterWhisper)(
                     websocket,
                     language=options["language"],
                     task=options["task"],
@@ -257,14 +540,14 @@ class TranscriptionServer:
                     model=options["model"],
                     initial_prompt=options.get("initial_prompt"),
                     vad_parameters=options.get("vad_parameters"),
-                    use_vad=self.use_vad,
-                    single_model=self.single_model,
+                    use_vad=session.use_vad,
+                    single_model=self.single_model and self.model_registry is None,
                     send_last_n_segments=options.get("send_last_n_segments", 10),
                     no_speech_thresh=options.get("no_speech_thresh", 0.45),
                     clip_audio=options.get("clip_audio", False),
                     same_output_threshold=options.get("same_output_threshold", 10),
                     cache_path=self.cache_path,
-                    translation_queue=translation_queue
+                    translation_queue=translation_session
                 )
 
                 logging.info("Running faster_whisper backend.")
@@ -273,13 +556,12 @@ class TranscriptionServer:
             return
 
         if client is None:
-            raise ValueError(f"Backend type {self.backend.value} not recognised or not handled.")
+            raise ValueError(f"Backend type {session.backend.value} not recognised or not handled.")
 
-        if translation_client:
-            client.translation_client = translation_client
-            client.translation_thread = translation_thread
+        if translation_session:
+            client.translation_session = translation_session
 
-        self.client_manager.add_client(websocket, client)
+        self.client_manager.add_client(session.websocket, client)
 
     def get_audio_from_websocket(self, websocket):
         """
@@ -291,57 +573,706 @@ class TranscriptionServer:
         Returns:
             A numpy array containing the audio.
         """
-        frame_data = websocket.recv()
+        return self.decode_audio_frame(websocket.recv())
+
+    def decode_audio_frame(self, frame_data, audio_decoder=None):
+        """
+        Converts a raw websocket message into a numpy array of audio samples.
+
+        Args:
+            frame_data (bytes): The message received from the client.
+            audio_decoder (AudioDecoder, optional): Decoder for the encoding negotiated by the client.
+                Defaults to raw float32.
+
+        Returns:
+            A numpy array containing the audio, or False if the client signalled the end of audio.
+        """
         if frame_data == b"END_OF_AUDIO":
             return False
-        return np.frombuffer(frame_data, dtype=np.float32)
+        if audio_decoder is None:
+            frame_np = np.frombuffer(frame_data, dtype=np.float32)
+        else:
+            frame_np = audio_decoder.decode(frame_data)
+        if self.metrics is not None:
+            self.metrics.record_frame(len(frame_data), frame_np.shape[0], self.RATE)
+        return frame_np
 
-    def handle_new_connection(self, websocket, faster_whisper_custom_model_path,
+    def handle_new_connection(self, session, faster_whisper_custom_model_path,
                               whisper_tensorrt_path, trt_multilingual, trt_py_session=False):
+        """
+        Reads the client's first message and answers a query, resumes a session or admits a new client.
+
+        Returns:
+            ClientSession or None: The session to receive audio for, None if the connection ends here.
+        """
         try:
             logging.info("New client connected")
-            options = websocket.recv()
+            options = session.websocket.recv()
             options = json.loads(options)
-
-            self.use_vad = options.get('use_vad')
-            if self.client_manager.is_server_full(websocket, options):
-                websocket.close()
-                return False  # Indicates that the connection should not continue
-
-            if self.backend.is_tensorrt():
-                self.vad_detector = VoiceActivityDetector(frame_rate=self.RATE)
-            self.initialize_client(websocket, options, faster_whisper_custom_model_path,
-                                   whisper_tensorrt_path, trt_multilingual, trt_py_session=trt_py_session)
-            return True
+            reply = self.status_reply(options)
+            if reply is not None:
+                session.websocket.send(reply)
+                session.websocket.close()
+                return None
+            if "resume_token" in options:
+                return self.resume_session(session.websocket, options)
+            if not self.ready.is_set():
+                self.send_loading_status(session.websocket, options)
+                self.client_manager.update_waiting(1)
+                try:
+                    self.ready.wait()
+                finally:
+                    self.client_manager.update_waiting(-1)
+            if not self.client_manager.wait_for_slot(session.websocket, options):
+                self.reject_client(session.websocket)
+                return None
+            if not self.admit_client(session, options, faster_whisper_custom_model_path,
+                                     whisper_tensorrt_path, trt_multilingual, trt_py_session=trt_py_session):
+                return None
+            return session
         except json.JSONDecodeError:
             logging.error("Failed to decode JSON from client")
-            return False
+            return None
         except ConnectionClosed:
             logging.info("Connection closed by client")
-            return False
+            return None
         except Exception as e:
             logging.error(f"Error during new connection initialization: {str(e)}")
+            return None
+
+    def get_status(self):
+        """
+        Describes the server's readiness, for status queries.
+
+        Returns:
+            dict: ``state`` is "LOADING" until the model is loaded and warmed up, then "READY",
+            or "DEGRADED" if preloading failed and sessions will load the model themselves.
+        """
+        if not self.ready.is_set():
+            state = self.LOADING
+        elif self.preload_error:
+            state = "DEGRADED"
+        else:
+            state = "READY"
+        status = {
+            "message": self.SERVER_STATUS,
+            "state": state,
+            "ready": self.ready.is_set(),
+            "backend": self.backend.value if self.backend else None,
+            "model": self.model,
+            "clients": len(self.client_manager.clients) if self.client_manager else 0,
+            "queued": len(self.client_manager.queue) if self.client_manager else 0,
+            "capacity": self.client_manager.capacity() if self.client_manager else None,
+            "max_clients": self.client_manager.max_clients if self.client_manager else None,
+            "uptime": round(time.time() - self.started_at, 1),
+        }
+        if self.worker_pool is not None:
+            status["workers"] = self.worker_pool.get_stats()
+        if self.draft_model is not None:
+            status["draft"] = self.draft_model.get_stats()
+        if self.model_registry is not None:
+            status["models"] = self.model_registry.get_stats()
+        if self.model_swap is not None and self.model_swap.state is not None:
+            status["reload"] = self.model_swap.get_stats()
+        if self.translation_service.thread is not None:
+            status["translation"] = self.translation_service.get_stats()
+        if self.resumable_sessions is not None:
+            status["resume"] = self.resumable_sessions.get_stats()
+        if self.preload_info:
+            status["preload"] = self.preload_info
+        if self.preload_error:
+            status["error"] = self.preload_error
+        return status
+
+    def status_reply(self, options):
+        """
+        Answers a ``{"query": "status"}`` or ``{"query": "reload"}`` message sent instead of the client options.
+
+        Args:
+            options (dict): The decoded first message of the connection.
+
+        Returns:
+            str or None: The JSON reply if the message was a query, else None.
+        """
+        if options.get("query") == "reload":
+            status = self.reload_reply(options)
+        elif options.get("query") == "status":
+            status = self.get_status()
+        else:
+            return None
+        if "uid" in options:
+            status["uid"] = options["uid"]
+        return json.dumps(status)
+
+    def reload_reply(self, options):
+        """
+        Starts a model reload requested with ``{"query": "reload", "model": ..., "token": ...}``.
+
+        Reloads over the websocket are only accepted if the server was started with an ``admin_token``
+        and the message carries it. ``model`` is optional and defaults to the current model.
+
+        Args:
+            options (dict): The decoded first message of the connection.
+
+        Returns:
+            dict: Whether the reload was started, and the state of the last reload.
+        """
+        reply = {"message": self.RELOAD, "accepted": False}
+        token = options.get("token")
+        if not self.admin_token or not isinstance(token, str) or not hmac.compare_digest(token, self.admin_token):
+            logging.warning("Rejected a model reload request without a valid admin token")
+            reply["error"] = "Reloading needs the server's admin token"
+            return reply
+        reply["accepted"] = self.reload_model(options.get("model"))
+        if self.model_swap is not None:
+            reply["reload"] = self.model_swap.get_stats()
+        return reply
+
+    def reload_model(self, model=None):
+        """
+        Loads a faster_whisper model in the background and switches new and idle sessions over to it.
+
+        Args:
+            model (str, optional): Model size, local CTranslate2 directory or Hugging Face model id.
+                Defaults to the current model, e.g. to pick up an updated model directory.
+
+        Returns:
+            bool: True if the reload was started, False if it isn't supported or one is in progress.
+        """
+        if self.model_swap is None:
+            logging.warning("Model reloads need the faster_whisper backend without workers.")
+            return False
+        return self.model_swap.start(model or self.model, self.install_model)
+
+    def install_model(self, preloader):
+        """
+        Makes a reloaded model the one new sessions get. Called by `ModelSwap` once the model is warm.
+
+        The shared model is replaced under its lock, so no decode sees a half-switched server. With the
+        model registry the replaced model is unpinned instead, and unloaded once its sessions have moved
+        to the new one. Idle sessions are switched right away, the others between utterances.
+
+        Args:
+            preloader (ModelPreloader): The preloader holding the loaded model.
+        """
+        from whisper_live.backend.faster_whisper_backend import ServeClientFasterWhisper
+
+        if self.feature_cache:
+            install_feature_cache(preloader.transcriber)
+        registry_previous = None
+        if self.model_registry is not None:
+            registry_previous = self.model_registry.pinned_transcriber(self.model)
+            self.model_registry.add(preloader.model, preloader.device, preloader.compute_type, preloader.transcriber)
+        with ServeClientFasterWhisper.SINGLE_MODEL_LOCK:
+            previous, replaced_model = ServeClientFasterWhisper.SINGLE_MODEL, self.model
+            if previous is not None:
+                ServeClientFasterWhisper.SINGLE_MODEL = preloader.transcriber
+            self.model = preloader.model
+        sd_notify(f"STATUS=Ready ({self.backend.value}, model {self.model})")
+        if self.model_registry is not None:
+            previous = registry_previous
+            self.model_registry.unpin(replaced_model, keep=preloader.transcriber)
+        self.model_swap.installed(preloader.model, preloader.transcriber, previous)
+
+        # Sessions between utterances would otherwise only switch when they next decode, and a paused
+        # dictation session may not do so for a long time
+        with self.client_manager.condition:
+            clients = list(self.client_manager.clients.values())
+        switched = sum(client.switch_model() for client in clients if isinstance(client, SwappableModelMixin))
+        if switched:
+            logging.info(f"Switched {switched} idle session(s) to model {preloader.model}")
+
+    def send_loading_status(self, websocket, options):
+        """Tells a client that connected during startup that its session waits for the model."""
+        logging.info(f"Client {options.get('uid')} waits for the model to finish loading")
+        websocket.send(json.dumps({"uid": options.get("uid"), "message": self.LOADING}))
+
+    def start_metrics(self, host, port):
+        """
+        Collects server metrics and serves them in Prometheus text format at ``http://host:port/metrics``.
+
+        Args:
+            host (str): The host address to bind the metrics endpoint.
+            port (int): The port of the metrics endpoint.
+        """
+        self.metrics = ServerMetrics()
+        InstrumentedMixin.METRICS = self.metrics
+
+        self.metrics.add_gauge("whisper_clients_active", "Clients with a backend session.",
+                               lambda: len(self.client_manager.clients))
+        self.metrics.add_gauge("whisper_clients_waiting", "Connected clients waiting to be admitted.",
+                               lambda: self.client_manager.waiting + len(self.client_manager.queue))
+        self.metrics.add_gauge("whisper_clients_max", "Configured --max_clients.",
+                               lambda: self.client_manager.max_clients)
+        self.metrics.add_gauge("whisper_clients_capacity", "Clients that may currently hold a slot.",
+                               lambda: self.client_manager.capacity())
+        self.metrics.add_gauge("whisper_server_ready", "1 once the model is loaded and warmed up.",
+                               lambda: int(self.ready.is_set()))
+        if self.inference_scheduler is not None:
+            scheduler = self.inference_scheduler
+            self.metrics.add_gauge("whisper_scheduler_batches_total", "Batches run by the inference scheduler.",
+                                   lambda: scheduler.get_stats()["batches"], kind="counter")
+            self.metrics.add_gauge("whisper_scheduler_requests_total", "Requests run by the inference scheduler.",
+                                   lambda: scheduler.get_stats()["requests"], kind="counter")
+        if self.hallucination_phrases is not None:
+            phrases = self.hallucination_phrases
+            self.metrics.add_gauge("whisper_hallucinations_dropped_total",
+                                   "Segments dropped for matching a hallucination phrase.",
+                                   lambda: phrases.dropped, kind="counter")
+        if self.worker_pool is not None:
+            pool = self.worker_pool
+            self.metrics.add_gauge("whisper_workers_alive", "Inference worker processes with a loaded model.",
+                                   lambda: sum(worker["alive"] for worker in pool.get_stats()))
+            self.metrics.add_gauge("whisper_worker_requests_total", "Requests run by the inference workers.",
+                                   lambda: sum(worker["requests"] for worker in pool.get_stats()), kind="counter")
+        if self.draft_model_name:
+            def decodes(tier):
+                return lambda: self.draft_model.get_stats()[f"{tier}_decodes"] if self.draft_model else 0
+            self.metrics.add_gauge("whisper_draft_decodes_total", "Audio windows decoded by the draft model only.",
+                                   decodes("draft"), kind="counter")
+            self.metrics.add_gauge("whisper_final_decodes_total",
+                                   "Audio windows decoded by the main model with --draft_model.",
+                                   decodes("final"), kind="counter")
+        if self.model_registry is not None:
+            registry = self.model_registry
+            self.metrics.add_gauge("whisper_models_loaded", "Models held by the model registry.",
+                                   lambda: len(registry.get_stats()["models"]))
+            self.metrics.add_gauge("whisper_model_memory_mb", "Estimated memory of the registered models in MB.",
+                                   lambda: registry.get_stats()["used_mb"])
+            self.metrics.add_gauge("whisper_model_evictions_total", "Idle models evicted to stay within the budget.",
+                                   lambda: registry.get_stats()["evictions"], kind="counter")
+        if self.resumable_sessions is not None:
+            resumable = self.resumable_sessions
+            self.metrics.add_gauge("whisper_sessions_disconnected",
+                                   "Sessions kept for their client to resume after a dropped connection.",
+                                   lambda: resumable.get_stats()["disconnected"])
+            self.metrics.add_gauge("whisper_sessions_resumed_total", "Sessions resumed on a new connection.",
+                                   lambda: resumable.get_stats()["resumed"], kind="counter")
+        translation = self.translation_service
+        self.metrics.add_gauge("whisper_translation_batches_total", "Batches run by the translation service.",
+                               lambda: translation.get_stats()["batches"], kind="counter")
+        self.metrics.add_gauge("whisper_translation_segments_total", "Segments translated by the translation service.",
+                               lambda: translation.get_stats()["segments"], kind="counter")
+        MetricsServer(self.metrics, host, port).start()
+
+    def instrument_model_lock(self):
+        """
+        Wraps the shared faster_whisper model lock to measure lock waits (metrics) and model busy time
+        (adaptive capacity).
+        """
+        load_monitor = self.client_manager.load_monitor
+        if not self.backend.is_faster_whisper() or (self.metrics is None and load_monitor is None):
+            return
+        from whisper_live.backend.faster_whisper_backend import ServeClientFasterWhisper
+        ServeClientFasterWhisper.SINGLE_MODEL_LOCK = TimedLock(
+            ServeClientFasterWhisper.SINGLE_MODEL_LOCK,
+            on_wait=self.metrics.record_lock_wait if self.metrics is not None else None,
+            on_hold=load_monitor.record_busy if load_monitor is not None else None,
+        )
+
+    def preload_model(self, faster_whisper_custom_model_path):
+        """
+        Loads and warms up the model, then marks the server ready and notifies systemd.
+
+        Runs in the background after the server started listening, so clients can query the status
+        and queue up for a session while the model loads. If preloading fails the server still
+        becomes ready and sessions try to load the model themselves, as without preloading.
+        With ``workers`` the model is loaded by the worker processes instead; if they fail to start,
+        inference falls back to the server process.
+
+        Args:
+            faster_whisper_custom_model_path (str): The faster_whisper model to load.
+        """
+        if self.worker_pool is not None:
+            sd_notify(f"STATUS=Starting {self.worker_pool.num_workers} inference workers")
+            try:
+                self.preload_info = self.worker_pool.run()
+            except Exception as e:
+                logging.error(f"Failed to start inference workers, running inference in-process: {e}")
+                self.worker_pool.stop()
+                self.worker_pool = None
+        if self.worker_pool is None and self.backend.is_faster_whisper() and faster_whisper_custom_model_path:
+            logging.info(f"Preloading Faster Whisper model: {faster_whisper_custom_model_path}")
+            sd_notify(f"STATUS=Loading model {faster_whisper_custom_model_path}")
+            preloader = ModelPreloader(
+                faster_whisper_custom_model_path,
+                self.cache_path,
+                single_model=self.single_model,
+                scheduler=self.inference_scheduler,
+            )
+            before = resident_mb()
+            try:
+                self.preload_info = preloader.run()
+            except Exception as e:
+                logging.error(f"Failed to preload model: {e}")
+                self.preload_error = str(e)
+            if self.model_registry is not None and preloader.transcriber is not None:
+                size_mb = self.model_registry.measured_mb(preloader.device, before, resident_mb())
+                self.model_registry.add(faster_whisper_custom_model_path, preloader.device, preloader.compute_type,
+                                        preloader.transcriber, size_mb=size_mb)
+        if self.draft_model_name and self.backend.is_faster_whisper():
+            logging.info(f"Loading draft model: {self.draft_model_name}")
+            sd_notify(f"STATUS=Loading draft model {self.draft_model_name}")
+            try:
+                self.draft_model = DraftModel.load(self.draft_model_name, self.cache_path)
+                if self.feature_cache:
+                    install_feature_cache(self.draft_model.transcriber)
+                DraftDecodingMixin.DRAFT = self.draft_model
+            except Exception as e:
+                logging.error(f"Failed to load draft model, decoding with the main model only: {e}")
+
+        self.set_ready()
+        if self.preload_error:
+            sd_notify(f"READY=1\nSTATUS=Preloading failed, loading the model per session: {self.preload_error}")
+        else:
+            sd_notify(f"READY=1\nSTATUS=Ready ({self.backend.value}, model {self.model})")
+        logging.info("Server is ready.")
+
+    def set_ready(self):
+        """Marks the server ready, also for connections waiting on the event loop."""
+        self.ready.set()
+        if self.ready_async is not None:
+            self.loop.call_soon_threadsafe(self.ready_async.set)
+
+    def start_preload(self, faster_whisper_custom_model_path):
+        threading.Thread(
+            target=self.preload_model, args=(faster_whisper_custom_model_path,), name="preload", daemon=True
+        ).start()
+
+    def reject_client(self, websocket):
+        """Closes the connection of a client that was turned away because the server is full."""
+        if self.metrics is not None:
+            self.metrics.record_rejected()
+        websocket.close()
+
+    async def wait_for_slot_async(self, websocket, bridge, options):
+        """
+        Asyncio counterpart of `ClientManager.wait_for_slot`, waiting on the event loop instead of a thread.
+
+        Args:
+            websocket: The ``websockets.asyncio`` connection of the client, used to send queue updates.
+            bridge (SyncWebSocketBridge): The synchronous wrapper the client is tracked by.
+            options (dict): The decoded options message sent by the client.
+
+        Returns:
+            bool: True once a slot is reserved for the client, False if it was turned away.
+        """
+        manager = self.client_manager
+        if manager.is_queue_full():
+            await websocket.send(manager.wait_status(options))
             return False
+        manager.enqueue(bridge)
+        last_position, last_update = None, 0.0
+        try:
+            while not manager.try_admit(bridge):
+                position = manager.queue_position(bridge)
+                if position != last_position or time.time() - last_update >= manager.QUEUE_UPDATE_INTERVAL:
+                    await websocket.send(manager.queue_status(options, position))
+                    last_position, last_update = position, time.time()
+                await asyncio.sleep(0.25)
+        except BaseException:
+            manager.leave_queue(bridge)
+            raise
+        return True
 
-    def process_audio_frames(self, websocket):
-        frame_np = self.get_audio_from_websocket(websocket)
+    def admit_client(self, session, options, faster_whisper_custom_model_path,
+                     whisper_tensorrt_path, trt_multilingual, trt_py_session=False):
+        """
+        Applies the client's options to its session and creates the backend client in the slot reserved
+        for it by the admission queue. The reservation is given back if no client could be created.
+
+        Args:
+            session (ClientSession): The session of the connecting client.
+            options (dict): The decoded options message sent by the client.
+
+        Returns:
+            bool: True if the client was admitted, False if the connection should not continue.
+        """
+        try:
+            return self.start_session(session, options, faster_whisper_custom_model_path,
+                                      whisper_tensorrt_path, trt_multilingual, trt_py_session=trt_py_session)
+        finally:
+            if not self.client_manager.get_client(session.websocket):
+                self.client_manager.release_reservation()
+
+    def start_session(self, session, options, faster_whisper_custom_model_path,
+                      whisper_tensorrt_path, trt_multilingual, trt_py_session=False):
+        # The backend and the client manager hold the resumable wrapper, so the session can move connections
+        if self.resumable_sessions is not None and options.get("resumable", False):
+            session.websocket = ResumableWebSocket(session.websocket)
+        websocket = session.websocket
+        session.use_vad = options.get('use_vad')
+
+        if "audio_encoding" in options:
+            try:
+                session.audio_decoder = AudioDecoder(options["audio_encoding"], sample_rate=self.RATE)
+            except ValueError as e:
+                logging.error(f"Rejecting client {options['uid']}: {e}")
+                websocket.send(json.dumps({"uid": options["uid"], "status": "ERROR", "message": str(e)}))
+                websocket.close()
+                return False
+            # Acknowledge before SERVER_READY so the client knows which encoding to stream.
+            websocket.send(json.dumps({
+                "uid": options["uid"],
+                "message": self.SESSION_CONFIG,
+                "audio_encoding": session.audio_decoder.encoding,
+            }))
+
+        if session.backend.is_tensorrt() or self.server_vad:
+            if self.vad_batcher is not None:
+                session.vad_batcher = self.vad_batcher
+            else:
+                session.vad_detector = VoiceActivityDetector(frame_rate=self.RATE)
+        self.initialize_client(session, options, faster_whisper_custom_model_path,
+                               whisper_tensorrt_path, trt_multilingual, trt_py_session=trt_py_session)
         client = self.client_manager.get_client(websocket)
+        if not client:
+            return False
+
+        # Kept-alive sessions start idle and are resumed by the client's first toggle.
+        if options.get("keep_alive", False):
+            session.keep_alive = True
+            session.paused = True
+            self.reset_client_stream(client)
+
+        if isinstance(websocket, ResumableWebSocket):
+            session.uid = options["uid"]
+            session.resume_token = self.resumable_sessions.new_token()
+            self.resumable_sessions.add(session)
+            websocket.send(json.dumps({
+                "uid": session.uid,
+                "message": self.RESUMABLE,
+                "resume_token": session.resume_token,
+                "grace_period": self.resumable_sessions.grace_period,
+            }))
+        return True
+
+    def resume_session(self, websocket, options):
+        """
+        Continues a session whose connection dropped on the client's new connection, in place of the
+        options handshake: ``{"uid": ..., "resume_token": ..., "last_segment": k}``.
+
+        The backend client kept transcribing the audio it had while the client was away, so nothing is
+        re-sent or re-initialized. The client gets ``SESSION_RESUMED`` with the seconds of audio the
+        server has received (the client continues streaming from there), then the transcript it missed:
+        delta clients everything after their first ``k`` finalized segments, other clients the usual
+        window of recent segments.
+
+        Args:
+            websocket: The new websocket (or websocket bridge) of the client.
+            options (dict): The decoded first message of the connection.
+
+        Returns:
+            ClientSession or None: The resumed session, None if it could not be resumed.
+        """
+        uid = options.get("uid")
+        session, previous = None, None
+        if self.resumable_sessions is not None:
+            session, previous = self.resumable_sessions.claim(uid, options.get("resume_token"))
+        client = self.client_manager.get_client(session.websocket) if session is not None else None
+        if not client:
+            logging.info(f"Client {uid} asked to resume a session that no longer exists")
+            websocket.send(json.dumps({"uid": uid, "status": "ERROR", "message": "Session cannot be resumed"}))
+            websocket.close()
+            return None
+        if previous is not None:
+            # The client noticed the drop first; don't wait for the old connection to close
+            threading.Thread(target=previous.close, daemon=True).start()
+
+        resumed = {
+            "uid": uid,
+            "message": self.SESSION_RESUMED,
+            "audio_offset": round(session.samples_received / self.RATE, 3),
+            "audio_encoding": session.audio_decoder.encoding,
+            "paused": session.paused,
+        }
+        encoder = session.segment_encoder
+        try:
+            if encoder is not None:
+                try:
+                    acknowledged = int(options.get("last_segment", 0))
+                except (TypeError, ValueError):
+                    acknowledged = 0
+                # Attached under the encoder's lock, so no backend delta gets between these two messages
+                with encoder.lock:
+                    resumed["seq"] = encoder.seq
+                    catch_up = {"uid": uid, "delta": encoder.catch_up(acknowledged)}
+                    session.websocket.attach(websocket, [json.dumps(resumed), json.dumps(catch_up)])
+            else:
+                session.websocket.attach(websocket, [json.dumps(resumed)])
+        except Exception:
+            # The new connection failed as well, keep the session for another attempt
+            self.resumable_sessions.release(session, None, keep=True)
+            raise
+        if encoder is None:
+            client.send_transcription_to_client(client.prepare_segments())
+        logging.info(f"Client {uid} resumed its session at {resumed['audio_offset']:.1f}s of audio")
+        return session
+
+    def end_connection(self, session, connection, dropped):
+        """
+        Decides what happens to a session once the receive loop of its connection ends. A resumable
+        session whose connection dropped is kept for the client to resume, and one that already moved to
+        a new connection is left to it.
+
+        Args:
+            session (ClientSession): The session of the connection.
+            connection: The websocket (or websocket bridge) whose receive loop ended.
+            dropped (bool): Whether the connection closed abnormally.
+
+        Returns:
+            bool: True if the session ended and its client should be cleaned up.
+        """
+        if not self.client_manager.get_client(session.websocket):
+            return False
+        if session.resume_token is None:
+            return True
+        return self.resumable_sessions.release(session, connection, keep=dropped)
+
+    def process_audio_frames(self, session):
+        message = session.websocket.recv()
+        if isinstance(message, str):
+            return self.handle_control_message(session, message)
+        return self.handle_audio_frame(session, self.decode_audio_frame(message, session.audio_decoder))
+
+    def handle_control_message(self, session, message):
+        """
+        Handles a text message sent by the client after the options handshake.
+
+        Kept-alive clients stay connected between utterances and send ``{"control": "pause"}`` when
+        dictation stops and ``{"control": "resume"}`` when it starts again. The backend client, its
+        model and its transcription thread stay warm in between; on resume only the audio buffer and
+        transcript are reset so the new utterance starts from a clean timeline.
+
+        Args:
+            session (ClientSession): The session the message belongs to.
+            message (str): The text message received from the client.
+
+        Returns:
+            bool: False if the client signalled the end of audio, True otherwise.
+        """
+        if message == "END_OF_AUDIO":
+            return self.handle_audio_frame(session, False)
+        try:
+            action = json.loads(message).get("control")
+        except (json.JSONDecodeError, AttributeError):
+            logging.warning(f"Ignoring malformed control message: {message[:100]}")
+            return True
+
+        client = self.client_manager.get_client(session.websocket)
+        if action == "pause":
+            session.paused = True
+            if session.backend.is_tensorrt():
+                client.set_eos(True)
+            reply = self.PAUSED
+        elif action == "resume":
+            self.reset_client_stream(client)
+            if session.segment_encoder is not None:
+                session.segment_encoder.reset()
+            self.client_manager.renew_client(session.websocket)
+            session.no_voice_activity_chunks = 0
+            session.samples_received = 0
+            session.paused = False
+            reply = self.RESUMED
+        else:
+            logging.warning(f"Unknown control action from client {client.client_uid}: {action}")
+            return True
+
+        session.websocket.send(json.dumps({"uid": client.client_uid, "message": reply}))
+        return True
+
+    def reset_client_stream(self, client):
+        """
+        Clears the audio buffer and transcript of a backend client while keeping its model and
+        transcription thread alive.
+
+        The buffer is reset to an empty array rather than None, so the idle transcription thread
+        sleeps waiting for audio instead of spinning.
+
+        Args:
+            client (ServeClientBase): The backend client to reset.
+        """
+        with client.lock:
+            client.frames_np = np.zeros(0, dtype=np.float32)
+            client.frames_offset = 0.0
+            client.timestamp_offset = 0.0
+        client.text = []
+        client.transcript = []
+        client.current_out = ""
+        client.prev_out = ""
+        client.same_output_count = 0
+        client.end_time_for_same_output = None
+
+    def handle_audio_frame(self, session, frame_np):
+        """
+        Hands a decoded audio frame to the session's backend client.
+
+        Args:
+            session (ClientSession): The session the frame belongs to.
+            frame_np (numpy.ndarray or bool): The decoded frame, or False at the end of audio.
+
+        Returns:
+            bool: False once the client has finished sending audio, True otherwise.
+        """
+        client = self.client_manager.get_client(session.websocket)
         if frame_np is False:
-            if self.backend.is_tensorrt():
+            if session.backend.is_tensorrt():
                 client.set_eos(True)
             return False
 
-        if self.backend.is_tensorrt():
-            voice_active = self.voice_activity(websocket, frame_np)
-            if voice_active:
-                self.no_voice_activity_chunks = 0
-                client.set_eos(False)
-            if self.use_vad and not voice_active:
+        if session.paused:
+            return True
+        session.samples_received += len(frame_np)
+
+        if session.vad_batcher is not None:
+            # Evaluated with the other sessions' frames on the next tick, see `on_vad_result`.
+            session.vad_batcher.submit(session, frame_np)
+            return True
+
+        if session.vad_detector is not None:
+            if not self.apply_voice_activity(session, client, self.voice_activity(session, frame_np)):
                 return True
 
         client.add_frames(frame_np)
         return True
 
+    def apply_voice_activity(self, session, client, voice_active):
+        """
+        Decides whether a frame is passed on to the backend, given its VAD verdict.
+
+        Args:
+            session (ClientSession): The session the frame belongs to.
+            client (ServeClientBase): The session's backend client.
+            voice_active (bool): Whether the frame contains speech.
+
+        Returns:
+            bool: True if the frame should be added to the client's audio buffer.
+        """
+        if self.metrics is not None:
+            self.metrics.record_vad(voice_active, dropped=not voice_active and session.use_vad)
+        if voice_active:
+            session.no_voice_activity_chunks = 0
+            if session.backend.is_tensorrt():
+                client.set_eos(False)
+            return True
+        return not session.use_vad
+
+    def on_vad_result(self, session, frame_np, voice_active):
+        """
+        Receives the verdict of the batched VAD for one frame and forwards or drops the frame.
+
+        Args:
+            session (ClientSession): The session the frame belongs to.
+            frame_np (numpy.ndarray): The evaluated audio frame.
+            voice_active (bool): Whether the frame contains speech.
+        """
+        client = self.client_manager.get_client(session.websocket)
+        if not client or session.paused:
+            return
+        self.update_voice_activity(session, voice_active)
+        if self.apply_voice_activity(session, client, voice_active):
+            client.add_frames(frame_np)
+
     def recv_audio(self,
                    websocket,   
                    backend: BackendType = BackendType.FASTER_WHISPER,
@@ -373,25 +1304,142 @@ class TranscriptionServer:
         Raises:
             Exception: If there is an error during the audio frame processing.
         """
-        self.backend = backend
-        if not self.handle_new_connection(websocket, faster_whisper_custom_model_path,
-                                          whisper_tensorrt_path, trt_multilingual, trt_py_session=trt_py_session):
+        session = self.handle_new_connection(ClientSession(websocket, backend), faster_whisper_custom_model_path,
+                                             whisper_tensorrt_path, trt_multilingual, trt_py_session=trt_py_session)
+        if session is None:
             return
 
+        dropped = False
         try:
-            while not self.client_manager.is_client_timeout(websocket):
-                if not self.process_audio_frames(websocket):
+            while not self.client_manager.is_client_timeout(session.websocket):
+                if not self.process_audio_frames(session):
                     break
-        except ConnectionClosed:
+        except ConnectionClosed as e:
+            dropped = isinstance(e, ConnectionClosedError)
             logging.info("Connection closed by client")
         except Exception as e:
             logging.error(f"Unexpected error: {str(e)}")
         finally:
-            if self.client_manager.get_client(websocket):
-                self.cleanup(websocket)
+            if self.end_connection(session, websocket, dropped):
+                self.cleanup(session.websocket)
                 websocket.close()
             del websocket
 
+    async def recv_audio_async(self,
+                               websocket,
+                               backend: BackendType = BackendType.FASTER_WHISPER,
+                               faster_whisper_custom_model_path=None,
+                               whisper_tensorrt_path=None,
+                               trt_multilingual=False,
+                               trt_py_session=False):
+        """
+        Asyncio counterpart of `recv_audio`.
+
+        Frames are received and handed to the backend on the event loop, so an idle connection costs
+        a coroutine instead of a blocked OS thread. Anything that may block for a noticeable time
+        (backend/model initialization, VAD inference, cleanup) runs on the server's executor, and so do
+        the session's transcription passes (see `ExecutorPassesMixin`).
+
+        Args:
+            websocket: The ``websockets.asyncio`` connection for the client.
+            backend (BackendType): The backend to run the server with.
+            faster_whisper_custom_model_path (str): path to custom faster whisper model.
+            whisper_tensorrt_path (str): Required for tensorrt backend.
+            trt_multilingual(bool): Only used for tensorrt, True if multilingual model.
+        """
+        from whisper_live.websocket_bridge import SyncWebSocketBridge
+
+        loop = asyncio.get_running_loop()
+        bridge = SyncWebSocketBridge(websocket, loop)
+        session = ClientSession(bridge, backend)
+        try:
+            logging.info("New client connected")
+            options = json.loads(await websocket.recv())
+            reply = self.status_reply(options)
+            if reply is not None:
+                await websocket.send(reply)
+                return
+            if "resume_token" in options:
+                session = await loop.run_in_executor(self.executor, self.resume_session, bridge, options)
+                admitted = session is not None
+            else:
+                if not self.ready.is_set():
+                    self.send_loading_status(bridge, options)
+                    self.client_manager.update_waiting(1)
+                    try:
+                        await self.ready_async.wait()
+                    finally:
+                        self.client_manager.update_waiting(-1)
+                if not await self.wait_for_slot_async(websocket, bridge, options):
+                    self.reject_client(bridge)
+                    return
+                admitted = await loop.run_in_executor(
+                    self.executor,
+                    functools.partial(
+                        self.admit_client, session, options, faster_whisper_custom_model_path,
+                        whisper_tensorrt_path, trt_multilingual, trt_py_session=trt_py_session
+                    )
+                )
+        except json.JSONDecodeError:
+            logging.error("Failed to decode JSON from client")
+            return
+        except ConnectionClosed:
+            logging.info("Connection closed by client")
+            return
+        except Exception as e:
+            logging.error(f"Error during new connection initialization: {str(e)}")
+            return
+        if not admitted:
+            return
+
+        dropped = False
+        try:
+            while not self.client_manager.is_client_timeout(session.websocket):
+                message = await websocket.recv()
+                if isinstance(message, str):
+                    if not self.handle_control_message(session, message):
+                        break
+                    continue
+                frame_np = self.decode_audio_frame(message, session.audio_decoder)
+                if session.vad_detector is not None and frame_np is not False:
+                    keep_going = await loop.run_in_executor(
+                        self.executor, self.handle_audio_frame, session, frame_np
+                    )
+                else:
+                    keep_going = self.handle_audio_frame(session, frame_np)
+                if not keep_going:
+                    break
+        except ConnectionClosed as e:
+            dropped = isinstance(e, ConnectionClosedError)
+            logging.info("Connection closed by client")
+        except Exception as e:
+            logging.error(f"Unexpected error: {str(e)}")
+        finally:
+            if self.end_connection(session, bridge, dropped):
+                await loop.run_in_executor(self.executor, self.cleanup, session.websocket)
+                await websocket.close()
+
+    async def serve_async(self, host, port, handler, on_listening=None):
+        """
+        Serves websocket connections on an asyncio event loop until cancelled.
+
+        Args:
+            host (str): The host address to bind the server.
+            port (int): The port number to bind the server.
+            handler: Coroutine function handling a single connection.
+            on_listening (callable, optional): Called once the server accepts connections.
+        """
+        from websockets.asyncio.server import serve as serve_asyncio
+
+        self.loop = asyncio.get_running_loop()
+        self.ready_async = asyncio.Event()
+        if self.ready.is_set():
+            self.ready_async.set()
+        async with serve_asyncio(handler, host, port) as server:
+            if on_listening is not None:
+                on_listening()
+            await server.serve_forever()
+
     def run(self,
             host,
             port=9090,
@@ -403,86 +1451,181 @@ class TranscriptionServer:
             single_model=False,
             max_clients=4,
             max_connection_time=600,
-            cache_path="~/.cache/whisper-live/"):
+            cache_path="~/.cache/whisper-live/",
+            use_asyncio=False,
+            batch_inference=False,
+            batch_max_size=8,
+            batch_window_ms=50,
+            ring_buffer=True,
+            server_vad=False,
+            batch_vad=False,
+            metrics_port=None,
+            max_queue=16,
+            adaptive_capacity=False,
+            target_utilization=0.8,
+            workers=0,
+            hallucination_filter=True,
+            hallucination_dir=None,
+            draft_model=None,
+            feature_cache=True,
+            translation_batch_size=16,
+            translation_window_ms=100,
+            model_memory_mb=None,
+            admin_token=None,
+            resume_grace=30):
         """
         Run the transcription server.
 
         Args:
             host (str): The host address to bind the server.
             port (int): The port number to bind the server.
+            use_asyncio (bool): Serve connections from a single asyncio event loop and run
+                inference on a thread pool executor instead of one thread per connection.
+            batch_inference (bool): Route faster_whisper inference of all sessions through a central
+                scheduler that decodes pending audio windows together in micro-batches.
+            batch_max_size (int): Maximum number of audio windows per batch.
+            batch_window_ms (int): Maximum time in milliseconds to wait for a batch to fill.
+            ring_buffer (bool): Store each session's audio in a preallocated ring buffer instead of
+                growing a NumPy array on every frame.
+            server_vad (bool): Run VAD on incoming frames for every backend, not only TensorRT, and drop
+                silent frames of clients that enabled ``use_vad`` before they reach the backend.
+            batch_vad (bool): Evaluate VAD for all sessions with one batched model call per tick instead
+                of one model per session.
+            metrics_port (int): Serve Prometheus metrics over HTTP on this port. Disabled if None.
+            max_queue (int): Maximum number of clients waiting for a slot before new ones are turned away.
+            adaptive_capacity (bool): Admit clients while the measured model load stays below
+                ``target_utilization`` instead of a fixed ``max_clients`` (which becomes the upper bound).
+            target_utilization (float): Share of time the shared model may be busy with adaptive capacity.
+            workers (int): Run faster_whisper inference in this many worker processes, each with its own
+                model replica, instead of the server process. Disabled if 0.
+            hallucination_filter (bool): Drop segments matching a known hallucination phrase of the
+                session's language before they are sent.
+            hallucination_dir (str): Directory of ``<language>.txt`` phrase files. Defaults to the
+                phrase files shipped with the server.
+            draft_model (str): A small faster_whisper model that decodes partial hypotheses, leaving
+                the main model to the segments about to be completed. Disabled if None.
+            feature_cache (bool): Reuse each session's mel frames and encoder output across re-decodes
+                of a growing window (faster_whisper without workers or batch inference).
+            translation_batch_size (int): Maximum number of segments the shared translation service
+                translates together.
+            translation_window_ms (int): Maximum time in milliseconds to wait for a translation batch to fill.
+            model_memory_mb (float): Share faster_whisper models between sessions through a registry that
+                loads the model each client asks for on demand and evicts idle models to keep their memory
+                within this budget. Disabled if None.
+            admin_token (str): Accept ``{"query": "reload"}`` messages that carry this token. SIGHUP
+                reloads the current model regardless. Websocket reloads are refused if None.
+            resume_grace (float): Seconds the session of a resumable client is kept after its connection
+                dropped, for the client to reconnect and resume it. Disabled if 0.
         """
         self.cache_path = cache_path
-        self.client_manager = ClientManager(max_clients, max_connection_time)
+        self.feature_cache = feature_cache
+        if resume_grace > 0:
+            self.resumable_sessions = ResumableSessions(
+                resume_grace, on_expire=lambda session: self.cleanup(session.websocket)
+            )
+        self.translation_service = TranslationService(max_batch_size=translation_batch_size,
+                                                      batch_window_ms=translation_window_ms)
+        if draft_model and backend == "faster_whisper":
+            self.draft_model_name = draft_model
+        elif draft_model:
+            logging.warning("A draft model needs the faster_whisper backend, decoding with the main model only.")
+        self.ring_buffer = ring_buffer
+        if hallucination_filter:
+            self.hallucination_phrases = PhraseLibrary(hallucination_dir)
+            HallucinationFilterMixin.PHRASES = self.hallucination_phrases
+        self.server_vad = server_vad
+        if batch_vad:
+            from whisper_live.vad_batch import BatchedVoiceActivityDetector
+            self.vad_batcher = BatchedVoiceActivityDetector(self.on_vad_result, frame_rate=self.RATE)
+        if workers > 0 and backend == "faster_whisper" and faster_whisper_custom_model_path:
+            from whisper_live.worker_pool import ModelWorkerPool, PooledServeClientFasterWhisper
+            self.worker_pool = ModelWorkerPool(workers, faster_whisper_custom_model_path, cache_path,
+                                               max_sessions=max_clients)
+            PooledServeClientFasterWhisper.POOL = self.worker_pool
+            if batch_inference:
+                logging.warning("Batched inference is not used with inference workers.")
+                batch_inference = False
+        elif workers > 0:
+            logging.warning("Inference workers need the faster_whisper backend with a model, running in-process.")
+        if model_memory_mb and backend == "faster_whisper" and self.worker_pool is None:
+            self.model_registry = ModelRegistry(model_memory_mb)
+            RegistryModelMixin.REGISTRY = self.model_registry
+        elif model_memory_mb:
+            logging.warning("The model registry needs the faster_whisper backend without workers, "
+                            "ignoring --model_memory_mb.")
+        if batch_inference and backend == "faster_whisper":
+            from whisper_live.batch_scheduler import InferenceScheduler, ScheduledServeClientFasterWhisper
+            self.inference_scheduler = InferenceScheduler(batch_max_size, batch_window_ms)
+            ScheduledServeClientFasterWhisper.SCHEDULER = self.inference_scheduler
+            self.inference_scheduler.start()
+        if backend == "faster_whisper" and self.worker_pool is None:
+            self.model_swap = ModelSwap(cache_path, scheduler=self.inference_scheduler)
+            SwappableModelMixin.SWAP = self.model_swap
+            self.admin_token = admin_token
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGHUP, lambda signum, frame: self.reload_model())
+        self.client_manager = ClientManager(max_clients, max_connection_time, max_queue=max_queue)
         if single_model:
             if faster_whisper_custom_model_path or whisper_tensorrt_path:
                 self.single_model = True
-                if faster_whisper_custom_model_path and backend == "faster_whisper":
-                    logging.info(f"Preloading Faster Whisper model: {faster_whisper_custom_model_path}")
-                    from whisper_live.backend.faster_whisper_backend import ServeClientFasterWhisper
-                    import torch
-                    device = "cuda" if torch.cuda.is_available() else "cpu"
-                    # Initializing a dummy client just to trigger model load
-                    ServeClientFasterWhisper.SINGLE_MODEL_LOCK.acquire()
-                    if ServeClientFasterWhisper.SINGLE_MODEL is None:
-                        # We create a temporary instance or just call the class method if we refactor it.
-                        # For now, let's just use the existing logic by creating a mock-ish instance or 
-                        # just setting the SINGLE_MODEL directly.
-                        from whisper_live.transcriber.transcriber_faster_whisper import WhisperModel
-                        
-                        # We need to compute the precision same way as in backend
-                        if device == "cuda":
-                            major, _ = torch.cuda.get_device_capability(device)
-                            compute_type = "float16" if major >= 7 else "float32"
-                        else:
-                            compute_type = "int8"
-                        
-                        # Logic to handle named models vs paths (simplified)
-                        model_to_load = faster_whisper_custom_model_path
-                        # Note: we might need snapshot_download here if we want to be fully compatible with backend logic
-                        # but the backend will handle it on first connection anyway if we don't do it here.
-                        # To REALLY preload, we should do it here.
-                        
-                        try:
-                            ServeClientFasterWhisper.SINGLE_MODEL = WhisperModel(
-                                model_to_load,
-                                device=device,
-                                compute_type=compute_type,
-                                local_files_only=False,
-                            )
-                            logging.info("Model preloaded successfully.")
-                        except Exception as e:
-                            logging.error(f"Failed to preload model: {e}")
-                    ServeClientFasterWhisper.SINGLE_MODEL_LOCK.release()
             else:
                 logging.info("Single model mode currently only works with custom models.")
         if not BackendType.is_valid(backend):
             raise ValueError(f"{backend} is not a valid backend type. Choose backend from {BackendType.valid_types()}")
+        self.backend = BackendType(backend)
+        self.model = whisper_tensorrt_path if self.backend.is_tensorrt() else faster_whisper_custom_model_path
+        if adaptive_capacity:
+            if self.backend.is_faster_whisper() and self.single_model and self.worker_pool is None:
+                from whisper_live.admission import InferenceLoadMonitor
+                self.client_manager.load_monitor = InferenceLoadMonitor(target_utilization)
+            else:
+                logging.warning("Adaptive capacity needs the shared faster_whisper model, using --max_clients.")
+        if metrics_port is not None:
+            self.start_metrics(host, metrics_port)
+        self.instrument_model_lock()
+        handler_kwargs = dict(
+            backend=self.backend,
+            faster_whisper_custom_model_path=faster_whisper_custom_model_path,
+            whisper_tensorrt_path=whisper_tensorrt_path,
+            trt_multilingual=trt_multilingual,
+            trt_py_session=trt_py_session,
+        )
+        if use_asyncio:
+            # Transcription passes take up to one worker per session, the rest is left for
+            # initialization, VAD and cleanup.
+            self.executor = ThreadPoolExecutor(max_workers=max(4, max_clients) + max_clients,
+                                               thread_name_prefix="inference")
+            ExecutorPassesMixin.EXECUTOR = self.executor
+            logging.info("Serving connections from an asyncio event loop.")
+            try:
+                asyncio.run(self.serve_async(
+                    host, port, functools.partial(self.recv_audio_async, **handler_kwargs),
+                    on_listening=functools.partial(self.start_preload, faster_whisper_custom_model_path)
+                ))
+            finally:
+                ExecutorPassesMixin.EXECUTOR = None
+                self.executor.shutdown(wait=False)
+            return
         with serve(
-            functools.partial(
-                self.recv_audio,
-                backend=BackendType(backend),
-                faster_whisper_custom_model_path=faster_whisper_custom_model_path,
-                whisper_tensorrt_path=whisper_tensorrt_path,
-                trt_multilingual=trt_multilingual,
-                trt_py_session=trt_py_session,
-            ),
+            functools.partial(self.recv_audio, **handler_kwargs),
             host,
             port
         ) as server:
+            self.start_preload(faster_whisper_custom_model_path)
             server.serve_forever()
 
-    def voice_activity(self, websocket, frame_np):
+    def voice_activity(self, session, frame_np):
         """
         Evaluates the voice activity in a given audio frame and manages the state of voice activity detection.
 
-        This method uses the configured voice activity detection (VAD) model to assess whether the given audio frame
+        This method uses the session's voice activity detection (VAD) model to assess whether the given audio frame
         contains speech. If the VAD model detects no voice activity for more than three consecutive frames,
-        it sets an end-of-speech (EOS) flag for the associated client. This method aims to efficiently manage
-        speech detection to improve subsequent processing steps.
+        it sets an end-of-speech (EOS) flag for the associated client. Silent frames are only counted, never
+        waited on, so the receive loop keeps draining the connection.
 
         Args:
-            websocket: The websocket associated with the current client. Used to retrieve the client object
-                    from the client manager for state management.
+            session (ClientSession): The session of the current client. Holds the VAD detector and
+                    silence counter, and is used to retrieve the client object from the client manager.
             frame_np (numpy.ndarray): The audio frame to be analyzed. This should be a NumPy array containing
                                     the audio data for the current frame.
 
@@ -491,13 +1634,25 @@ class TranscriptionServer:
                 after detecting no voice activity for more than three consecutive frames, it also triggers the
                 end-of-speech (EOS) flag for the client.
         """
-        if not self.vad_detector(frame_np):
-            self.no_voice_activity_chunks += 1
-            if self.no_voice_activity_chunks > 3:
-                client = self.client_manager.get_client(websocket)
-                if not client.eos:
+        return self.update_voice_activity(session, session.vad_detector(frame_np))
+
+    def update_voice_activity(self, session, voice_active):
+        """
+        Updates the session's silence counter with a VAD verdict and sets EOS after sustained silence.
+
+        Args:
+            session (ClientSession): The session of the current client.
+            voice_active (bool): Whether the latest frame contains speech.
+
+        Returns:
+            bool: The verdict, unchanged.
+        """
+        if not voice_active:
+            session.no_voice_activity_chunks += 1
+            if session.no_voice_activity_chunks > 3 and session.backend.is_tensorrt():
+                client = self.client_manager.get_client(session.websocket)
+                if client and not client.eos:
                     client.set_eos(True)
-                time.sleep(0.1)    # Sleep 100m; wait some voice activity.
             return False
         return True
 
@@ -510,11 +1665,7 @@ class TranscriptionServer:
         """
         client = self.client_manager.get_client(websocket)
         if client:
-            if hasattr(client, 'translation_client') and client.translation_client:
-                client.translation_client.cleanup()
-                
-            # Wait for translation thread to finish
-            if hasattr(client, 'translation_thread') and client.translation_thread:
-                client.translation_thread.join(timeout=2.0)
+            if getattr(client, "translation_session", None) is not None:
+                client.translation_session.close()
             self.client_manager.remove_client(websocket)
 
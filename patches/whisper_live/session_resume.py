@@ -0,0 +1,186 @@
+import hmac
+import logging
+import secrets
+import threading
+
+
+class ResumableWebSocket:
+    """
+    Connection of a resumable session, which can be moved to a new websocket when the client reconnects.
+
+    The backend client, the segment encoder and the client manager all hold this wrapper instead of the
+    websocket, so re-attaching it is all that is needed to continue a session on a new connection.
+    While detached, messages are dropped: the transcript keeps growing on the server and the client
+    catches up when it resumes.
+    """
+
+    def __init__(self, websocket):
+        """
+        Args:
+            websocket: The websocket (or websocket bridge) of the client.
+        """
+        self.websocket = websocket
+        self.lock = threading.Lock()
+
+    def send(self, message):
+        with self.lock:
+            if self.websocket is None:
+                return None
+            return self.websocket.send(message)
+
+    def recv(self, *args, **kwargs):
+        return self.websocket.recv(*args, **kwargs)
+
+    def close(self):
+        websocket = self.websocket
+        if websocket is not None:
+            return websocket.close()
+        return None
+
+    def is_attached_to(self, websocket):
+        return self.websocket is websocket
+
+    def detach(self):
+        """
+        Returns:
+            The websocket the session was attached to.
+        """
+        with self.lock:
+            websocket, self.websocket = self.websocket, None
+        return websocket
+
+    def attach(self, websocket, messages=()):
+        """
+        Continues the session on a new connection.
+
+        Args:
+            websocket: The client's new websocket (or websocket bridge).
+            messages (iterable, optional): Sent first, before any message of the backend.
+        """
+        with self.lock:
+            for message in messages:
+                websocket.send(message)
+            self.websocket = websocket
+
+    def __getattr__(self, name):
+        websocket = self.__dict__.get("websocket")
+        if websocket is None:
+            raise AttributeError(name)
+        return getattr(websocket, name)
+
+
+class ResumableSessions:
+    """
+    The resumable sessions of the server, by client ``uid``.
+
+    When the connection of a resumable session drops, the session is kept for ``grace_period`` seconds
+    with its backend client, audio buffer and transcript. A client that reconnects within that time with
+    its ``uid`` and resume token gets the session back on the new connection; otherwise the session is
+    cleaned up like any other.
+    """
+
+    def __init__(self, grace_period, on_expire):
+        """
+        Args:
+            grace_period (float): Seconds a disconnected session is kept.
+            on_expire (callable): Called with the `ClientSession` when its grace period ends.
+        """
+        self.grace_period = grace_period
+        self.on_expire = on_expire
+        self.sessions = {}
+        self.timers = {}
+        self.lock = threading.Lock()
+        self.resumed = 0
+        self.expired = 0
+
+    @staticmethod
+    def new_token():
+        return secrets.token_urlsafe(24)
+
+    def add(self, session):
+        """Makes a session resumable. A session the ``uid`` had before can no longer be resumed."""
+        with self.lock:
+            self.sessions[session.uid] = session
+
+    def release(self, session, connection, keep):
+        """
+        Called when the receive loop of one of the session's connections ends.
+
+        Args:
+            session (ClientSession): The resumable session.
+            connection: The websocket (or websocket bridge) whose receive loop ended.
+            keep (bool): Keep the session for the client to resume, e.g. because its connection dropped.
+
+        Returns:
+            bool: True if the session ended and should be cleaned up, False if it is kept or was already
+            moved to a new connection.
+        """
+        with self.lock:
+            if not session.websocket.is_attached_to(connection):
+                return False
+            if not keep or self.sessions.get(session.uid) is not session:
+                self.forget(session)
+                return True
+            session.websocket.detach()
+            timer = threading.Timer(self.grace_period, lambda: self.expire(session, timer))
+            timer.daemon = True
+            self.timers[session] = timer
+        timer.start()
+        logging.info(f"Connection of client {session.uid} lost, keeping its session for {self.grace_period:g}s")
+        return False
+
+    def forget(self, session):
+        if self.sessions.get(session.uid) is session:
+            del self.sessions[session.uid]
+        timer = self.timers.pop(session, None)
+        if timer is not None:
+            timer.cancel()
+
+    def expire(self, session, timer):
+        with self.lock:
+            if self.timers.get(session) is not timer:
+                return
+            self.forget(session)
+            self.expired += 1
+        logging.info(f"Session of client {session.uid} was not resumed in time")
+        self.on_expire(session)
+
+    def claim(self, uid, token):
+        """
+        Hands a session over to a reconnecting client. A session whose previous connection hasn't been
+        noticed as dropped yet is detached from it.
+
+        Args:
+            uid (str): The client's ``uid``.
+            token (str): The resume token the client was given.
+
+        Returns:
+            tuple: The `ClientSession` and its previous connection if still attached (to be closed), or
+            ``(None, None)`` if there is no session for this ``uid`` and token.
+        """
+        if not isinstance(uid, str) or not isinstance(token, str):
+            return None, None
+        with self.lock:
+            session = self.sessions.get(uid)
+            if session is None or not hmac.compare_digest(session.resume_token, token):
+                return None, None
+            timer = self.timers.pop(session, None)
+            if timer is not None:
+                timer.cancel()
+            previous = session.websocket.detach()
+            self.resumed += 1
+        return session, previous
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Resumable and currently disconnected sessions, and how many were resumed or expired.
+        """
+        with self.lock:
+            return {
+                "grace_period": self.grace_period,
+                "sessions": len(self.sessions),
+                "disconnected": len(self.timers),
+                "resumed": self.resumed,
+                "expired": self.expired,
+            }
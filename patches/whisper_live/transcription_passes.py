@@ -0,0 +1,113 @@
+import logging
+import threading
+
+from whisper_live.backend.base import ServeClientBase
+
+
+class ExecutorPassesMixin:
+    """
+    Runs a session's transcription on a shared executor instead of its own ``speech_to_text`` thread.
+
+    ``ServeClientBase.speech_to_text`` loops on a thread per session for as long as the session lives,
+    even while no audio arrives. Here each pass of that loop is a task on `EXECUTOR`, submitted when a
+    frame is added: a pass decodes the pending audio once and resubmits itself while there is a window
+    to decode (an unchanged window is decoded again, as in the loop, until its segment is completed).
+    A session without pending audio holds no thread, and at most one pass per session is queued or
+    running at a time.
+
+    The thread the backend starts in ``__init__`` returns right away.
+    """
+    EXECUTOR = None
+
+    def speech_to_text(self):
+        if self.EXECUTOR is None:
+            super().speech_to_text()
+
+    def add_frames(self, frame_np):
+        super().add_frames(frame_np)
+        if self.EXECUTOR is not None:
+            self.schedule_pass()
+
+    @property
+    def pass_lock(self):
+        lock = self.__dict__.get("_pass_lock")
+        if lock is None:
+            lock = self.__dict__.setdefault("_pass_lock", threading.Lock())
+        return lock
+
+    def schedule_pass(self):
+        """Submits a transcription pass, or has the queued or running one followed by another."""
+        with self.pass_lock:
+            if self.__dict__.get("_pass_scheduled"):
+                self.__dict__["_pass_again"] = True
+                return
+            self.__dict__["_pass_scheduled"] = True
+            self.__dict__["_pass_again"] = False
+        self.EXECUTOR.submit(self.run_pass)
+
+    def run_pass(self):
+        decoded = False
+        try:
+            decoded = self.transcription_pass()
+        finally:
+            with self.pass_lock:
+                again = (decoded or self.__dict__["_pass_again"]) and not self.exit
+                self.__dict__["_pass_scheduled"] = again
+                self.__dict__["_pass_again"] = False
+        if again:
+            self.EXECUTOR.submit(self.run_pass)
+
+    def transcription_pass(self):
+        """
+        One iteration of ``ServeClientBase.speech_to_text``, without its sleeps.
+
+        Returns:
+            bool: True if a window was processed and the session should be passed again.
+        """
+        if self.exit or self.frames_np is None:
+            return False
+        if self.clip_audio:
+            self.clip_audio_if_no_valid_segment()
+
+        input_bytes, duration = self.get_audio_chunk_for_processing()
+        if duration < 1.0:
+            return False
+
+        try:
+            input_sample = input_bytes.copy()
+            result = self.transcribe_audio(input_sample)
+
+            if result is None or self.language is None:
+                self.timestamp_offset += duration
+                return True
+
+            self.handle_transcription_output(result, duration)
+            return True
+        except Exception as e:
+            # The next frame schedules a new pass, rather than retrying right away
+            logging.error(f"[ERROR]: Failed to transcribe audio chunk: {e}")
+            return False
+
+
+_EXECUTOR_PASSES_CLASSES = {}
+
+
+def executor_passes(client_class):
+    """
+    Returns a subclass of the given backend client class that transcribes on `ExecutorPassesMixin.EXECUTOR`.
+
+    Backends with their own ``speech_to_text`` loop (TensorRT) are returned unchanged.
+
+    Args:
+        client_class (type): A ``ServeClientBase`` subclass.
+
+    Returns:
+        type: The (cached) subclass, or ``client_class``.
+    """
+    if client_class.speech_to_text is not ServeClientBase.speech_to_text:
+        return client_class
+    if client_class not in _EXECUTOR_PASSES_CLASSES:
+        _EXECUTOR_PASSES_CLASSES[client_class] = type(
+            f"ExecutorPasses{client_class.__name__}", (ExecutorPassesMixin, client_class), {}
+        )
+    return _EXECUTOR_PASSES_CLASSES[client_class]
@@ -0,0 +1,257 @@
+import json
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+
+
+class TranslationSession:
+    """
+    A session's handle on the shared `TranslationService`.
+
+    The backends use it as their ``translation_queue``: completed segments passed to `put` are queued
+    for the service, which sends the session's recent translated segments back over its websocket.
+    """
+
+    def __init__(self, service, client_uid, websocket, target_language="fr", send_last_n_segments=10):
+        """
+        Args:
+            service (TranslationService): The server's translation service.
+            client_uid (str): Unique identifier of the client.
+            websocket: The connection translated segments are sent to.
+            target_language (str): Language code to translate into.
+            send_last_n_segments (int): Number of recent translated segments to send.
+        """
+        self.service = service
+        self.client_uid = client_uid
+        self.websocket = websocket
+        self.target_language = target_language
+        self.send_last_n_segments = send_last_n_segments
+        self.translated_segments = []
+        self.closed = False
+
+    def put(self, segment, block=True, timeout=None):
+        """Queues a segment for translation, with the ``queue.Queue.put`` signature the backends call."""
+        if not self.closed and segment.get("completed", False):
+            self.service.submit(self, segment)
+
+    def close(self):
+        """Stops sending translations; segments still queued for this session are dropped."""
+        self.closed = True
+        self.translated_segments = []
+
+    def send(self, translated_segment):
+        self.translated_segments.append(translated_segment)
+        try:
+            self.websocket.send(json.dumps({
+                "uid": self.client_uid,
+                "translated_segments": self.translated_segments[-self.send_last_n_segments:],
+            }))
+        except Exception as e:
+            logging.error(f"[ERROR]: Sending translation data to client: {e}")
+
+
+class TranslationService:
+    """
+    Translates the completed segments of all sessions on one thread with one translation model.
+
+    The thread waits for the first segment, keeps collecting segments for at most ``batch_window_ms``
+    (or until ``max_batch_size`` is reached), groups them by target language and translates each group
+    with one ``generate`` call. The model is loaded on first use and shared by all target languages:
+    SMaLL-100 selects the language through the tokenizer's target language token.
+    """
+    STATS_LOG_INTERVAL = 60.0
+
+    def __init__(self, model_name="alirezamsh/small100", max_batch_size=16, batch_window_ms=100):
+        """
+        Args:
+            model_name (str): Translation model to load. Defaults to SMaLL-100.
+            max_batch_size (int): Maximum number of segments translated together. Defaults to 16.
+            batch_window_ms (int): Maximum time to wait for a batch to fill after the first segment
+                arrived. Defaults to 100 ms.
+        """
+        self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window_ms / 1000.0
+        self.segments = queue.Queue()
+        self.exit = False
+        self.thread = None
+        self.start_lock = threading.Lock()
+
+        self.model = None
+        self.tokenizer = None
+        self.device = None
+        self.load_error = None
+
+        self.stats_lock = threading.Lock()
+        self.languages = Counter()
+        self.total_batches = 0
+        self.total_segments = 0
+        self.total_seconds = 0.0
+        self.last_stats_log = time.monotonic()
+
+    def start(self):
+        with self.start_lock:
+            if self.thread is not None:
+                return
+            self.thread = threading.Thread(target=self.run, name="translation", daemon=True)
+            self.thread.start()
+        logging.info(f"Translation service started (max_batch_size={self.max_batch_size}, "
+                     f"batch_window={self.batch_window * 1000:.0f}ms)")
+
+    def stop(self):
+        self.exit = True
+        if self.thread is not None:
+            self.thread.join(timeout=5.0)
+
+    def open_session(self, client_uid, websocket, target_language="fr", send_last_n_segments=10):
+        """
+        Returns:
+            TranslationSession: The handle to pass to the backend as its ``translation_queue``.
+        """
+        self.start()
+        return TranslationSession(self, client_uid, websocket, target_language, send_last_n_segments)
+
+    def submit(self, session, segment):
+        self.segments.put((session, segment))
+
+    def collect_batch(self):
+        """
+        Waits for the first segment and gathers more until the batch is full or the window expires.
+
+        Returns:
+            list: The collected ``(session, segment)`` pairs of open sessions, empty if nothing arrived.
+        """
+        try:
+            batch = [self.segments.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.segments.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return [(session, segment) for session, segment in batch if not session.closed]
+
+    def run(self):
+        while not self.exit:
+            batch = self.collect_batch()
+            if not batch:
+                continue
+            groups = {}
+            for session, segment in batch:
+                groups.setdefault(session.target_language, []).append((session, segment))
+            for language, items in groups.items():
+                started = time.monotonic()
+                translations = self.translate([segment.get("text", "") for _, segment in items], language)
+                self.record_batch(language, len(items), time.monotonic() - started)
+                for (session, segment), text in zip(items, translations):
+                    if session.closed:
+                        continue
+                    session.send({
+                        "start": segment["start"],
+                        "end": segment["end"],
+                        "text": text,
+                        "completed": True,
+                        "target_language": language,
+                    })
+
+    def load_model(self):
+        """
+        Loads the translation model and tokenizer once. If loading fails, segments are sent untranslated.
+
+        Returns:
+            bool: True if the model is available.
+        """
+        if self.model is not None:
+            return True
+        if self.load_error is not None:
+            return False
+        try:
+            import torch
+            from transformers import M2M100ForConditionalGeneration
+            from whisper_live.backend.tokenization_small100 import SMALL100Tokenizer
+
+            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            logging.info(f"Loading translation model on device: {self.device}")
+            self.model = M2M100ForConditionalGeneration.from_pretrained(self.model_name).to(self.device)
+            self.tokenizer = SMALL100Tokenizer.from_pretrained(self.model_name)
+            logging.info("Translation model loaded successfully.")
+            return True
+        except Exception as e:
+            logging.error(f"Failed to load translation model: {e}")
+            self.load_error = str(e)
+            self.model = None
+            return False
+
+    def translate(self, texts, language):
+        """
+        Translates several texts into one language with a single ``generate`` call.
+
+        Args:
+            texts (list): The texts to translate.
+            language (str): The target language code.
+
+        Returns:
+            list: The translations, or the original text for empty texts and failed batches.
+        """
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        if not indices or not self.load_model():
+            return texts
+        try:
+            import torch
+
+            self.tokenizer.tgt_lang = language
+            encoded = self.tokenizer(
+                [texts[i] for i in indices], return_tensors="pt", padding=True
+            ).to(self.device)
+            with torch.no_grad():
+                generated = self.model.generate(**encoded)
+            output = self.tokenizer.batch_decode(generated, skip_special_tokens=True)
+        except Exception as e:
+            logging.error(f"Translation of {len(indices)} segments into '{language}' failed: {e}")
+            return texts
+        translations = list(texts)
+        for i, text in zip(indices, output):
+            translations[i] = text
+        return translations
+
+    def record_batch(self, language, size, seconds):
+        now = time.monotonic()
+        with self.stats_lock:
+            self.languages[language] += size
+            self.total_batches += 1
+            self.total_segments += size
+            self.total_seconds += seconds
+
+        if now - self.last_stats_log >= self.STATS_LOG_INTERVAL:
+            self.last_stats_log = now
+            stats = self.get_stats()
+            logging.info(
+                f"Translation service: {stats['batches']} batches, mean size {stats['mean_batch_size']:.2f}, "
+                f"{stats['segments']} segments"
+            )
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Batch and segment counts, segments per target language and translation time.
+        """
+        with self.stats_lock:
+            batches = self.total_batches
+            segments = self.total_segments
+            return {
+                "model": self.model_name,
+                "loaded": self.model is not None,
+                "batches": batches,
+                "segments": segments,
+                "languages": dict(self.languages),
+                "mean_batch_size": segments / batches if batches else 0.0,
+                "seconds": round(self.total_seconds, 2),
+                "queued": self.segments.qsize(),
+            }
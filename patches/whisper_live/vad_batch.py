@@ -0,0 +1,121 @@
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+
+
+class BatchedVoiceActivityDetector:
+    """
+    Evaluates voice activity for the frames of all active sessions with one batched ONNX call per tick.
+
+    The receive loops only enqueue frames and never wait for the model. A single worker thread wakes
+    up when frames are pending, gathers everything that arrives within ``tick_ms``, runs the Silero
+    VAD model once over the whole batch and hands each frame with its verdict to ``on_result`` in
+    arrival order, so per-session frame order is preserved.
+
+    Each frame is evaluated independently (the model state is reset per frame), which matches
+    ``whisper_live.vad.VoiceActivityDetector``.
+    """
+    WINDOW_SAMPLES = 512
+    CONTEXT_SAMPLES = 64
+
+    def __init__(self, on_result, threshold=0.5, frame_rate=16000, tick_ms=20):
+        """
+        Args:
+            on_result (callable): Called as ``on_result(key, frame_np, voice_active)`` for every frame.
+            threshold (float, optional): Speech probability above which a frame counts as voice. Defaults to 0.5.
+            frame_rate (int, optional): Sample rate of the frames. Only 16000 is supported. Defaults to 16000.
+            tick_ms (int, optional): How long to gather frames before evaluating a batch. Defaults to 20.
+        """
+        import onnxruntime
+        from whisper_live.vad import VoiceActivityDetection
+
+        if frame_rate != 16000:
+            raise ValueError("Batched VAD only supports 16000 Hz audio")
+        opts = onnxruntime.SessionOptions()
+        opts.log_severity_level = 3
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(
+            VoiceActivityDetection.download(), providers=['CPUExecutionProvider'], sess_options=opts
+        )
+        self.on_result = on_result
+        self.threshold = threshold
+        self.frame_rate = frame_rate
+        self.tick = tick_ms / 1000.0
+        self.frames = queue.Queue()
+        self.exit = False
+        self.thread = threading.Thread(target=self.run, name="vad-batch", daemon=True)
+        self.thread.start()
+
+    def submit(self, key, frame_np):
+        """
+        Queues a frame for evaluation without blocking.
+
+        Args:
+            key: Opaque value handed back to ``on_result``, e.g. the client's session.
+            frame_np (numpy.ndarray): float32 audio frame.
+        """
+        self.frames.put((key, frame_np))
+
+    def stop(self):
+        self.exit = True
+        self.thread.join(timeout=2.0)
+
+    def run(self):
+        while not self.exit:
+            try:
+                batch = [self.frames.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.tick
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.frames.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                voice = self.evaluate([frame for _, frame in batch])
+            except Exception as e:
+                # Fail open: never drop speech because the VAD model failed.
+                logging.error(f"[ERROR]: Batched VAD failed: {e}")
+                voice = np.ones(len(batch), dtype=bool)
+            for (key, frame), voice_active in zip(batch, voice):
+                try:
+                    self.on_result(key, frame, bool(voice_active))
+                except Exception as e:
+                    logging.error(f"[ERROR]: Handling VAD result: {e}")
+
+    def evaluate(self, frames):
+        """
+        Runs the VAD model over a batch of frames.
+
+        Args:
+            frames (list): float32 frames, possibly of different lengths.
+
+        Returns:
+            numpy.ndarray: One boolean per frame, True if any window of it contains speech.
+        """
+        lengths = np.array([frame.shape[0] for frame in frames])
+        windows = int(np.ceil(lengths.max() / self.WINDOW_SAMPLES))
+        audio = np.zeros((len(frames), windows * self.WINDOW_SAMPLES), dtype=np.float32)
+        for i, frame in enumerate(frames):
+            audio[i, :frame.shape[0]] = frame
+
+        state = np.zeros((2, len(frames), 128), dtype=np.float32)
+        context = np.zeros((len(frames), self.CONTEXT_SAMPLES), dtype=np.float32)
+        sr = np.array(self.frame_rate, dtype=np.int64)
+        voice = np.zeros(len(frames), dtype=bool)
+        for w in range(windows):
+            start = w * self.WINDOW_SAMPLES
+            x = np.concatenate([context, audio[:, start:start + self.WINDOW_SAMPLES]], axis=1)
+            out, state = self.session.run(None, {"input": x, "state": state, "sr": sr})
+            context = x[:, -self.CONTEXT_SAMPLES:]
+            voice |= (out[:, 0] > self.threshold) & (start < lengths)
+        return voice
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import threading
+
+from websockets.exceptions import ConnectionClosed
+
+
+class SyncWebSocketBridge:
+    """
+    Exposes an asyncio websocket connection through the blocking ``send``/``close`` interface
+    that the backends (``ServeClientBase`` and friends) expect.
+
+    The backends send segments from their own transcription threads, while the connection itself
+    belongs to the event loop. Calls made from a worker thread are handed over to the loop and wait
+    for completion, so a slow client still applies backpressure to its own transcription thread.
+    Calls made from the loop thread are scheduled without blocking the loop; their tasks are kept
+    until done and their failures logged.
+    """
+    SEND_TIMEOUT = 10.0
+    # The loop only holds weak references to tasks. Kept per class, not per bridge, so a pending
+    # close outlives a bridge that is dropped right after calling it.
+    _tasks = set()
+
+    def __init__(self, websocket, loop: asyncio.AbstractEventLoop):
+        """
+        Args:
+            websocket: The ``websockets.asyncio`` server connection.
+            loop (asyncio.AbstractEventLoop): The loop that owns the connection.
+        """
+        self.websocket = websocket
+        self.loop = loop
+        self._loop_thread_id = threading.get_ident()
+
+    def _in_loop_thread(self):
+        return threading.get_ident() == self._loop_thread_id
+
+    def _submit(self, coro):
+        if self._in_loop_thread():
+            task = self.loop.create_task(coro)
+            self._tasks.add(task)
+            task.add_done_callback(self._task_done)
+            return None
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result(timeout=self.SEND_TIMEOUT)
+
+    @classmethod
+    def _task_done(cls, task):
+        cls._tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if isinstance(error, ConnectionClosed):
+            logging.info(f"Message not sent, connection already closed: {error}")
+        elif error is not None:
+            logging.error(f"Websocket call failed: {error!r}")
+
+    def send(self, message):
+        """Send a text or binary message to the client."""
+        return self._submit(self.websocket.send(message))
+
+    def close(self):
+        """Close the underlying connection."""
+        return self._submit(self.websocket.close())
+
+    @property
+    def remote_address(self):
+        return self.websocket.remote_address
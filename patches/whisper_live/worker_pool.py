@@ -0,0 +1,378 @@
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from whisper_live.backend.faster_whisper_backend import ServeClientFasterWhisper
+
+# Picklable stand-in for faster_whisper's TranscriptionInfo, carrying what `set_language` reads.
+DetectedLanguage = namedtuple("DetectedLanguage", ["language", "language_probability"])
+
+
+def _worker_main(index, model, cache_path, shm_name, num_slots, slot_samples, tasks, results):
+    """
+    Entry point of an inference worker process: loads a model replica, then transcribes audio windows
+    read from the shared-memory slots until it receives ``None``.
+    """
+    from whisper_live.preload import ModelPreloader
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    slots = np.ndarray((num_slots, slot_samples), dtype=np.float32, buffer=shm.buf)
+    try:
+        preloader = ModelPreloader(model, cache_path, single_model=False)
+        loader = preloader.load()
+        preloader.warm_up(loader)
+        transcriber = loader.transcriber
+    except Exception as e:
+        results.put(("error", index, str(e)))
+        return
+    results.put(("ready", index, {"pid": os.getpid(), "load_seconds": round(preloader.load_seconds, 2),
+                                  "warmup_seconds": round(preloader.warmup_seconds, 2)}))
+
+    parent = os.getppid()
+    while True:
+        try:
+            task = tasks.get(timeout=5.0)
+        except queue.Empty:
+            # Don't outlive a server that was killed without stopping the pool.
+            if os.getppid() != parent:
+                break
+            continue
+        if task is None:
+            break
+        request_id, slot, num_samples, audio, options = task
+        if audio is None:
+            audio = slots[slot, :num_samples]
+        try:
+            result, info = transcriber.transcribe(audio, **options)
+            segments = list(result) if result is not None else None
+            detected = DetectedLanguage(info.language, info.language_probability) if info is not None else None
+            results.put(("result", request_id, segments, detected))
+        except Exception as e:
+            results.put(("failed", request_id, f"{type(e).__name__}: {e}"))
+    del slots
+    shm.close()
+
+
+class _PendingRequest:
+    def __init__(self, worker):
+        self.worker = worker
+        self.result = None
+        self.info = None
+        self.error = None
+        self.done = threading.Event()
+
+    def set_result(self, result, info):
+        self.result = result
+        self.info = info
+        self.done.set()
+
+    def set_error(self, error):
+        self.error = error
+        self.done.set()
+
+
+class WorkerSession:
+    """A session's route into the pool: the worker it is pinned to and its shared-memory audio slot."""
+
+    def __init__(self, uid, worker, slot):
+        self.uid = uid
+        self.worker = worker
+        self.slot = slot
+        self.inflight = None
+
+
+class ModelWorkerPool:
+    """
+    Runs faster_whisper inference in separate worker processes, each holding its own model replica.
+
+    Connection handling, buffering and VAD stay in the server process; only the transcription of
+    audio windows moves out. Every session is pinned to the least-loaded worker when it starts and
+    owns one slot of a shared-memory block: its audio window is copied into the slot and the worker
+    reads it from there, so no audio is pickled through a pipe (windows longer than a slot are the
+    exception). Workers process their requests one at a time, so sessions on different workers never
+    contend for a lock or the GIL.
+
+    Workers are started with the ``spawn`` method, since forking a process that already runs server
+    threads is unsafe; each one uses ``OMP_NUM_THREADS`` threads.
+    """
+    MAX_AUDIO_SECONDS = 60.0
+    REQUEST_TIMEOUT = 30.0
+    READY_TIMEOUT = 900.0
+
+    def __init__(self, num_workers, model, cache_path, max_sessions=4):
+        """
+        Args:
+            num_workers (int): Number of worker processes (model replicas).
+            model (str): Model size, local CTranslate2 directory or Hugging Face model id.
+            cache_path (str): Where the backend caches converted CTranslate2 models.
+            max_sessions (int, optional): Number of shared-memory slots, one per concurrent session.
+                Defaults to 4.
+        """
+        self.num_workers = num_workers
+        self.model = model
+        self.cache_path = cache_path
+        self.num_slots = max_sessions
+        self.slot_samples = int(self.MAX_AUDIO_SECONDS * ServeClientFasterWhisper.RATE)
+
+        self.lock = threading.Lock()
+        self.free_slots = list(range(self.num_slots))
+        self.sessions = [set() for _ in range(num_workers)]
+        self.requests_done = [0] * num_workers
+        self.busy_seconds = [0.0] * num_workers
+        self.alive = [False] * num_workers
+        self.pending = {}
+        self.request_ids = itertools.count()
+        self.worker_info = {}
+
+        self.shm = None
+        self.slots = None
+        self.processes = []
+        self.tasks = []
+        self.results = None
+        self.reader = None
+        self.exit = False
+
+    def start(self):
+        """Creates the shared-memory block and starts the worker processes."""
+        context = multiprocessing.get_context("spawn")
+        self.shm = shared_memory.SharedMemory(create=True, size=self.num_slots * self.slot_samples * 4)
+        self.slots = np.ndarray((self.num_slots, self.slot_samples), dtype=np.float32, buffer=self.shm.buf)
+        self.results = context.Queue()
+        for index in range(self.num_workers):
+            tasks = context.Queue()
+            process = context.Process(
+                target=_worker_main,
+                args=(index, self.model, self.cache_path, self.shm.name, self.num_slots, self.slot_samples,
+                      tasks, self.results),
+                name=f"inference-worker-{index}",
+                daemon=True,
+            )
+            process.start()
+            self.tasks.append(tasks)
+            self.processes.append(process)
+        logging.info(f"Started {self.num_workers} inference workers for model {self.model}")
+
+    def wait_ready(self, timeout=None):
+        """
+        Waits until every worker has loaded and warmed up its model replica.
+
+        Returns:
+            dict: Number of workers and the slowest worker's load and warm-up timings.
+
+        Raises:
+            RuntimeError: If a worker failed to load the model or did not report in time.
+        """
+        deadline = time.monotonic() + (timeout or self.READY_TIMEOUT)
+        while len(self.worker_info) < self.num_workers:
+            try:
+                message = self.results.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise RuntimeError(f"Only {len(self.worker_info)} of {self.num_workers} workers became ready")
+            kind, index, payload = message
+            if kind == "error":
+                raise RuntimeError(f"Worker {index} failed to load the model: {payload}")
+            self.worker_info[index] = payload
+            self.alive[index] = True
+        self.reader = threading.Thread(target=self.read_results, name="worker-results", daemon=True)
+        self.reader.start()
+        return {
+            "workers": self.num_workers,
+            "load_seconds": max(info["load_seconds"] for info in self.worker_info.values()),
+            "warmup_seconds": max(info["warmup_seconds"] for info in self.worker_info.values()),
+        }
+
+    def run(self):
+        """
+        Starts the workers and waits for them to become ready.
+
+        Returns:
+            dict: Startup timings for status reports, see `wait_ready`.
+        """
+        self.start()
+        return self.wait_ready()
+
+    def stop(self):
+        self.exit = True
+        for tasks in self.tasks:
+            tasks.put(None)
+        for process in self.processes:
+            process.join(timeout=5.0)
+        if self.shm is not None:
+            self.slots = None
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+    def read_results(self):
+        while not self.exit:
+            try:
+                message = self.results.get(timeout=1.0)
+            except queue.Empty:
+                self.check_workers()
+                continue
+            except (EOFError, OSError):
+                break
+            kind, request_id = message[0], message[1]
+            with self.lock:
+                request = self.pending.pop(request_id, None)
+            if request is None:
+                continue
+            if kind == "result":
+                request.set_result(message[2], message[3])
+            else:
+                request.set_error(RuntimeError(message[2]))
+
+    def check_workers(self):
+        """Fails the requests of workers that died, so their sessions get rerouted on the next window."""
+        for index, process in enumerate(self.processes):
+            if self.alive[index] and not process.is_alive():
+                logging.error(f"[ERROR]: Inference worker {index} exited with code {process.exitcode}")
+                with self.lock:
+                    self.alive[index] = False
+                    lost = [rid for rid, request in self.pending.items() if request.worker == index]
+                    requests = [self.pending.pop(rid) for rid in lost]
+                for request in requests:
+                    request.set_error(RuntimeError(f"Inference worker {index} exited"))
+
+    def least_loaded_worker(self):
+        candidates = [index for index in range(self.num_workers) if self.alive[index]]
+        if not candidates:
+            raise RuntimeError("No inference worker is available")
+        return min(candidates, key=lambda index: (len(self.sessions[index]), self.busy_seconds[index]))
+
+    def open_session(self, uid):
+        """
+        Pins a new session to the least-loaded worker and gives it a shared-memory slot.
+
+        Args:
+            uid (str): The client's unique identifier, for logging.
+
+        Returns:
+            WorkerSession: The session's route, to pass to `transcribe`.
+        """
+        with self.lock:
+            worker = self.least_loaded_worker()
+            slot = self.free_slots.pop() if self.free_slots else None
+            session = WorkerSession(uid, worker, slot)
+            self.sessions[worker].add(session)
+        logging.info(f"Client {uid} routed to inference worker {worker}")
+        return session
+
+    def close_session(self, session):
+        with self.lock:
+            self.sessions[session.worker].discard(session)
+            # A slot still read by an abandoned request is not handed out again.
+            if session.slot is not None and (session.inflight is None or session.inflight.done.is_set()):
+                self.free_slots.append(session.slot)
+            session.slot = None
+
+    def transcribe(self, session, audio, **options):
+        """
+        Transcribes an audio window on the session's worker.
+
+        Args:
+            session (WorkerSession): The route returned by `open_session`.
+            audio (np.ndarray): float32 samples at 16 kHz.
+            **options: Keyword arguments for ``WhisperModel.transcribe``.
+
+        Returns:
+            tuple: The list of segments and a `DetectedLanguage` (or None).
+        """
+        with self.lock:
+            if not self.alive[session.worker]:
+                self.sessions[session.worker].discard(session)
+                session.worker = self.least_loaded_worker()
+                self.sessions[session.worker].add(session)
+                logging.info(f"Client {session.uid} rerouted to inference worker {session.worker}")
+            worker = session.worker
+            request_id = next(self.request_ids)
+            request = self.pending[request_id] = _PendingRequest(worker)
+
+        num_samples = audio.shape[0]
+        previous = session.inflight
+        if (session.slot is not None and num_samples <= self.slot_samples
+                and (previous is None or previous.done.is_set())):
+            self.slots[session.slot, :num_samples] = audio
+            task = (request_id, session.slot, num_samples, None, options)
+        else:
+            task = (request_id, None, num_samples, np.ascontiguousarray(audio, dtype=np.float32), options)
+        session.inflight = request
+
+        start = time.monotonic()
+        self.tasks[worker].put(task)
+        if not request.done.wait(self.REQUEST_TIMEOUT):
+            with self.lock:
+                self.pending.pop(request_id, None)
+            raise TimeoutError(f"Inference worker {worker} did not answer in time")
+        with self.lock:
+            self.requests_done[worker] += 1
+            self.busy_seconds[worker] += time.monotonic() - start
+        if request.error is not None:
+            raise request.error
+        return request.result, request.info
+
+    def get_stats(self):
+        """
+        Returns:
+            list: Per worker: whether it is alive, its pinned sessions, completed requests and busy time.
+        """
+        with self.lock:
+            return [
+                {
+                    "alive": self.alive[index],
+                    "sessions": len(self.sessions[index]),
+                    "requests": self.requests_done[index],
+                    "busy_seconds": round(self.busy_seconds[index], 2),
+                }
+                for index in range(self.num_workers)
+            ]
+
+
+class PooledServeClientFasterWhisper(ServeClientFasterWhisper):
+    """
+    faster_whisper client whose audio windows are transcribed by the server's `ModelWorkerPool`
+    instead of a model in the server process.
+    """
+    POOL = None
+
+    def create_model(self, device):
+        # The model replicas live in the worker processes; the session only needs a route to one.
+        self.transcriber = None
+        self.worker_session = PooledServeClientFasterWhisper.POOL.open_session(self.client_uid)
+
+    def transcribe_audio(self, input_sample):
+        """
+        Transcribes the provided audio sample on the session's inference worker.
+
+        Args:
+            input_sample (np.array): The audio chunk to be transcribed.
+
+        Returns:
+            The list of segments produced for the chunk.
+        """
+        result, info = PooledServeClientFasterWhisper.POOL.transcribe(
+            self.worker_session,
+            input_sample,
+            initial_prompt=self.initial_prompt,
+            language=self.language,
+            task=self.task,
+            vad_filter=self.use_vad,
+            vad_parameters=self.vad_parameters if self.use_vad else None,
+        )
+        if self.language is None and info is not None:
+            self.set_language(info)
+        return result
+
+    def cleanup(self):
+        super().cleanup()
+        if getattr(self, "worker_session", None) is not None:
+            PooledServeClientFasterWhisper.POOL.close_session(self.worker_session)
+            self.worker_session = None
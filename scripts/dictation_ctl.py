@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Sends a command to the always-on dictation client over its control socket and prints the reply.
+
+Usage: dictation_ctl.py [toggle|start|stop|status|lang <code>|quit]
+
+Uses only the standard library so it can run with the system interpreter (``python3 -S``) without
+activating the virtual environment. Exits with 0 on success, 1 if the client reported an error or
+did not answer, and 2 if no client is running.
+"""
+import json
+import os
+import socket
+import sys
+
+NOT_RUNNING = 2
+
+
+def control_socket_path():
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "whisper-dictation.sock")
+    return f"/tmp/whisper-dictation-{os.getuid()}.sock"
+
+
+def send_command(command, path=None, timeout=5.0):
+    """
+    Args:
+        command (str): The command line, e.g. ``"toggle"`` or ``"lang en"``.
+        path (str, optional): The socket path. Defaults to `control_socket_path`.
+
+    Returns:
+        dict: The client's reply.
+
+    Raises:
+        OSError: If no client is listening on the socket or it doesn't answer within ``timeout``.
+        ValueError: If the reply is empty or not JSON.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path or control_socket_path())
+        sock.sendall(command.encode() + b"\n")
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            reply += chunk
+    return json.loads(reply)
+
+
+def main():
+    command = " ".join(sys.argv[1:]) or "status"
+    try:
+        reply = send_command(command)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("Dictation client is not running.", file=sys.stderr)
+        return NOT_RUNNING
+    except OSError as ex:
+        print(f"[ERROR]: Dictation client did not answer {command!r}: {ex}", file=sys.stderr)
+        return 1
+    except ValueError as ex:
+        print(f"[ERROR]: Invalid reply from the dictation client to {command!r}: {ex}", file=sys.stderr)
+        return 1
+    print(json.dumps(reply, ensure_ascii=False))
+    return 0 if reply.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,38 +1,222 @@
 import os
 import sys
+import json
 import time
-import pyperclip
+import uuid
+import argparse
 import evdev
 from evdev import UInput, ecodes as e
+import socket
 import threading
-import pystray
-from PIL import Image, ImageDraw
-from whisper_live.client import TranscriptionClient
+from collections import deque
+from dictation_ctl import control_socket_path
 import signal
 
 
+class LazyModule:
+    """
+    Stands in for a module that is imported on first attribute access (or by `load`), so the
+    client can take commands before its audio, network, clipboard and tray dependencies are loaded.
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def load(self):
+        if self._module is None:
+            # The import statement's machinery (unlike importlib.import_module) is seen by -X importtime
+            __import__(self._name)
+            self._module = sys.modules[self._name]
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+
+# Only evdev (virtual keyboard) and the control socket are needed to accept the first toggle;
+# everything else is loaded on a background thread after startup
+np = LazyModule("numpy")
+pyaudio = LazyModule("pyaudio")
+websocket = LazyModule("websocket")
+pyperclip = LazyModule("pyperclip")
+pystray = LazyModule("pystray")
+Image = LazyModule("PIL.Image")
+ImageDraw = LazyModule("PIL.ImageDraw")
+whisper_client = LazyModule("whisper_live.client")
+DEFERRED_MODULES = (np, pyaudio, websocket, pyperclip, pystray, Image, ImageDraw, whisper_client)
+
+
+def load_deferred_modules(modules=DEFERRED_MODULES):
+    for module in modules:
+        module.load()
+
+
+def print_import_report():
+    """
+    Prints the import cost of each module the client loads, split into what is imported before the
+    control socket is up and what is loaded in the background, using ``python -X importtime``.
+    """
+    import subprocess
+    code = ("import sys; print('#eager', file=sys.stderr, flush=True); import gnome_dictation_client as c; "
+            "print('#deferred', file=sys.stderr, flush=True); c.load_deferred_modules()")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+    phases = {"#eager": [], "#deferred": []}
+    current = None
+    for line in result.stderr.splitlines():
+        if line in phases:
+            current = phases[line]
+            continue
+        if current is None or not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        # Imports made by the client module itself are nested one level below it
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == (1 if current is phases["#eager"] else 0):
+            current.append((int(cumulative) / 1000, name.strip()))
+    if result.returncode != 0:
+        print(result.stderr.splitlines()[-1] if result.stderr else "[ERROR]: Import failed")
+    for title, marker in [("Imported at startup", "#eager"), ("Loaded in the background", "#deferred")]:
+        entries = sorted(phases[marker], reverse=True)
+        print(f"{title}: {sum(ms for ms, _ in entries):.1f} ms")
+        for ms, name in entries:
+            print(f"  {ms:8.1f} ms  {name}")
+
+
+
+# Keys for typing short ASCII additions directly: char -> (key code, needs Shift), US layout
+ASCII_KEYS = {" ": (e.KEY_SPACE, False)}
+for _c in "abcdefghijklmnopqrstuvwxyz":
+    ASCII_KEYS[_c] = (getattr(e, f"KEY_{_c.upper()}"), False)
+    ASCII_KEYS[_c.upper()] = (getattr(e, f"KEY_{_c.upper()}"), True)
+for _plain, _shifted in zip("1234567890", "!@#$%^&*()"):
+    ASCII_KEYS[_plain] = (getattr(e, f"KEY_{_plain}"), False)
+    ASCII_KEYS[_shifted] = (getattr(e, f"KEY_{_plain}"), True)
+for _name, _plain, _shifted in [
+    ("MINUS", "-", "_"), ("EQUAL", "=", "+"), ("LEFTBRACE", "[", "{"), ("RIGHTBRACE", "]", "}"),
+    ("SEMICOLON", ";", ":"), ("APOSTROPHE", "'", '"'), ("GRAVE", "`", "~"), ("BACKSLASH", "\\", "|"),
+    ("COMMA", ",", "<"), ("DOT", ".", ">"), ("SLASH", "/", "?"),
+]:
+    ASCII_KEYS[_plain] = (getattr(e, f"KEY_{_name}"), False)
+    ASCII_KEYS[_shifted] = (getattr(e, f"KEY_{_name}"), True)
 
 # Virtual input device (keyboard) setup
 # This creates a "hardware" keyboard at the kernel level
 cap = {
-    e.EV_KEY: [
+    e.EV_KEY: sorted({
         e.KEY_BACKSPACE, e.KEY_LEFTCTRL, e.KEY_V, 
         e.KEY_LEFTSHIFT, e.KEY_INSERT, e.KEY_A
-    ]
+    } | {code for code, _ in ASCII_KEYS.values()})
 }
 
-class GNOMELiveTypist:
+
+class X11ClipboardOwner:
+    """
+    Keeps the CLIPBOARD selection on one long-lived X connection and serves paste requests itself,
+    instead of starting a clipboard tool for every copy. GNOME's Xwayland bridge makes it the
+    clipboard of Wayland apps too.
+
+    `set` returns once the selection is confirmed to be ours (and, under Wayland, once the
+    compositor has asked for its targets); `wait_consumed` returns once a paste has read the text.
+    """
     def __init__(self):
+        import Xlib.threaded  # noqa: F401 - the event thread and the typist share the connection
+        from Xlib import X, Xatom, display
+
+        self.X = X
+        self.Xatom = Xatom
+        self.display = display.Display()
+        self.window = self.display.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        self.CLIPBOARD = self.display.intern_atom("CLIPBOARD")
+        self.TARGETS = self.display.intern_atom("TARGETS")
+        self.UTF8_STRING = self.display.intern_atom("UTF8_STRING")
+        self.TEXT = self.display.intern_atom("TEXT")
+        self.data = b""
+        self.announced = threading.Event()
+        self.consumed = threading.Event()
+        self.wayland = bool(os.environ.get("WAYLAND_DISPLAY"))
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def set(self, text, timeout=0.05):
+        self.data = text.encode("utf-8")
+        self.announced.clear()
+        self.consumed.clear()
+        self.window.set_selection_owner(self.CLIPBOARD, self.X.CurrentTime)
+        self.display.sync()
+        if self.display.get_selection_owner(self.CLIPBOARD) != self.window:
+            return False
+        if self.wayland:
+            # Mutter asks a new X owner for its targets before Wayland clients can paste from it
+            self.announced.wait(timeout)
+        return True
+
+    def wait_consumed(self, timeout=0.1):
+        return self.consumed.wait(timeout)
+
+    def _serve(self):
+        while True:
+            event = self.display.next_event()
+            if event.type == self.X.SelectionRequest:
+                self._answer(event)
+
+    def _answer(self, request):
+        from Xlib.protocol import event as xevent
+
+        prop = request.property or request.target
+        if request.target == self.TARGETS:
+            request.requestor.change_property(
+                prop, self.Xatom.ATOM, 32, [self.TARGETS, self.UTF8_STRING, self.TEXT, self.Xatom.STRING])
+            self.announced.set()
+        elif request.target in (self.UTF8_STRING, self.TEXT, self.Xatom.STRING):
+            kind = self.Xatom.STRING if request.target == self.Xatom.STRING else self.UTF8_STRING
+            request.requestor.change_property(prop, kind, 8, self.data)
+            self.consumed.set()
+        else:
+            prop = self.X.NONE
+        request.requestor.send_event(xevent.SelectionNotify(
+            time=request.time, requestor=request.requestor, selection=request.selection,
+            target=request.target, property=prop))
+        self.display.flush()
+
+
+class PyperclipClipboard:
+    """Fallback clipboard through pyperclip's external tools, confirmed by reading the text back."""
+    def set(self, text, timeout=0.2):
+        pyperclip.copy(text)
+        deadline = time.monotonic() + timeout
+        while pyperclip.paste() != text:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def wait_consumed(self, timeout=0.1):
+        # No way to tell when the app has read it; give it a moment before the next copy
+        time.sleep(min(timeout, 0.02))
+        return True
+
+
+def make_clipboard():
+    if os.environ.get("DISPLAY"):
         try:
-            self.ui = UInput(cap, name='Whisper-Virtual-Keyboard')
-            print("[INFO]: Virtual Keyboard created successfully via evdev")
+            clipboard = X11ClipboardOwner()
+            print("[INFO]: Clipboard served from a persistent X11 connection")
+            return clipboard
         except Exception as ex:
-            print(f"[ERROR]: Failed to create virtual keyboard: {ex}")
-            sys.exit(1)
-            
-        self.currently_typed = ""
-        self.last_locked_time = 0
-        self.is_list_mode = False
+            print(f"[WARN]: X11 clipboard unavailable ({ex}), using pyperclip")
+    return PyperclipClipboard()
+
+class KeyEventEmitter:
+    """
+    Writes key taps to the virtual keyboard in batches, several taps per ``syn()`` report, and paces
+    them with an events-per-second budget instead of sleeping after every key.
+    """
+    def __init__(self, ui, events_per_second=2000, taps_per_syn=16):
+        self.ui = ui
+        self.events_per_second = events_per_second
+        self.taps_per_syn = taps_per_syn
 
     def press_keys(self, keys):
         # Press all keys in the list
@@ -44,147 +228,271 @@ class GNOMELiveTypist:
             self.ui.write(e.EV_KEY, k, 0)
         self.ui.syn()
 
-    def backspace(self, count):
+    def type_text(self, text):
+        start = time.monotonic()
+        events = 0
+        for i in range(0, len(text), self.taps_per_syn):
+            for char in text[i:i + self.taps_per_syn]:
+                code, shift = ASCII_KEYS[char]
+                if shift:
+                    self.ui.write(e.EV_KEY, e.KEY_LEFTSHIFT, 1)
+                self.ui.write(e.EV_KEY, code, 1)
+                self.ui.write(e.EV_KEY, code, 0)
+                if shift:
+                    self.ui.write(e.EV_KEY, e.KEY_LEFTSHIFT, 0)
+                events += 4 if shift else 2
+            self.ui.syn()
+            delay = start + events / self.events_per_second - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+    def tap(self, key, count):
         if count <= 0:
             return
-        # For a small number, use normal backspace
-        if count < 10:
-            for _ in range(count):
-                self.press_keys([e.KEY_BACKSPACE])
-                time.sleep(0.005)
-        else:
-            # For a large number, also use backspace, but slightly faster
-            for _ in range(count):
-                self.press_keys([e.KEY_BACKSPACE])
-                time.sleep(0.002)
+        start = time.monotonic()
+        events = 0
+        while events < 2 * count:
+            batch = min(self.taps_per_syn, count - events // 2)
+            for _ in range(batch):
+                self.ui.write(e.EV_KEY, key, 1)
+                self.ui.write(e.EV_KEY, key, 0)
+            self.ui.syn()
+            events += 2 * batch
+            # Sleep off whatever the batch is ahead of the rate budget
+            delay = start + events / self.events_per_second - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+
+class GNOMELiveTypist:
+    def __init__(self, events_per_second=2000, direct_type_max=0, clipboard=None):
+        try:
+            self.ui = UInput(cap, name='Whisper-Virtual-Keyboard')
+            print("[INFO]: Virtual Keyboard created successfully via evdev")
+        except Exception as ex:
+            print(f"[ERROR]: Failed to create virtual keyboard: {ex}")
+            sys.exit(1)
+        self.emitter = KeyEventEmitter(self.ui, events_per_second)
+        self.direct_type_max = direct_type_max
+        # Created on first use (or by the manager's background loader) to keep startup fast
+        self._clipboard = clipboard
+        self.clipboard_lock = threading.Lock()
+
+        self.currently_typed = ""
+        self.last_locked_time = 0
+        self.is_list_mode = False
+
+        # Edits are queued by folding them into the target text; the output thread types the
+        # difference between what is on screen and the latest target, so stale hypotheses that
+        # were superseded before it got to them are never typed.
+        self.output_lock = threading.Condition()
+        self.screen_text = ""
+        self.target_text = ""
+        self.editable_length = 0
+        threading.Thread(target=self._output_loop, daemon=True).start()
+
+    @property
+    def clipboard(self):
+        with self.clipboard_lock:
+            if self._clipboard is None:
+                self._clipboard = make_clipboard()
+            return self._clipboard
+
+    def backspace(self, count):
+        self.emitter.tap(e.KEY_BACKSPACE, count)
 
     def clear_all(self):
         # This function is no longer used to prevent full field clearing
-        self.press_keys([e.KEY_LEFTCTRL, e.KEY_A])
+        self.emitter.press_keys([e.KEY_LEFTCTRL, e.KEY_A])
         time.sleep(0.02)
-        self.press_keys([e.KEY_BACKSPACE])
+        self.emitter.press_keys([e.KEY_BACKSPACE])
         time.sleep(0.02)
 
     def paste_text(self, text):
         if not text:
             return
-        # Copy text to clipboard
-        pyperclip.copy(text)
-        time.sleep(0.05) # Pause for Chrome
+        # Copy text to clipboard and make sure it's there before pasting
+        if not self.clipboard.set(text):
+            print("[WARN]: Clipboard not confirmed, pasting anyway")
         
         # Press hardware Ctrl + V
-        self.press_keys([e.KEY_LEFTCTRL, e.KEY_V])
-        time.sleep(0.02)
+        self.emitter.press_keys([e.KEY_LEFTCTRL, e.KEY_V])
+        # Don't replace the clipboard before the app has read it
+        self.clipboard.wait_consumed()
 
-    def on_transcription(self, full_text, segments):
-        # List of hallucinations
-        hallucinations = [
-            "продолжение следует", 
-            "продолжение следует...",
-            "благодарю за внимание",
-            "спасибо за просмотр",
-            "подписывайтесь на канал",
-            "thanks for watching",
-            "subtitles by",
-            "субтитры сделал dimatorzok",
-            "субтитры подготовил dimatorzok",
-            "субтитры сделал",
-            "субтитры подготовил",
-            "to be continued",
-            "thank you for watching",
-            "subscribe to the channel"
-        ]
-        
-        # Control commands
-        list_start_cmds = ["новый список", "начать список", "start list", "new list"]
-        list_end_cmds = ["конец списка", "закончить список", "end list", "stop list"]
-        enter_cmds = ["новая строка", "enter", "энтер", "перенос строки", "new line"]
-
-        def process_text_part(txt, list_mode_state):
-            t_lower = txt.lower().strip().rstrip(".")
-            if t_lower in list_start_cmds:
-                return "\n- ", True
-            if t_lower in list_end_cmds:
-                return "\n", False
-            if t_lower in enter_cmds:
-                return ("\n- " if list_mode_state else "\n"), list_mode_state
-            return txt, list_mode_state
-
-        # 1. Filter segments for hallucinations
-        valid_segments = []
-        for seg in segments:
-            t = seg["text"].strip()
-            if t.lower() in hallucinations:
-                print(f"[DEBUG]: Hallucination ignored: '{t}'")
-                continue
-            valid_segments.append(seg)
-            
-        if not valid_segments:
+    def insert_text(self, text):
+        # Short plain additions (a word, a space, punctuation) are typed, skipping the clipboard.
+        # The key codes are those of a US layout, so this is off unless --direct-type-max is given.
+        if len(text) <= self.direct_type_max and all(c in ASCII_KEYS for c in text):
+            self.emitter.type_text(text)
+        else:
+            self.paste_text(text)
+
+    def queue_edit(self, chars_to_delete, text_to_add, editable_length):
+        # editable_length: how much of the end of the text later edits may still delete
+        with self.output_lock:
+            keep = max(0, len(self.target_text) - chars_to_delete)
+            self.target_text = self.target_text[:keep] + text_to_add
+            self.editable_length = editable_length
+            self.output_lock.notify_all()
+
+    def wait_idle(self, timeout=None):
+        """Blocks until every queued edit has been typed; returns False on timeout."""
+        with self.output_lock:
+            return self.output_lock.wait_for(lambda: self.screen_text == self.target_text, timeout)
+
+    def _output_loop(self):
+        while True:
+            with self.output_lock:
+                self.output_lock.wait_for(lambda: self.screen_text != self.target_text)
+                target = self.target_text
+            common = 0
+            for a, b in zip(self.screen_text, target):
+                if a != b:
+                    break
+                common += 1
+            try:
+                chars_to_delete = len(self.screen_text) - common
+                if chars_to_delete > 0:
+                    # Delete in bounded steps so a newer target can cut a long rewrite short
+                    step = min(chars_to_delete, self.emitter.taps_per_syn * 4)
+                    self.backspace(step)
+                    screen = self.screen_text[:len(self.screen_text) - step]
+                else:
+                    self.insert_text(target[common:])
+                    screen = target
+            except Exception as ex:
+                print(f"[ERROR]: Typing failed: {ex}")
+                screen = target
+            with self.output_lock:
+                self.screen_text = screen
+                if self.screen_text == self.target_text:
+                    # Everything is typed; only keep the tail that may still be edited
+                    self.screen_text = self.target_text = self.target_text[max(0, len(self.target_text) - self.editable_length):]
+                self.output_lock.notify_all()
+
+    # Segments that end at least this long before the newest one are final and get locked
+    STABILITY_WINDOW = 3.0
+
+    # Fallback for servers without the hallucination phrase filter, which drops these server-side
+    HALLUCINATIONS = frozenset([
+        "продолжение следует", 
+        "продолжение следует...",
+        "благодарю за внимание",
+        "спасибо за просмотр",
+        "подписывайтесь на канал",
+        "thanks for watching",
+        "subtitles by",
+        "субтитры сделал dimatorzok",
+        "субтитры подготовил dimatorzok",
+        "субтитры сделал",
+        "субтитры подготовил",
+        "to be continued",
+        "thank you for watching",
+        "subscribe to the channel"
+    ])
+
+    # Control commands
+    LIST_START_CMDS = frozenset(["новый список", "начать список", "start list", "new list"])
+    LIST_END_CMDS = frozenset(["конец списка", "закончить список", "end list", "stop list"])
+    ENTER_CMDS = frozenset(["новая строка", "enter", "энтер", "перенос строки", "new line"])
+
+    def reset(self):
+        # A new utterance: nothing of it is typed or locked yet
+        self.currently_typed = ""
+        self.last_locked_time = 0
+
+    @classmethod
+    def process_text_part(cls, txt, list_mode_state):
+        t_lower = txt.lower().strip().rstrip(".")
+        if t_lower in cls.LIST_START_CMDS:
+            return "\n- ", True
+        if t_lower in cls.LIST_END_CMDS:
+            return "\n", False
+        if t_lower in cls.ENTER_CMDS:
+            return ("\n- " if list_mode_state else "\n"), list_mode_state
+        return txt, list_mode_state
+
+    def is_hallucination(self, seg):
+        t = seg["text"].strip()
+        if t.lower() in self.HALLUCINATIONS:
+            print(f"[DEBUG]: Hallucination ignored: '{t}'")
+            return True
+        return False
+
+    def first_unlocked_index(self, segments):
+        # Segments are in time order, so the locked ones are the prefix ending at last_locked_time.
+        # A hand-written bisect_right: its key= argument needs Python 3.10.
+        lo, hi = 0, len(segments)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if float(segments[mid].get("end", 0)) <= self.last_locked_time:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def on_transcription(self, segments):
+        # Only the mutable tail after the locked segments is looked at, so the cost of an update
+        # doesn't grow with the length of the session.
+        unlocked = self.first_unlocked_index(segments)
+
+        # 1. Filter the tail for hallucinations
+        tail = [seg for seg in segments[unlocked:] if not self.is_hallucination(seg)]
+        if not tail and not unlocked:
             return
 
-        # 2. Determine stability window boundary
-        current_max_time = float(valid_segments[-1].get("end", 0))
-        
+        # 2. Lock completed segments that are out of the stability window
+        current_max_time = float(tail[-1].get("end", 0)) if tail else 0.0
         lock_until_idx = 0
-        for i, seg in enumerate(valid_segments):
+        for seg in tail:
             end_t = float(seg.get("end", 0))
-            if end_t <= self.last_locked_time:
-                lock_until_idx = i + 1
-                continue
-                
-            if seg.get("completed", False) and end_t < (current_max_time - 3.0):
-                lock_until_idx = i + 1
-                
-                # Segment text and its transformation to "concrete"
-                text_raw = seg["text"].strip()
-                text_transformed, next_list_mode = process_text_part(text_raw, self.is_list_mode)
-                
-                # Look for this text at the beginning of our buffer and cut it off
-                if self.currently_typed.startswith(text_transformed):
-                    self.currently_typed = self.currently_typed[len(text_transformed):].lstrip(" ")
-                    self.last_locked_time = end_t
-                    self.is_list_mode = next_list_mode
-                    print(f"[DEBUG]: Locking: '{text_transformed.replace(chr(10), ' [ENT] ')}'. Mode: {self.is_list_mode}")
-                else:
-                    self.currently_typed = ""
-                    self.last_locked_time = end_t
-                    self.is_list_mode = next_list_mode
-                    print(f"[DEBUG]: Desync in locking, reset baseline. Mode: {self.is_list_mode}")
-            else:
+            if not (seg.get("completed", False) and end_t < (current_max_time - self.STABILITY_WINDOW)):
                 break
-        
-        # 3. Form active text considering commands
-        current_active_mode = self.is_list_mode
-        active_parts = []
-        for s in valid_segments[lock_until_idx:]:
-            txt_raw = s["text"].strip()
-            txt_transformed, current_active_mode = process_text_part(txt_raw, current_active_mode)
-            active_parts.append(txt_transformed)
-        
-        # Smart join
-        target_text = ""
-        for part in active_parts:
-            if part.startswith("\n"):
-                target_text += part
+            lock_until_idx += 1
+
+            # Segment text and its transformation to "concrete"
+            text_raw = seg["text"].strip()
+            text_transformed, next_list_mode = self.process_text_part(text_raw, self.is_list_mode)
+
+            # Look for this text at the beginning of our buffer and cut it off
+            if self.currently_typed.startswith(text_transformed):
+                self.currently_typed = self.currently_typed[len(text_transformed):].lstrip(" ")
+                self.last_locked_time = end_t
+                self.is_list_mode = next_list_mode
+                print(f"[DEBUG]: Locking: '{text_transformed.replace(chr(10), ' [ENT] ')}'. Mode: {self.is_list_mode}")
             else:
-                if target_text and not target_text.endswith(("\n", "- ", " ")):
-                    target_text += " "
-                target_text += part
-        
+                self.currently_typed = ""
+                self.last_locked_time = end_t
+                self.is_list_mode = next_list_mode
+                print(f"[DEBUG]: Desync in locking, reset baseline. Mode: {self.is_list_mode}")
+
+        # 3. Render the active text considering commands, with a smart join
+        current_active_mode = self.is_list_mode
+        parts = []
+        needs_space = False
+        for seg in tail[lock_until_idx:]:
+            part, current_active_mode = self.process_text_part(seg["text"].strip(), current_active_mode)
+            if needs_space and not part.startswith("\n"):
+                parts.append(" ")
+                needs_space = False
+            parts.append(part)
+            if part:
+                needs_space = not part.endswith(("\n", "- ", " "))
+        target_text = "".join(parts)
+
         if not target_text and not self.currently_typed:
             return
             
         if target_text == self.currently_typed:
             return
 
-        # 4. Differential typing
+        # 4. Differential typing over the active text
         common_prefix_len = 0
-        min_len = min(len(target_text), len(self.currently_typed))
-        for i in range(min_len):
-            if target_text[i] == self.currently_typed[i]:
-                common_prefix_len += 1
-            else:
+        for typed_char, target_char in zip(self.currently_typed, target_text):
+            if typed_char != target_char:
                 break
+            common_prefix_len += 1
         
         chars_to_delete = len(self.currently_typed) - common_prefix_len
         text_to_add = target_text[common_prefix_len:]
@@ -192,29 +500,459 @@ class GNOMELiveTypist:
         if chars_to_delete > 0 or text_to_add:
             print(f"[DEBUG]: Diff - Del: {chars_to_delete}, Add: '{text_to_add.replace(chr(10), ' [ENT] ')}'")
 
-        if chars_to_delete > 0:
-            self.backspace(chars_to_delete)
-        
-        if text_to_add:
-            self.paste_text(text_to_add)
-
+        self.queue_edit(chars_to_delete, text_to_add, len(target_text))
         self.currently_typed = target_text
 
-class DictationManager:
+class SegmentStore:
+    """
+    Local copy of the session transcript, patched in place by segment deltas from the server.
+
+    Segment ids are positions in the transcript: finalized segments never change again and only
+    the in-progress tail segment is replaced on each update.
+    """
     def __init__(self):
-        self.typist = GNOMELiveTypist()
+        self.segments = []
+        self.seq = 0
+
+    def clear(self):
+        self.segments = []
+        self.seq = 0
+
+    def apply(self, delta):
+        if delta["seq"] != self.seq + 1:
+            print(f"[WARN]: Segment delta gap: expected seq {self.seq + 1}, got {delta['seq']}")
+        self.seq = delta["seq"]
+        for seg in delta["segments"]:
+            seg_id = seg["id"]
+            if seg.get("removed"):
+                del self.segments[seg_id:]
+            elif seg_id < len(self.segments):
+                self.segments[seg_id] = seg
+            else:
+                self.segments.append(seg)
+        return self.segments
+
+
+class ServerSession:
+    """
+    One long-lived websocket session with the transcription server.
+
+    The connection, the options handshake and the server-side backend are set up once and kept
+    while idle. Toggling dictation only opens/closes the microphone and sends a pause/resume
+    control message, so the first words don't wait for a handshake or model setup.
+
+    In armed mode (`arm`) the microphone stays open while idle and the last ``preroll_seconds`` of
+    audio are kept in a bounded buffer, which is sent ahead of the live audio on resume. Words
+    spoken while the hotkey is pressed are then not lost to opening the device.
+
+    If the connection drops, the server keeps the session for a grace period and the reconnecting
+    client resumes it with its resume token: it only receives the segments it missed, and an
+    interrupted dictation continues without a new handshake.
+    """
+    RATE = 16000
+    CHUNK = 4096
+    RECONNECT_DELAY = 2.0
+    READY_TIMEOUT = 10.0
+    # A freshly started server answers with LOADING and admits the session once its model is warm;
+    # a busy one answers with QUEUED and admits it once a slot frees up
+    LOADING_TIMEOUT = 300.0
+
+    def __init__(self, host, port, lang, model, transcription_callback, preroll_seconds=0.0):
+        self.url = f"ws://{host}:{port}"
+        self.lang = lang
+        self.model = model
+        self.transcription_callback = transcription_callback
+        self.uid = str(uuid.uuid4())
+
+        self.ws = None
+        self.store = SegmentStore()
+        self.use_deltas = False
+        self.audio_encoding = "float32"
+        self.send_lock = threading.Lock()
+        self.ready = threading.Event()
+        self.server_waiting = False
+        self.closed = False
+        self.reconnect_now = False
+        self.resume_token = None
+        self.resuming = False
+        self.interrupted = False
+        # Whether the user is dictating (between resume and pause). Unlike ``streaming``, send errors
+        # don't clear it, so a dictation cut off by a dropped connection can be continued.
+        self.dictating = False
+        self.streaming = False
+        self.mic_thread = None
+        self.audio = None
+        self.audio_lock = threading.Lock()
+        # Ordered hand-over between the idle pre-roll buffer and live streaming
+        self.capture_lock = threading.Lock()
+        self.armed = False
+        self.preroll = None
+        if preroll_seconds > 0:
+            self.preroll = deque(maxlen=max(1, round(preroll_seconds * self.RATE / self.CHUNK)))
+
+    def start(self):
+        # Keep the connection up in the background, reconnecting if the server restarts
+        threading.Thread(target=self._maintain_connection, daemon=True).start()
+
+    def _maintain_connection(self):
+        while not self.closed:
+            try:
+                self._connect()
+                self._read_messages()
+            except Exception as ex:
+                print(f"[WARN]: Server session unavailable: {ex}")
+            self.ready.clear()
+            self.server_waiting = False
+            # Dictation that the dropped connection interrupted continues once the session is resumed
+            self.interrupted = self.dictating and self.resume_token is not None
+            self.streaming = False
+            # Servers that don't acknowledge an encoding only understand float32
+            self.audio_encoding = "float32"
+            if self.reconnect_now:
+                self.reconnect_now = False
+            elif not self.closed:
+                time.sleep(self.RECONNECT_DELAY)
+
+    def _connect(self):
+        self.ws = websocket.create_connection(self.url)
+        self.resuming = self.resume_token is not None
+        if self.resuming:
+            self.ws.send(json.dumps({
+                "uid": self.uid,
+                "resume_token": self.resume_token,
+                "last_segment": sum(1 for seg in self.store.segments if seg.get("completed")),
+            }))
+            return
+        self.ws.send(json.dumps({
+            "uid": self.uid,
+            "language": self.lang,
+            "task": "transcribe",
+            "model": self.model,
+            "use_vad": True,
+            "send_last_n_segments": 2000,
+            "keep_alive": True,
+            "delta_segments": 1,
+            "audio_encoding": "int16",
+            "resumable": True,
+        }))
+
+    def _read_messages(self):
+        while not self.closed:
+            message = json.loads(self.ws.recv())
+            if message.get("uid") != self.uid:
+                continue
+            if "status" in message:
+                print(f"[WARN]: Server status {message['status']}: {message.get('message')}")
+                if message["status"] == "ERROR" and self.resuming:
+                    # The session expired or the server restarted, start a new one right away
+                    self.resume_token = None
+                    self.reconnect_now = True
+                if message["status"] in ("WAIT", "ERROR"):
+                    return
+                continue
+            msg = message.get("message")
+            if msg == "LOADING":
+                print("[INFO]: Server is loading the model, waiting for it to become ready...")
+                self.server_waiting = True
+            elif msg == "QUEUED":
+                wait = message.get("estimated_wait")
+                eta = f", about {wait:.0f}s" if wait is not None else ""
+                print(f"[INFO]: Server is busy, queued at position {message.get('position')}{eta}...")
+                self.server_waiting = True
+            elif msg == "SESSION_CONFIG":
+                self.audio_encoding = message.get("audio_encoding", "float32")
+            elif msg == "SERVER_READY":
+                # Older servers don't acknowledge deltas and keep resending the last N segments
+                self.use_deltas = message.get("delta_segments", 0) >= 1
+                print(f"[INFO]: Server session ready (backend: {message.get('backend')}, deltas: {self.use_deltas})")
+                self.server_waiting = False
+                self.ready.set()
+            elif msg == "RESUMABLE":
+                self.resume_token = message.get("resume_token")
+            elif msg == "SESSION_RESUMED":
+                self._session_resumed(message)
+            elif msg == "RESUMED":
+                self.store.clear()
+            elif msg == "DISCONNECT":
+                print("[INFO]: Server closed the session.")
+                return
+            elif "delta" in message:
+                self._deliver(self.store.apply(message["delta"]))
+            elif "segments" in message:
+                self._deliver(message["segments"])
+
+    def _session_resumed(self, message):
+        self.resuming = False
+        self.audio_encoding = message.get("audio_encoding", "float32")
+        if "seq" in message:
+            self.store.seq = message["seq"]
+        print(f"[INFO]: Server session resumed ({message.get('audio_offset', 0.0):.1f}s of audio received)")
+        # Settled before ready is set, so a resume() waiting for it can't race with this
+        if self.interrupted:
+            self._continue_streaming()
+        elif not self.dictating and not message.get("paused"):
+            # Dictation was stopped while the connection was down
+            self._send(json.dumps({"control": "pause"}))
+        self.ready.set()
+
+    def _continue_streaming(self):
+        self.interrupted = False
+        if self.armed:
+            # What the microphone captured while the connection was down is sent first
+            with self.capture_lock:
+                for data in self.preroll:
+                    self._send_audio(data)
+                self.preroll.clear()
+                self.streaming = True
+            return
+        if self.mic_thread:
+            self.mic_thread.join(timeout=1.0)
+        self.streaming = True
+        self.mic_thread = threading.Thread(target=self._stream_microphone, daemon=True)
+        self.mic_thread.start()
+
+    def _deliver(self, segments):
+        # The callback only gets the segments: joining the whole transcript on every update would
+        # cost as much as the full segment lists the delta protocol avoids
+        try:
+            self.transcription_callback(segments)
+        except Exception as ex:
+            print(f"[ERROR]: Transcription callback failed: {ex}")
+
+    def _send(self, payload, binary=False):
+        opcode = websocket.ABNF.OPCODE_BINARY if binary else websocket.ABNF.OPCODE_TEXT
+        with self.send_lock:
+            self.ws.send(payload, opcode)
+
+    def resume(self):
+        if not self.ready.wait(self.LOADING_TIMEOUT if self.server_waiting else self.READY_TIMEOUT):
+            raise RuntimeError("Transcription server is not ready")
+        if self.armed:
+            with self.capture_lock:
+                self._send(json.dumps({"control": "resume"}))
+                for data in self.preroll:
+                    self._send_audio(data)
+                self.preroll.clear()
+                self.streaming = True
+            self.dictating = True
+            return
+        self._send(json.dumps({"control": "resume"}))
+        self.streaming = True
+        self.dictating = True
+        self.mic_thread = threading.Thread(target=self._stream_microphone, daemon=True)
+        self.mic_thread.start()
+
+    def pause(self):
+        self.dictating = False
+        self.interrupted = False
+        if self.armed:
+            with self.capture_lock:
+                self.streaming = False
+        else:
+            self.streaming = False
+            if self.mic_thread:
+                self.mic_thread.join(timeout=1.0)
+                self.mic_thread = None
+        if self.ready.is_set():
+            try:
+                self._send(json.dumps({"control": "pause"}))
+            except Exception as ex:
+                print(f"[WARN]: Failed to pause server session: {ex}")
+
+    def prepare_audio(self):
+        # Initializing PortAudio probes all devices, which is slow enough to delay the first words
+        with self.audio_lock:
+            if self.audio is None:
+                self.audio = pyaudio.PyAudio()
+        return self.audio
+
+    def arm(self):
+        # Opens the microphone now and keeps it open while paused; needs a pre-roll length
+        if self.preroll is None or self.armed:
+            return
+        self.armed = True
+        self.mic_thread = threading.Thread(target=self._stream_microphone, daemon=True)
+        self.mic_thread.start()
+
+    def _send_audio(self, data):
+        if self.audio_encoding != "int16":
+            data = (np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0).tobytes()
+        self._send(data, binary=True)
+
+    def _stream_microphone(self):
+        try:
+            stream = self.prepare_audio().open(format=pyaudio.paInt16, channels=1, rate=self.RATE,
+                                               input=True, frames_per_buffer=self.CHUNK)
+        except Exception as ex:
+            print(f"[ERROR]: Failed to open the microphone: {ex}")
+            self.armed = False
+            return
+        try:
+            # Idle (armed) reads block on the device, so keeping it open costs next to no CPU
+            while self.streaming or self.armed:
+                data = stream.read(self.CHUNK, exception_on_overflow=False)
+                with self.capture_lock:
+                    if not self.streaming:
+                        if self.preroll is not None:
+                            self.preroll.append(data)
+                        continue
+                    try:
+                        self._send_audio(data)
+                    except Exception as ex:
+                        if not self.armed:
+                            raise
+                        print(f"[ERROR]: Audio streaming stopped: {ex}")
+                        self.streaming = False
+        except Exception as ex:
+            print(f"[ERROR]: Microphone streaming stopped: {ex}")
+        finally:
+            self.armed = False
+            stream.stop_stream()
+            stream.close()
+
+    def set_language(self, lang):
+        # The language is part of the options handshake, so the session is re-established with it
+        self.lang = lang
+        self.resume_token = None
+        self.ready.clear()
+        self.reconnect_now = True
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+
+    def close(self):
+        self.closed = True
+        # Lets the capture thread finish so pause() can join it
+        self.armed = False
+        self.pause()
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+
+
+class ControlServer:
+    """
+    Local control socket of the always-on client.
+
+    Each connection sends one command line and gets one JSON line back. The socket is only
+    accessible to the current user and replaces the PID file and SIGUSR1 signal, so the hotkey
+    script can toggle dictation and query its state without touching the process directly.
+    """
+
+    def __init__(self, path, handler):
+        """
+        Args:
+            path (str): Path of the Unix socket.
+            handler (callable): Called with each command line, returns the reply dict.
+        """
+        self.path = path
+        self.handler = handler
+        self.sock = None
+
+    def start(self):
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                os.remove(self.path)  # Stale socket of a client that didn't exit cleanly
+            else:
+                raise RuntimeError(f"Another dictation client is already listening on {self.path}")
+            finally:
+                probe.close()
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            self.sock.bind(self.path)
+        finally:
+            os.umask(old_umask)
+        self.sock.listen(8)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return  # Socket closed
+            with conn:
+                try:
+                    conn.settimeout(1.0)
+                    line = conn.makefile("rb").readline().decode(errors="replace").strip()
+                    if not line:
+                        continue  # Liveness probe of another client
+                    try:
+                        reply = self.handler(line)
+                    except Exception as ex:
+                        reply = {"ok": False, "error": str(ex)}
+                    conn.sendall(json.dumps(reply, ensure_ascii=False).encode() + b"\n")
+                except OSError as ex:
+                    print(f"[WARN]: Control connection failed: {ex}")
+
+    def close(self):
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class DictationManager:
+    def __init__(self, keep_alive=True, key_rate=2000, direct_type_max=0, preroll_ms=0):
+        self.typist = GNOMELiveTypist(events_per_second=key_rate, direct_type_max=direct_type_max)
         self.recording_active = False
         self.client = None
         self.client_thread = None
         self.current_lang = "ru" # Default to Russian
+        self.quit_event = threading.Event()
+        self.control = ControlServer(control_socket_path(), self.handle_command)
+
+        # Long-lived server session reused across toggles
+        self.session = None
+        if keep_alive:
+            self.session = ServerSession("localhost", 9099, self.current_lang, "turbo",
+                                         self.typist.on_transcription, preroll_seconds=preroll_ms / 1000)
+        elif preroll_ms > 0:
+            print("[WARN]: --preroll-ms needs the keep-alive session and is ignored with --no-keep-alive")
         
+        # The tray icon is created by the background loader
+        self.icon = None
+        self.img_idle = None
+        self.img_active = None
+
+    def _load_in_background(self):
+        load_deferred_modules([np, pyaudio, websocket, pyperclip, pystray, Image, ImageDraw]
+                              + ([] if self.session else [whisper_client]))
+        self.typist.clipboard  # Connects the clipboard ahead of the first paste
+        if self.session:
+            try:
+                self.session.prepare_audio()
+            except Exception as ex:
+                print(f"[WARN]: Audio initialization failed: {ex}")
+            else:
+                self.session.arm()
+
         # Create icons programmatically - simple solid circles
         self.img_idle = self._create_simple_circle("grey")
         self.img_active = self._create_simple_circle("#ff0000")
 
         # Menu is removed as requested due to glitches in the environment
-        self.icon = pystray.Icon("whisper_live", self.img_idle, "Whisper Dictation")
-        
+        self.icon = pystray.Icon("whisper_live", self._current_image(), "Whisper Dictation")
+        self.icon.run()
+
+    def _current_image(self):
+        return self.img_active if self.recording_active else self.img_idle
+
+    def _update_icon(self):
+        if self.icon is not None:
+            self.icon.icon = self._current_image()
+
     def _create_simple_circle(self, color):
         width, height = 64, 64
         image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
@@ -225,23 +963,83 @@ class DictationManager:
         draw.ellipse(box, fill=color)
         return image
 
-    def toggle(self, signum=None, frame=None):
-        # This is the signal handler for SIGUSR1
+    def toggle(self):
         if self.recording_active:
             self.stop_recording()
         else:
             self.start_recording()
 
+    def handle_command(self, line):
+        """
+        Handles one control socket command.
+
+        Args:
+            line (str): ``toggle``, ``start``, ``stop``, ``status``, ``lang <code>`` or ``quit``.
+
+        Returns:
+            dict: ``ok`` and the state after the command, or ``ok=False`` and an ``error``.
+        """
+        command, _, arg = line.partition(" ")
+        if command == "toggle":
+            self.toggle()
+        elif command == "start":
+            self.start_recording()
+        elif command == "stop":
+            self.stop_recording()
+        elif command == "lang":
+            if not arg.strip():
+                return {"ok": False, "error": "Usage: lang <code>"}
+            self.set_language(arg.strip())
+        elif command == "quit":
+            self.quit_event.set()
+        elif command != "status":
+            return {"ok": False, "error": f"Unknown command {command!r}"}
+        return dict(ok=True, **self.status())
+
+    def status(self):
+        return {
+            "recording": self.recording_active,
+            "lang": self.current_lang,
+            "connected": self.session.ready.is_set() if self.session else None,
+            "server_waiting": self.session.server_waiting if self.session else None,
+            "keep_alive": self.session is not None,
+            "pid": os.getpid(),
+        }
+
+    def set_language(self, lang):
+        if lang == self.current_lang:
+            return
+        was_recording = self.recording_active
+        self.stop_recording()
+        print(f"[INFO]: Switching language to {lang}")
+        self.current_lang = lang
+        if self.session:
+            self.session.set_language(lang)
+        if was_recording:
+            self.start_recording()
+
     def start_recording(self):
         if self.recording_active: return
         print(f"[INFO]: Recording started (Lang: {self.current_lang})...")
         self.recording_active = True
-        self.icon.icon = self.img_active
+        self._update_icon()
         
-        self.typist.currently_typed = ""
-        self.typist.last_locked_time = 0
-        
-        self.client = TranscriptionClient(
+        self.typist.reset()
+
+        if self.session:
+            def resume():
+                try:
+                    self.session.resume()
+                except Exception as e:
+                    print(f"[ERROR] Resume session: {e}")
+                    self.recording_active = False
+                    self._update_icon()
+
+            self.client_thread = threading.Thread(target=resume, daemon=True)
+            self.client_thread.start()
+            return
+
+        self.client = whisper_client.TranscriptionClient(
             "localhost", 9099,
             lang=self.current_lang, model="turbo",
             transcription_callback=self.typist.on_transcription,
@@ -255,7 +1053,7 @@ class DictationManager:
             except Exception as e:
                 print(f"[ERROR] Client thread: {e}")
                 self.recording_active = False
-                self.icon.icon = self.img_idle
+                self._update_icon()
 
         self.client_thread = threading.Thread(target=run, daemon=True)
         self.client_thread.start()
@@ -264,37 +1062,72 @@ class DictationManager:
         if not self.recording_active: return
         print("[INFO]: Recording stopped.")
         self.recording_active = False
-        self.icon.icon = self.img_idle
-        if self.client and hasattr(self.client, 'client'):
+        self._update_icon()
+        if self.session:
+            threading.Thread(target=self.session.pause, daemon=True).start()
+        elif self.client and hasattr(self.client, 'client'):
             self.client.client.recording = False
 
     def run(self):
         # Register signals
-        signal.signal(signal.SIGUSR1, self.toggle)
         signal.signal(signal.SIGINT, self.cleanup)
         signal.signal(signal.SIGTERM, self.cleanup)
+
+        self.control.start()
+        print(f"[INFO]: Always-on client is running. Control socket: {self.control.path}, Lang: {self.current_lang}")
+
+        if self.session:
+            self.session.start()
         
-        print(f"[INFO]: Always-on client is running. PID: {os.getpid()}, Lang: {self.current_lang}")
-        
-        # Start icon in a separate thread
-        icon_thread = threading.Thread(target=self.icon.run, daemon=True)
-        icon_thread.start()
+        # Load the remaining dependencies and run the tray icon in a separate thread
+        threading.Thread(target=self._load_in_background, daemon=True).start()
         
-        # Keep the main thread alive to handle signals
-        while True:
-            time.sleep(0.5)
+        # Keep the main thread alive to handle signals until a quit command arrives
+        while not self.quit_event.wait(0.5):
+            pass
+        self.cleanup()
 
     def cleanup(self, signum=None, frame=None):
         print("\n[INFO]: Cleaning up...")
         self.stop_recording()
-        self.icon.stop()
-        PID_FILE = "/tmp/whisper_dictation.pid"
-        if os.path.exists(PID_FILE):
-            os.remove(PID_FILE)
+        if self.session:
+            self.session.close()
+        if self.icon is not None:
+            self.icon.stop()
+        self.control.close()
         sys.exit(0)
 
 def main():
-    manager = DictationManager()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--no-keep-alive',
+                        action='store_true',
+                        help='Open a new server connection on every toggle instead of keeping one session warm.')
+    parser.add_argument('--key-rate',
+                        type=int,
+                        default=2000,
+                        help='Maximum key events per second sent by the virtual keyboard when correcting text.')
+    parser.add_argument('--direct-type-max',
+                        type=int,
+                        default=0,
+                        help='Type ASCII additions up to this many characters as key presses instead of pasting. '
+                             'Only for a US layout: other layouts (e.g. Russian) turn the keys into other '
+                             'characters. Defaults to 0 (always paste).')
+    parser.add_argument('--preroll-ms',
+                        type=int,
+                        default=0,
+                        help='Keep the microphone open while idle and send the last N ms of audio when dictation '
+                             'starts, so the first syllables are not clipped (e.g. 500; 0 disables).')
+    parser.add_argument('--import-report',
+                        action='store_true',
+                        help='Print the import time of each module loaded at startup and in the background, then exit.')
+    args = parser.parse_args()
+
+    if args.import_report:
+        print_import_report()
+        return
+
+    manager = DictationManager(keep_alive=not args.no_keep_alive, key_rate=args.key_rate,
+                               direct_type_max=args.direct_type_max, preroll_ms=args.preroll_ms)
     manager.run()
 
 if __name__ == "__main__":
@@ -1,24 +1,19 @@
 #!/bin/bash
 # Script to stop the always-on dictation client
 
-PID_FILE="/tmp/whisper_dictation.pid"
+DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 
-if [ -f "$PID_FILE" ]; then
-    PID=$(cat "$PID_FILE")
-    if ps -p $PID > /dev/null; then
-        echo "Stopping dictation client (PID: $PID)..."
-        kill $PID
-        # Wait a bit for graceful cleanup
-        sleep 1
-        # If still running, force kill
-        if ps -p $PID > /dev/null; then
-            kill -9 $PID
-        fi
-    fi
-    rm -f "$PID_FILE"
-else
-    echo "PID file not found. Trying to kill by process name..."
+if python3 -S "$DIR/dictation_ctl.py" quit > /dev/null; then
+    echo "Stopping dictation client..."
+    # Wait a bit for graceful cleanup
+    sleep 1
+fi
+
+# Clients that don't answer on the control socket are stopped by process name
+if pgrep -f gnome_dictation_client.py > /dev/null; then
     pkill -f gnome_dictation_client.py
+    sleep 1
+    pkill -9 -f gnome_dictation_client.py
 fi
 
 echo "Dictation client stopped."
@@ -3,26 +3,20 @@
 
 DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 CLIENT_SCRIPT="$DIR/gnome_dictation_client.py"
-PID_FILE="/tmp/whisper_dictation.pid"
 LOG_FILE="/tmp/whisper_dictation.log"
 
-if [ -f "$PID_FILE" ]; then
-    PID=$(cat "$PID_FILE")
-    if ps -p $PID > /dev/null; then
-        echo "Toggling dictation (SIGUSR1 to PID: $PID)..."
-        kill -USR1 $PID
-        exit 0
-    else
-        rm "$PID_FILE"
-    fi
+# Ask the running client over its control socket; the system interpreter without site
+# packages starts fastest, the client doesn't need the venv for this. Failures (e.g. a client
+# that doesn't answer) are appended to the client's log, as a hotkey has no terminal.
+python3 -S "$DIR/dictation_ctl.py" toggle 2>>"$LOG_FILE"
+if [ $? -ne 2 ]; then
+    exit 0
 fi
 
 echo "Starting always-on dictation client (logs in $LOG_FILE)..."
-# Set up environment
-export LD_LIBRARY_PATH=$(find "$DIR/venv" -name "lib" -type d | tr '\n' ':')
+# The client doesn't load CUDA, so the venv is all it needs (no LD_LIBRARY_PATH scan of the venv)
 source "$DIR/venv/bin/activate"
 
 # Start client in background and log outputs
 # It will start in 'idle' mode by default
 python3 "$CLIENT_SCRIPT" > "$LOG_FILE" 2>&1 &
-echo $! > "$PID_FILE"